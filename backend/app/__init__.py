@@ -0,0 +1,6 @@
+import pandas as pd
+
+
+# The web API shares one PlantData between concurrent analyses, which read the data through
+# ``PlantData.view`` without copying it when pandas' copy-on-write mode is enabled
+pd.set_option("mode.copy_on_write", True)
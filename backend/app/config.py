@@ -13,6 +13,26 @@ class Settings:
     data_path: str = os.getenv("OPENOA_DATA_PATH", "examples/data/la_haute_borne")
     scada_max_points: int = int(os.getenv("OPENOA_SCADA_MAX_POINTS", "5000"))
     default_aep_num_sim: int = int(os.getenv("OPENOA_DEFAULT_AEP_NUM_SIM", "60"))
+    analysis_workers: int = int(os.getenv("OPENOA_ANALYSIS_WORKERS", "0"))
+    job_concurrency: int = int(os.getenv("OPENOA_JOB_CONCURRENCY", "2"))
+    job_queue_size: int = int(os.getenv("OPENOA_JOB_QUEUE_SIZE", "16"))
+    job_ttl_seconds: int = int(os.getenv("OPENOA_JOB_TTL_SECONDS", "3600"))
+    compact_data: bool = os.getenv("OPENOA_COMPACT_DATA", "false").lower() in ("1", "true", "yes")
+    plant_snapshot_path: str = os.getenv("OPENOA_PLANT_SNAPSHOT_PATH", "")
+    power_curve_cache_path: str = os.getenv(
+        "OPENOA_POWER_CURVE_CACHE_PATH", ".openoa_cache/power_curves"
+    )
+    power_curve_cache_max_entries: int = int(
+        os.getenv("OPENOA_POWER_CURVE_CACHE_MAX_ENTRIES", "1000")
+    )
+    result_cache_path: str = os.getenv("OPENOA_RESULT_CACHE_PATH", ".openoa_cache/results")
+    result_cache_memory_bytes: int = int(
+        os.getenv("OPENOA_RESULT_CACHE_MEMORY_BYTES", str(256 * 2**20))
+    )
+    result_cache_disk_bytes: int = int(os.getenv("OPENOA_RESULT_CACHE_DISK_BYTES", str(2 * 2**30)))
+    result_cache_ttl_seconds: int = int(
+        os.getenv("OPENOA_RESULT_CACHE_TTL_SECONDS", str(7 * 24 * 3600))
+    )
 
     @property
     def cors_origins(self) -> list[str]:
@@ -20,10 +40,25 @@ class Settings:
         return values or ["*"]
 
     def resolve_data_path(self, repo_root: Path) -> Path:
-        data_path = Path(self.data_path)
-        if data_path.is_absolute():
-            return data_path
-        return (repo_root / data_path).resolve()
+        return self._resolve_path(self.data_path, repo_root)
+
+    def resolve_plant_snapshot_path(self, repo_root: Path) -> Path | None:
+        if not self.plant_snapshot_path:
+            return None
+        return self._resolve_path(self.plant_snapshot_path, repo_root)
+
+    def resolve_power_curve_cache_path(self, repo_root: Path) -> Path:
+        return self._resolve_path(self.power_curve_cache_path, repo_root)
+
+    def resolve_result_cache_path(self, repo_root: Path) -> Path:
+        return self._resolve_path(self.result_cache_path, repo_root)
+
+    @staticmethod
+    def _resolve_path(path: str, repo_root: Path) -> Path:
+        resolved = Path(path)
+        if resolved.is_absolute():
+            return resolved
+        return (repo_root / resolved).resolve()
 
 
 settings = Settings()
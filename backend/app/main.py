@@ -10,17 +10,25 @@ from backend.app.config import settings
 from backend.app.routers.analysis import router as analysis_router
 from backend.app.routers.data import router as data_router
 from backend.app.routers.plant import router as plant_router
+from backend.app.services.analysis_runner import shutdown_jobs
 from backend.app.services.plant_loader import is_plant_loaded, load_plant
+from backend.app.services.scada_pyramid import get_scada_pyramid
+from backend.app.services.wind_rose_cube import get_wind_rose_cube
+from backend.app.services.worker_pool import shutdown_worker_pool
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     try:
         await asyncio.to_thread(load_plant)
+        await asyncio.to_thread(get_scada_pyramid)
+        await asyncio.to_thread(get_wind_rose_cube)
     except Exception:
         # App still starts, /api/health will report plant_loaded=false and endpoint errors carry detail.
         pass
     yield
+    shutdown_jobs()
+    shutdown_worker_pool()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Literal
+
+import numpy as np
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+
+# "json" returns one object per point, "columnar" returns parallel arrays of each field, and
+# "arrow" returns the parallel arrays as an Apache Arrow IPC stream
+ResponseFormat = Literal["json", "columnar", "arrow"]
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class ColumnarResponse(Response):
+    """JSON response serialized with orjson, which writes NumPy arrays directly, including NaN and
+    infinite values as null and datetime64 values as ISO 8601 strings."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _contiguous(columns: dict[str, Any]) -> dict[str, Any]:
+    # orjson only serializes C-contiguous arrays, and slicing with a step returns views
+    return {
+        name: np.ascontiguousarray(values) if isinstance(values, np.ndarray) else values
+        for name, values in columns.items()
+    }
+
+
+def columnar_response(columns: dict[str, Any], **metadata: Any) -> ColumnarResponse:
+    """Returns ``{**metadata, "columns": columns}`` as JSON, where ``columns`` maps each field to
+    an array of its values."""
+    return ColumnarResponse({**metadata, "columns": _contiguous(columns)})
+
+
+def arrow_response(columns: dict[str, np.ndarray], **metadata: Any) -> Response:
+    """Returns ``columns`` as an Apache Arrow IPC stream of a single table, with ``metadata`` as
+    JSON-encoded values in the schema metadata. NaN values are written as nulls."""
+    try:
+        import pyarrow as pa
+    except ModuleNotFoundError:
+        raise HTTPException(
+            status_code=501,
+            detail="The arrow format requires the pyarrow package, use format=columnar instead",
+        )
+
+    table = pa.table({name: pa.array(values, from_pandas=True) for name, values in columns.items()})
+    table = table.replace_schema_metadata({key: json.dumps(val) for key, val in metadata.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(sink.getvalue().to_pybytes(), media_type=ARROW_MEDIA_TYPE)
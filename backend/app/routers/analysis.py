@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import math
+import time
 from datetime import datetime
+from functools import partial
+from typing import AsyncIterator, Callable, Literal
 
 import numpy as np
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
 from openoa.analysis.aep import MonteCarloAEP
 from openoa.analysis.electrical_losses import ElectricalLosses
 from openoa.analysis.wake_losses import WakeLosses
 from openoa.analysis.yaw_misalignment import StaticYawMisalignment
-from openoa.utils.power_curve import functions as power_curve
+from openoa.utils.power_curve import compile_power_curve
 
 from backend.app.config import settings
+from backend.app.responses import ColumnarResponse
 from backend.app.schemas import (
     AEPRequest,
     AEPResult,
@@ -19,9 +26,12 @@ from backend.app.schemas import (
     AEPTaskResponse,
     ElectricalLossRequest,
     ElectricalLossResponse,
+    JobStatusResponse,
+    PowerCurveColumnarResponse,
     PowerCurveRequest,
     PowerCurveResponse,
     PowerCurveStats,
+    ResultCacheStatsResponse,
     ScatterPoint,
     WakeLossRequest,
     WakeLossResponse,
@@ -29,13 +39,29 @@ from backend.app.schemas import (
     YawMisalignmentResponse,
     YawTurbineResult,
     CurvePoint,
+    CurveColumns,
 )
-from backend.app.services.analysis_runner import get_aep_task, run_cached, submit_aep_task
+from backend.app.services.analysis_runner import (
+    JobQueueFull,
+    Progress,
+    cancel_job,
+    get_cache_stats,
+    get_job,
+    run_cached,
+    submit_job,
+)
+from backend.app.services.downsampling import DownsampleMethod, downsample_indices
 from backend.app.services.plant_loader import get_plant
+from backend.app.services.power_curve_registry import get_power_curve_registry
+from backend.app.services.worker_pool import run_analysis
 
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
 
+_FINISHED_JOB_STATUSES = {"completed", "failed", "cancelled"}
+_JOB_EVENT_INTERVAL_SECONDS = 0.5
+_JOB_EVENT_KEEPALIVE_SECONDS = 15.0
+
 
 def _finite_float(value: float | int | None) -> float | None:
     if value is None:
@@ -50,241 +76,312 @@ def _safe_numeric(value: float | int | None, default: float = 0.0) -> float:
     return default if checked is None else checked
 
 
-def _downsample_pairs(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
-    if len(x) <= max_points:
-        return x, y
-    idx = np.linspace(0, len(x) - 1, max_points).astype(int)
+def _downsample_pairs(
+    x: np.ndarray, y: np.ndarray, max_points: int, method: DownsampleMethod = "stride"
+) -> tuple[np.ndarray, np.ndarray]:
+    # The points are selected along the time series of y, which keeps trips and curtailment
+    idx = downsample_indices(np.arange(len(y)), y, max_points, method)
     return x[idx], y[idx]
 
 
+def _compute_power_curve(
+    request: PowerCurveRequest, progress: Progress | None = None
+) -> PowerCurveColumnarResponse:
+    # Fitting a single curve has no iterations, so no progress is reported
+    plant = get_plant()
+    turb = plant.turbine_df(request.turbine_id)[["WMET_HorWdSpd", "WTUR_W"]].dropna().copy()
+    turb = turb[(turb["WMET_HorWdSpd"] >= 0) & (turb["WMET_HorWdSpd"] <= 35)]
+
+    if turb.empty:
+        raise HTTPException(status_code=404, detail="No SCADA data available for this turbine")
+
+    ws = turb["WMET_HorWdSpd"].to_numpy()
+    pwr = turb["WTUR_W"].to_numpy()
+
+    # Reuse a previously fitted curve when this turbine's data has not changed
+    registry = get_power_curve_registry()
+    if request.method == "IEC":
+        curve_fn = registry.get_or_fit(request.turbine_id, "IEC", ws, pwr, interpolate=True)
+    elif request.method == "logistic_5":
+        curve_fn = registry.get_or_fit(request.turbine_id, "logistic_5_parametric", ws, pwr)
+    else:
+        curve_fn = registry.get_or_fit(request.turbine_id, "gam", ws, pwr)
+
+    # Tabulate the fitted curve once, since it is evaluated for every SCADA sample below
+    curve_fn = compile_power_curve(curve_fn, ws_min=0.0, ws_max=25.0, resolution=0.01)
+
+    ws_grid = np.linspace(0.0, 25.0, 120)
+    curve_power = np.asarray(curve_fn(ws_grid), dtype=float)
+
+    pred = np.asarray(curve_fn(ws), dtype=float)
+    resid = pwr - pred
+    rmse = float(np.sqrt(np.nanmean(np.square(resid))))
+
+    y_var = np.nansum(np.square(pwr - np.nanmean(pwr)))
+    r2 = float(1 - (np.nansum(np.square(resid)) / y_var)) if y_var > 0 else 0.0
+
+    ws_scatter, pwr_scatter = _downsample_pairs(ws, pwr, 2500, request.downsample)
+
+    return PowerCurveColumnarResponse(
+        turbine_id=request.turbine_id,
+        method=request.method,
+        curve=CurveColumns(wind_speed_ms=ws_grid.tolist(), power_kw=curve_power.tolist()),
+        scatter=CurveColumns(
+            wind_speed_ms=ws_scatter.astype(float).tolist(),
+            power_kw=pwr_scatter.astype(float).tolist(),
+        ),
+        stats=PowerCurveStats(r2=r2, rmse_kw=rmse, n_samples=int(len(turb))),
+    )
+
+
+def _power_curve_points(result: PowerCurveColumnarResponse) -> PowerCurveResponse:
+    return PowerCurveResponse(
+        turbine_id=result.turbine_id,
+        method=result.method,
+        curve=[
+            CurvePoint(wind_speed_ms=w, power_kw=p)
+            for w, p in zip(result.curve.wind_speed_ms, result.curve.power_kw, strict=True)
+        ],
+        scatter=[
+            ScatterPoint(wind_speed_ms=w, power_kw=p)
+            for w, p in zip(result.scatter.wind_speed_ms, result.scatter.power_kw, strict=True)
+        ],
+        stats=result.stats,
+    )
+
+
 @router.post("/power-curve", response_model=PowerCurveResponse)
-def run_power_curve_analysis(request: PowerCurveRequest) -> PowerCurveResponse:
+def run_power_curve_analysis(
+    request: PowerCurveRequest,
+    format: Literal["json", "columnar"] = Query(default="json"),
+) -> PowerCurveResponse | Response:
     plant = get_plant()
     turbine_ids = set(plant.turbine_ids)
     if request.turbine_id not in turbine_ids:
         raise HTTPException(status_code=404, detail=f"Unknown turbine_id: {request.turbine_id}")
 
     params = request.model_dump()
-
-    def _compute() -> PowerCurveResponse:
-        turb = plant.turbine_df(request.turbine_id)[["WMET_HorWdSpd", "WTUR_W"]].dropna().copy()
-        turb = turb[(turb["WMET_HorWdSpd"] >= 0) & (turb["WMET_HorWdSpd"] <= 35)]
-
-        if turb.empty:
-            raise HTTPException(status_code=404, detail="No SCADA data available for this turbine")
-
-        ws = turb["WMET_HorWdSpd"].to_numpy()
-        pwr = turb["WTUR_W"].to_numpy()
-
-        if request.method == "IEC":
-            curve_fn = power_curve.IEC(turb["WMET_HorWdSpd"], turb["WTUR_W"], interpolate=True)
-        elif request.method == "logistic_5":
-            curve_fn = power_curve.logistic_5_parametric(turb["WMET_HorWdSpd"], turb["WTUR_W"])
-        else:
-            curve_fn = power_curve.gam(turb["WMET_HorWdSpd"], turb["WTUR_W"])
-
-        ws_grid = np.linspace(0.0, 25.0, 120)
-        curve_power = np.asarray(curve_fn(ws_grid), dtype=float)
-
-        pred = np.asarray(curve_fn(ws), dtype=float)
-        resid = pwr - pred
-        rmse = float(np.sqrt(np.nanmean(np.square(resid))))
-
-        y_var = np.nansum(np.square(pwr - np.nanmean(pwr)))
-        r2 = float(1 - (np.nansum(np.square(resid)) / y_var)) if y_var > 0 else 0.0
-
-        ws_scatter, pwr_scatter = _downsample_pairs(ws, pwr, max_points=2500)
-
-        return PowerCurveResponse(
-            turbine_id=request.turbine_id,
-            method=request.method,
-            curve=[
-                CurvePoint(wind_speed_ms=float(w), power_kw=float(p))
-                for w, p in zip(ws_grid, curve_power, strict=False)
-            ],
-            scatter=[
-                ScatterPoint(wind_speed_ms=float(w), power_kw=float(p))
-                for w, p in zip(ws_scatter, pwr_scatter, strict=False)
-            ],
-            stats=PowerCurveStats(r2=r2, rmse_kw=rmse, n_samples=int(len(turb))),
-        )
+    compute = partial(run_analysis, _compute_power_curve, request)
 
     try:
-        return run_cached("power_curve", params, _compute)
+        result = run_cached("power_curve_columns", params, compute)
     except HTTPException:
         raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Power curve analysis failed: {exc}") from exc
 
+    if format == "columnar":
+        return ColumnarResponse(result.model_dump())
+    return _power_curve_points(result)
 
-@router.post("/electrical-losses", response_model=ElectricalLossResponse)
-def run_electrical_losses(request: ElectricalLossRequest) -> ElectricalLossResponse:
-    plant = get_plant()
-    params = request.model_dump()
 
-    def _compute() -> ElectricalLossResponse:
-        num_sim = request.num_sim if request.uncertainty else 1
-        analysis = ElectricalLosses(plant=plant, UQ=request.uncertainty, num_sim=num_sim)
-        analysis.run(num_sim=num_sim)
+def _compute_electrical_losses(
+    request: ElectricalLossRequest, progress: Progress | None = None
+) -> ElectricalLossResponse:
+    plant = get_plant()
+    num_sim = request.num_sim if request.uncertainty else 1
+    analysis = ElectricalLosses(plant=plant, UQ=request.uncertainty, num_sim=num_sim)
+    if progress is not None:
+        progress.start(num_sim)
+    analysis.run(num_sim=num_sim, callback=progress)
+
+    losses = np.asarray(analysis.electrical_losses, dtype=float).flatten() * 100.0
+
+    return ElectricalLossResponse(
+        loss_pct=float(np.nanmean(losses)),
+        loss_p05_pct=float(np.nanpercentile(losses, 5)),
+        loss_p95_pct=float(np.nanpercentile(losses, 95)),
+        turbine_energy_kwh=float(analysis.total_turbine_energy),
+        meter_energy_kwh=float(analysis.total_meter_energy),
+    )
 
-        losses = np.asarray(analysis.electrical_losses, dtype=float).flatten() * 100.0
 
-        return ElectricalLossResponse(
-            loss_pct=float(np.nanmean(losses)),
-            loss_p05_pct=float(np.nanpercentile(losses, 5)),
-            loss_p95_pct=float(np.nanpercentile(losses, 95)),
-            turbine_energy_kwh=float(analysis.total_turbine_energy),
-            meter_energy_kwh=float(analysis.total_meter_energy),
-        )
+@router.post("/electrical-losses", response_model=ElectricalLossResponse)
+def run_electrical_losses(request: ElectricalLossRequest) -> ElectricalLossResponse:
+    params = request.model_dump()
+    compute = partial(run_analysis, _compute_electrical_losses, request)
 
     try:
-        return run_cached("electrical_losses", params, _compute)
+        return run_cached("electrical_losses", params, compute)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Electrical losses analysis failed: {exc}") from exc
 
 
-@router.post("/wake-losses", response_model=WakeLossResponse)
-def run_wake_losses(request: WakeLossRequest) -> WakeLossResponse:
+def _compute_wake_losses(
+    request: WakeLossRequest, progress: Progress | None = None
+) -> WakeLossResponse:
     plant = get_plant()
-    params = request.model_dump()
+    reanalysis_products = request.reanalysis_products or list(plant.reanalysis.keys())
+    num_sim = request.num_sim if request.uncertainty else 1
+
+    analysis = WakeLosses(
+        plant=plant,
+        UQ=request.uncertainty,
+        num_sim=num_sim,
+        wind_direction_data_type=request.wind_direction_data_type,
+        reanalysis_products=reanalysis_products,
+    )
+    if progress is not None:
+        progress.start(num_sim)
+    analysis.run(num_sim=num_sim, callback=progress)
+
+    if request.uncertainty:
+        por = float(np.nanmean(np.asarray(analysis.wake_losses_por)))
+        lt = float(np.nanmean(np.asarray(analysis.wake_losses_lt)))
+        turb_por_vals = np.nanmean(np.asarray(analysis.turbine_wake_losses_por), axis=0)
+        turb_lt_vals = np.nanmean(np.asarray(analysis.turbine_wake_losses_lt), axis=0)
+    else:
+        por = float(np.asarray(analysis.wake_losses_por).squeeze())
+        lt = float(np.asarray(analysis.wake_losses_lt).squeeze())
+        turb_por_vals = np.asarray(analysis.turbine_wake_losses_por).squeeze()
+        turb_lt_vals = np.asarray(analysis.turbine_wake_losses_lt).squeeze()
+
+    turbine_ids = [str(tid) for tid in analysis.turbine_ids]
+    turbine_por = {
+        turbine_id: _safe_numeric(value * 100.0)
+        for turbine_id, value in zip(turbine_ids, np.asarray(turb_por_vals), strict=False)
+    }
+    turbine_lt = {
+        turbine_id: _safe_numeric(value * 100.0)
+        for turbine_id, value in zip(turbine_ids, np.asarray(turb_lt_vals), strict=False)
+    }
+
+    return WakeLossResponse(
+        plant_wake_loss_por_pct=por * 100.0,
+        plant_wake_loss_lt_pct=lt * 100.0,
+        turbine_wake_loss_por_pct=turbine_por,
+        turbine_wake_loss_lt_pct=turbine_lt,
+    )
 
-    def _compute() -> WakeLossResponse:
-        reanalysis_products = request.reanalysis_products or list(plant.reanalysis.keys())
-        num_sim = request.num_sim if request.uncertainty else 1
 
-        analysis = WakeLosses(
-            plant=plant,
-            UQ=request.uncertainty,
-            num_sim=num_sim,
-            wind_direction_data_type=request.wind_direction_data_type,
-            reanalysis_products=reanalysis_products,
-        )
-        analysis.run(num_sim=num_sim)
-
-        if request.uncertainty:
-            por = float(np.nanmean(np.asarray(analysis.wake_losses_por)))
-            lt = float(np.nanmean(np.asarray(analysis.wake_losses_lt)))
-            turb_por_vals = np.nanmean(np.asarray(analysis.turbine_wake_losses_por), axis=0)
-            turb_lt_vals = np.nanmean(np.asarray(analysis.turbine_wake_losses_lt), axis=0)
-        else:
-            por = float(np.asarray(analysis.wake_losses_por).squeeze())
-            lt = float(np.asarray(analysis.wake_losses_lt).squeeze())
-            turb_por_vals = np.asarray(analysis.turbine_wake_losses_por).squeeze()
-            turb_lt_vals = np.asarray(analysis.turbine_wake_losses_lt).squeeze()
-
-        turbine_ids = [str(tid) for tid in analysis.turbine_ids]
-        turbine_por = {
-            turbine_id: _safe_numeric(value * 100.0)
-            for turbine_id, value in zip(turbine_ids, np.asarray(turb_por_vals), strict=False)
-        }
-        turbine_lt = {
-            turbine_id: _safe_numeric(value * 100.0)
-            for turbine_id, value in zip(turbine_ids, np.asarray(turb_lt_vals), strict=False)
-        }
-
-        return WakeLossResponse(
-            plant_wake_loss_por_pct=por * 100.0,
-            plant_wake_loss_lt_pct=lt * 100.0,
-            turbine_wake_loss_por_pct=turbine_por,
-            turbine_wake_loss_lt_pct=turbine_lt,
-        )
+@router.post("/wake-losses", response_model=WakeLossResponse)
+def run_wake_losses(request: WakeLossRequest) -> WakeLossResponse:
+    params = request.model_dump()
+    compute = partial(run_analysis, _compute_wake_losses, request)
 
     try:
-        return run_cached("wake_losses", params, _compute)
+        return run_cached("wake_losses", params, compute)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Wake losses analysis failed: {exc}") from exc
 
 
-@router.post("/yaw-misalignment", response_model=YawMisalignmentResponse)
-def run_yaw_misalignment(request: YawMisalignmentRequest) -> YawMisalignmentResponse:
+def _compute_yaw_misalignment(
+    request: YawMisalignmentRequest, progress: Progress | None = None
+) -> YawMisalignmentResponse:
     plant = get_plant()
-    params = request.model_dump()
+    num_sim = request.num_sim if request.uncertainty else 1
+    analysis = StaticYawMisalignment(
+        plant=plant,
+        turbine_ids=request.turbine_ids,
+        ws_bins=request.ws_bins,
+        UQ=request.uncertainty,
+        num_sim=num_sim,
+    )
+    if progress is not None:
+        progress.start(num_sim)
+    analysis.run(num_sim=num_sim, ws_bins=request.ws_bins, callback=progress)
+
+    turbine_ids = [str(tid) for tid in analysis.turbine_ids]
 
-    def _compute() -> YawMisalignmentResponse:
-        num_sim = request.num_sim if request.uncertainty else 1
-        analysis = StaticYawMisalignment(
-            plant=plant,
-            turbine_ids=request.turbine_ids,
-            ws_bins=request.ws_bins,
-            UQ=request.uncertainty,
-            num_sim=num_sim,
+    if request.uncertainty:
+        avg_vals = np.asarray(analysis.yaw_misalignment_avg, dtype=float)
+        ci_vals = np.asarray(analysis.yaw_misalignment_95ci, dtype=float)
+        by_ws_vals = np.asarray(analysis.yaw_misalignment_avg_ws, dtype=float)
+    else:
+        avg_vals = np.asarray(analysis.yaw_misalignment, dtype=float)
+        ci_vals = np.empty((len(turbine_ids), 2), dtype=float)
+        ci_vals[:] = np.nan
+        by_ws_vals = np.asarray(analysis.yaw_misalignment_ws, dtype=float)
+
+    turbines = [
+        YawTurbineResult(
+            turbine_id=turbine_id,
+            yaw_misalignment_deg=_safe_numeric(avg_vals[index]),
+            ci_low_deg=_finite_float(ci_vals[index, 0]),
+            ci_high_deg=_finite_float(ci_vals[index, 1]),
+            by_ws_bin_deg=[_safe_numeric(v) for v in np.asarray(by_ws_vals[index]).tolist()],
         )
-        analysis.run(num_sim=num_sim, ws_bins=request.ws_bins)
-
-        turbine_ids = [str(tid) for tid in analysis.turbine_ids]
-
-        if request.uncertainty:
-            avg_vals = np.asarray(analysis.yaw_misalignment_avg, dtype=float)
-            ci_vals = np.asarray(analysis.yaw_misalignment_95ci, dtype=float)
-            by_ws_vals = np.asarray(analysis.yaw_misalignment_avg_ws, dtype=float)
-        else:
-            avg_vals = np.asarray(analysis.yaw_misalignment, dtype=float)
-            ci_vals = np.empty((len(turbine_ids), 2), dtype=float)
-            ci_vals[:] = np.nan
-            by_ws_vals = np.asarray(analysis.yaw_misalignment_ws, dtype=float)
-
-        turbines = [
-            YawTurbineResult(
-                turbine_id=turbine_id,
-                yaw_misalignment_deg=_safe_numeric(avg_vals[index]),
-                ci_low_deg=_finite_float(ci_vals[index, 0]),
-                ci_high_deg=_finite_float(ci_vals[index, 1]),
-                by_ws_bin_deg=[_safe_numeric(v) for v in np.asarray(by_ws_vals[index]).tolist()],
-            )
-            for index, turbine_id in enumerate(turbine_ids)
-        ]
-
-        return YawMisalignmentResponse(ws_bins=request.ws_bins, turbines=turbines)
+        for index, turbine_id in enumerate(turbine_ids)
+    ]
+
+    return YawMisalignmentResponse(ws_bins=request.ws_bins, turbines=turbines)
+
+
+@router.post("/yaw-misalignment", response_model=YawMisalignmentResponse)
+def run_yaw_misalignment(request: YawMisalignmentRequest) -> YawMisalignmentResponse:
+    params = request.model_dump()
+    compute = partial(run_analysis, _compute_yaw_misalignment, request)
 
     try:
-        return run_cached("yaw_misalignment", params, _compute)
+        return run_cached("yaw_misalignment", params, compute)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Yaw misalignment analysis failed: {exc}") from exc
 
 
-@router.post("/aep", response_model=AEPTaskResponse)
-async def submit_aep(request: AEPRequest) -> AEPTaskResponse:
+def _compute_aep(request: AEPRequest, progress: Progress | None = None) -> AEPResult:
     plant = get_plant()
+    reanalysis_products = request.reanalysis_products or list(plant.reanalysis.keys())
+
+    analysis = MonteCarloAEP(
+        plant=plant,
+        reanalysis_products=reanalysis_products,
+        reg_model=request.reg_model,
+        time_resolution=request.time_resolution,
+        reg_temperature=request.reg_temperature,
+        reg_wind_direction=request.reg_wind_direction,
+    )
+    if progress is not None:
+        progress.start(request.num_sim)
+    analysis.run(num_sim=request.num_sim, progress_bar=False, callback=progress)
+    results = analysis.results
+
+    aep_values = results["aep_GWh"].to_numpy(dtype=float)
+    avail_values = results["avail_pct"].to_numpy(dtype=float) * 100.0
+    curt_values = results["curt_pct"].to_numpy(dtype=float) * 100.0
+
+    return AEPResult(
+        aep_mean_gwh=float(np.nanmean(aep_values)),
+        aep_p05_gwh=float(np.nanpercentile(aep_values, 5)),
+        aep_p95_gwh=float(np.nanpercentile(aep_values, 95)),
+        availability_mean_pct=float(np.nanmean(avail_values)),
+        curtailment_mean_pct=float(np.nanmean(curt_values)),
+        lt_por_ratio_mean=float(np.nanmean(results["lt_por_ratio"].to_numpy(dtype=float))),
+        iterations_gwh=[float(value) for value in aep_values.tolist()],
+    )
 
-    params = request.model_dump()
-    params.setdefault("num_sim", settings.default_aep_num_sim)
 
-    def _compute() -> AEPResult:
-        reanalysis_products = request.reanalysis_products or list(plant.reanalysis.keys())
+def _job_response(job: dict) -> JobStatusResponse:
+    result = job["result"]
+    if isinstance(result, PowerCurveColumnarResponse):
+        result = _power_curve_points(result)
+    if isinstance(result, BaseModel):
+        result = result.model_dump()
+    return JobStatusResponse(**{**job, "result": result})
+
+
+def _submit_job(
+    namespace: str, params: dict, compute: Callable[..., BaseModel], request: BaseModel
+) -> dict:
+    try:
+        return submit_job(namespace, params, partial(run_analysis, compute, request))
+    except JobQueueFull as exc:
+        headers = {"Retry-After": "30"}
+        raise HTTPException(status_code=429, detail=str(exc), headers=headers) from exc
 
-        analysis = MonteCarloAEP(
-            plant=plant,
-            reanalysis_products=reanalysis_products,
-            reg_model=request.reg_model,
-            time_resolution=request.time_resolution,
-            reg_temperature=request.reg_temperature,
-            reg_wind_direction=request.reg_wind_direction,
-        )
-        analysis.run(num_sim=request.num_sim, progress_bar=False)
-        results = analysis.results
-
-        aep_values = results["aep_GWh"].to_numpy(dtype=float)
-        avail_values = results["avail_pct"].to_numpy(dtype=float) * 100.0
-        curt_values = results["curt_pct"].to_numpy(dtype=float) * 100.0
-
-        return AEPResult(
-            aep_mean_gwh=float(np.nanmean(aep_values)),
-            aep_p05_gwh=float(np.nanpercentile(aep_values, 5)),
-            aep_p95_gwh=float(np.nanpercentile(aep_values, 95)),
-            availability_mean_pct=float(np.nanmean(avail_values)),
-            curtailment_mean_pct=float(np.nanmean(curt_values)),
-            lt_por_ratio_mean=float(np.nanmean(results["lt_por_ratio"].to_numpy(dtype=float))),
-            iterations_gwh=[float(value) for value in aep_values.tolist()],
-        )
 
-    task_id, status = await submit_aep_task(params, _compute)
-    return AEPTaskResponse(task_id=task_id, status=status)
+@router.post("/aep", response_model=AEPTaskResponse)
+async def submit_aep(request: AEPRequest) -> AEPTaskResponse:
+    params = request.model_dump()
+    params.setdefault("num_sim", settings.default_aep_num_sim)
+
+    job = await asyncio.to_thread(_submit_job, "aep", params, _compute_aep, request)
+    return AEPTaskResponse(task_id=job["job_id"], status=job["status"])
 
 
 @router.get("/aep/status/{task_id}", response_model=AEPStatusResponse)
 def get_aep_status(task_id: str) -> AEPStatusResponse:
-    task = get_aep_task(task_id)
-    if task is None:
+    task = get_job(task_id)
+    if task is None or task["analysis"] != "aep":
         raise HTTPException(status_code=404, detail="Task not found")
 
     result = task.get("result")
@@ -300,4 +397,94 @@ def get_aep_status(task_id: str) -> AEPStatusResponse:
         status=task["status"],
         result=result_model,
         error=task.get("error"),
+        completed_iterations=task["completed_iterations"],
+        total_iterations=task["total_iterations"],
     )
+
+
+@router.post("/jobs/power-curve", response_model=JobStatusResponse)
+def submit_power_curve_job(request: PowerCurveRequest) -> JobStatusResponse:
+    if request.turbine_id not in set(get_plant().turbine_ids):
+        raise HTTPException(status_code=404, detail=f"Unknown turbine_id: {request.turbine_id}")
+    job = _submit_job("power_curve_columns", request.model_dump(), _compute_power_curve, request)
+    return _job_response(job)
+
+
+@router.post("/jobs/electrical-losses", response_model=JobStatusResponse)
+def submit_electrical_losses_job(request: ElectricalLossRequest) -> JobStatusResponse:
+    params = request.model_dump()
+    job = _submit_job("electrical_losses", params, _compute_electrical_losses, request)
+    return _job_response(job)
+
+
+@router.post("/jobs/wake-losses", response_model=JobStatusResponse)
+def submit_wake_losses_job(request: WakeLossRequest) -> JobStatusResponse:
+    job = _submit_job("wake_losses", request.model_dump(), _compute_wake_losses, request)
+    return _job_response(job)
+
+
+@router.post("/jobs/yaw-misalignment", response_model=JobStatusResponse)
+def submit_yaw_misalignment_job(request: YawMisalignmentRequest) -> JobStatusResponse:
+    job = _submit_job("yaw_misalignment", request.model_dump(), _compute_yaw_misalignment, request)
+    return _job_response(job)
+
+
+@router.post("/jobs/aep", response_model=JobStatusResponse)
+def submit_aep_job(request: AEPRequest) -> JobStatusResponse:
+    return _job_response(_submit_job("aep", request.model_dump(), _compute_aep, request))
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+def get_job_status(job_id: str) -> JobStatusResponse:
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request) -> StreamingResponse:
+    """Streams the job's status as server-sent events: a "progress" event whenever more iterations
+    are completed, then an event named by the final status, after which the stream ends."""
+    if await asyncio.to_thread(get_job, job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def _events() -> AsyncIterator[str]:
+        last_state = None
+        last_sent = time.monotonic()
+        while True:
+            job = await asyncio.to_thread(get_job, job_id)
+            if job is None:
+                yield 'event: error\ndata: {"detail": "Job not found"}\n\n'
+                return
+
+            state = (job["status"], job["completed_iterations"], job["cancel_requested"])
+            finished = job["status"] in _FINISHED_JOB_STATUSES
+            if state != last_state:
+                event = job["status"] if finished else "progress"
+                yield f"event: {event}\ndata: {_job_response(job).model_dump_json()}\n\n"
+                last_state = state
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent > _JOB_EVENT_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+
+            if finished or await request.is_disconnected():
+                return
+            await asyncio.sleep(_JOB_EVENT_INTERVAL_SECONDS)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(_events(), media_type="text/event-stream", headers=headers)
+
+
+@router.delete("/jobs/{job_id}", response_model=JobStatusResponse)
+def cancel_job_request(job_id: str) -> JobStatusResponse:
+    job = cancel_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_response(job)
+
+
+@router.get("/cache/stats", response_model=ResultCacheStatsResponse)
+def get_result_cache_stats() -> ResultCacheStatsResponse:
+    return ResultCacheStatsResponse(**get_cache_stats())
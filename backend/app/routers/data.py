@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
+from typing import Literal
 
 import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 
 from backend.app.config import settings
+from backend.app.responses import ResponseFormat, arrow_response, columnar_response
 from backend.app.schemas import (
+    AvailabilityResponse,
     MonthlyEnergyPoint,
     MonthlyEnergyResponse,
     ScadaPoint,
@@ -16,11 +20,22 @@ from backend.app.schemas import (
     WindRoseResponse,
     WindRoseSector,
 )
+from backend.app.services.downsampling import DownsampleMethod, downsample_indices
 from backend.app.services.plant_loader import get_plant
+from backend.app.services.scada_pyramid import get_scada_pyramid
+from backend.app.services.wind_rose_cube import get_wind_rose_cube
 
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 
+# The names of the SCADA columns in the responses
+SCADA_FIELDS = {
+    "WTUR_W": "power_kw",
+    "WMET_HorWdSpd": "wind_speed_ms",
+    "WMET_HorWdDir": "wind_direction_deg",
+    "WMET_EnvTmp": "temperature_c",
+}
+
 
 def _safe_float(value: float | int | None) -> float | None:
     if value is None:
@@ -47,94 +62,110 @@ def get_scada(
     start: datetime | None = None,
     end: datetime | None = None,
     resample: str = Query(default="1h"),
-) -> ScadaResponse:
-    plant = get_plant()
+    how: Literal["mean", "sum", "min", "max", "count"] = Query(default="mean"),
+    format: ResponseFormat = Query(default="json"),
+    downsample: DownsampleMethod = Query(default="lttb"),
+    max_points: int | None = Query(default=None, ge=3),
+) -> ScadaResponse | Response:
+    pyramid = get_scada_pyramid()
 
-    if turbine_id:
-        if turbine_id not in set(plant.turbine_ids):
-            raise HTTPException(status_code=404, detail=f"Unknown turbine_id: {turbine_id}")
-        df = plant.turbine_df(turbine_id).copy()
-    else:
-        df = (
-            plant.scada.groupby(level="time")
-            .agg(
-                {
-                    "WTUR_W": "sum",
-                    "WMET_HorWdSpd": "mean",
-                    "WMET_HorWdDir": "mean",
-                    "WMET_EnvTmp": "mean",
-                }
-            )
-            .copy()
-        )
-
-    if start is not None:
-        df = df.loc[df.index >= pd.Timestamp(start)]
-    if end is not None:
-        df = df.loc[df.index <= pd.Timestamp(end)]
+    if turbine_id and turbine_id not in set(pyramid.turbine_ids):
+        raise HTTPException(status_code=404, detail=f"Unknown turbine_id: {turbine_id}")
 
     try:
-        df = df.resample(resample).mean(numeric_only=True)
+        df = pyramid.query(
+            turbine_id or None,
+            start=None if start is None else pd.Timestamp(start),
+            end=None if end is None else pd.Timestamp(end),
+            freq=resample,
+            how=how,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid resample frequency: {resample}") from exc
 
-    df = df[["WTUR_W", "WMET_HorWdSpd", "WMET_HorWdDir", "WMET_EnvTmp"]].dropna(how="all")
-
-    if len(df) > settings.scada_max_points:
-        step = math.ceil(len(df) / settings.scada_max_points)
-        df = df.iloc[::step]
+    # Reduce the number of points to the budget while keeping the shape of the power time series
+    budget = min(max_points or settings.scada_max_points, settings.scada_max_points)
+    if len(df) > budget:
+        power = df["WTUR_W"].to_numpy(dtype=float)
+        df = df.iloc[downsample_indices(df.index.asi8, power, budget, downsample)]
+
+    if format != "json":
+        columns = {"time": df.index.to_numpy()}
+        for column, field in SCADA_FIELDS.items():
+            columns[field] = df[column].to_numpy(dtype=float)
+        metadata = {"turbine_id": turbine_id, "resample": resample, "how": how}
+        if format == "arrow":
+            return arrow_response(columns, **metadata)
+        return columnar_response(columns, **metadata)
 
     points = [
         ScadaPoint(
-            time=index.to_pydatetime(),
-            power_kw=_safe_float(row["WTUR_W"]),
-            wind_speed_ms=_safe_float(row["WMET_HorWdSpd"]),
-            wind_direction_deg=_safe_float(row["WMET_HorWdDir"]),
-            temperature_c=_safe_float(row["WMET_EnvTmp"]),
+            time=timestamp,
+            power_kw=_safe_float(power),
+            wind_speed_ms=_safe_float(wind_speed),
+            wind_direction_deg=_safe_float(wind_direction),
+            temperature_c=_safe_float(temperature),
+        )
+        for timestamp, (power, wind_speed, wind_direction, temperature) in zip(
+            df.index.to_pydatetime(), df.to_numpy(dtype=float).tolist()
         )
-        for index, row in df.iterrows()
     ]
 
-    return ScadaResponse(turbine_id=turbine_id, resample=resample, points=points)
+    return ScadaResponse(turbine_id=turbine_id, resample=resample, how=how, points=points)
 
 
-@router.get("/wind-rose", response_model=WindRoseResponse)
-def get_wind_rose(
-    turbine_id: str | None = None,
-    start: datetime | None = None,
-    end: datetime | None = None,
-    direction_bins: int = Query(default=12, ge=6, le=72),
-    speed_bins: str = Query(default="0,3,6,9,12,15,25"),
-) -> WindRoseResponse:
+def _wind_rose_histogram(
+    turbine_id: str | None,
+    start: pd.Timestamp | None,
+    end: pd.Timestamp | None,
+    direction_edges: np.ndarray,
+    speed_edges: np.ndarray,
+) -> tuple[np.ndarray, int]:
     plant = get_plant()
-
     if turbine_id:
-        if turbine_id not in set(plant.turbine_ids):
-            raise HTTPException(status_code=404, detail=f"Unknown turbine_id: {turbine_id}")
-        df = plant.turbine_df(turbine_id)[["WMET_HorWdDir", "WMET_HorWdSpd"]].copy()
+        df = plant.turbine_df(turbine_id)[["WMET_HorWdDir", "WMET_HorWdSpd"]]
     else:
-        df = (
-            plant.scada.groupby(level="time")
-            .agg({"WMET_HorWdDir": "mean", "WMET_HorWdSpd": "mean"})
-            .copy()
+        df = plant.scada.groupby(level="time").agg(
+            {"WMET_HorWdDir": "mean", "WMET_HorWdSpd": "mean"}
         )
 
     if start is not None:
-        df = df.loc[df.index >= pd.Timestamp(start)]
+        df = df.loc[df.index >= start]
     if end is not None:
-        df = df.loc[df.index <= pd.Timestamp(end)]
-
+        df = df.loc[df.index <= end]
     df = df.dropna(subset=["WMET_HorWdDir", "WMET_HorWdSpd"])
-    if df.empty:
-        raise HTTPException(status_code=404, detail="No wind data found for requested filters")
-
-    speed_edges = _parse_speed_bins(speed_bins)
-    direction_edges = np.linspace(0, 360, direction_bins + 1)
 
     directions = np.mod(df["WMET_HorWdDir"].to_numpy(), 360.0)
     speeds = df["WMET_HorWdSpd"].to_numpy()
-
     hist, _, _ = np.histogram2d(directions, speeds, bins=[direction_edges, speed_edges])
+    return hist, len(df)
+
+
+@router.get("/wind-rose", response_model=WindRoseResponse)
+def get_wind_rose(
+    turbine_id: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    direction_bins: int = Query(default=12, ge=6, le=72),
+    speed_bins: str = Query(default="0,3,6,9,12,15,25"),
+) -> WindRoseResponse:
+    cube = get_wind_rose_cube()
+    if turbine_id and turbine_id not in set(cube.turbine_ids):
+        raise HTTPException(status_code=404, detail=f"Unknown turbine_id: {turbine_id}")
+
+    speed_edges = np.asarray(_parse_speed_bins(speed_bins))
+    direction_edges = np.linspace(0, 360, direction_bins + 1)
+    start = None if start is None else pd.Timestamp(start)
+    end = None if end is None else pd.Timestamp(end)
+
+    try:
+        hist, n_samples = cube.query(turbine_id or None, start, end, direction_edges, speed_edges)
+    except ValueError:
+        # Bins that aren't made up of the cube's cells are computed from the SCADA data
+        hist, n_samples = _wind_rose_histogram(turbine_id, start, end, direction_edges, speed_edges)
+
+    if n_samples == 0:
+        raise HTTPException(status_code=404, detail="No wind data found for requested filters")
     total_samples = float(hist.sum())
 
     sectors: list[WindRoseSector] = []
@@ -162,14 +193,45 @@ def get_wind_rose(
 
 
 @router.get("/monthly-energy", response_model=MonthlyEnergyResponse)
-def get_monthly_energy() -> MonthlyEnergyResponse:
+def get_monthly_energy(
+    format: ResponseFormat = Query(default="json"),
+) -> MonthlyEnergyResponse | Response:
     plant = get_plant()
 
     monthly = plant.meter["MMTR_SupWh"].resample("MS").sum() / 1000.0
     monthly = monthly.dropna()
 
+    if format != "json":
+        columns = {"month": monthly.index.to_numpy(), "energy_mwh": monthly.to_numpy(dtype=float)}
+        if format == "arrow":
+            return arrow_response(columns)
+        return columnar_response(columns)
+
     points = [
         MonthlyEnergyPoint(month=timestamp.to_pydatetime(), energy_mwh=float(value))
         for timestamp, value in monthly.items()
     ]
     return MonthlyEnergyResponse(points=points)
+
+
+@router.get("/availability", response_model=AvailabilityResponse)
+def get_availability(
+    column: str = Query(default="WTUR_W"),
+    freq: Literal["D", "MS"] = Query(default="D"),
+) -> AvailabilityResponse:
+    plant = get_plant()
+
+    if column not in plant.scada.columns:
+        raise HTTPException(status_code=404, detail=f"Unknown SCADA column: {column}")
+
+    # Fraction of the expected samples per turbine and period, from the plant's cached daily counts
+    availability = plant.availability("scada", freq=freq, normalize=True)[column]
+    availability = availability.unstack("asset_id")
+
+    return AvailabilityResponse(
+        column=column,
+        freq=freq,
+        turbine_ids=[str(turbine_id) for turbine_id in availability.columns],
+        periods=[timestamp.to_pydatetime() for timestamp in availability.index],
+        values=[[_safe_float(value) for value in row] for row in availability.to_numpy()],
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -37,6 +37,7 @@ class ScadaPoint(BaseModel):
 class ScadaResponse(BaseModel):
     turbine_id: str | None = None
     resample: str
+    how: str = "mean"
     points: list[ScadaPoint]
 
 
@@ -54,6 +55,14 @@ class WindRoseResponse(BaseModel):
     sectors: list[WindRoseSector]
 
 
+class AvailabilityResponse(BaseModel):
+    column: str
+    freq: str
+    turbine_ids: list[str]
+    periods: list[datetime]
+    values: list[list[float | None]]
+
+
 class MonthlyEnergyPoint(BaseModel):
     month: datetime
     energy_mwh: float
@@ -66,6 +75,7 @@ class MonthlyEnergyResponse(BaseModel):
 class PowerCurveRequest(BaseModel):
     turbine_id: str
     method: Literal["IEC", "logistic_5", "gam"] = "IEC"
+    downsample: Literal["lttb", "minmax", "stride"] = "lttb"
 
 
 class CurvePoint(BaseModel):
@@ -92,6 +102,19 @@ class PowerCurveResponse(BaseModel):
     stats: PowerCurveStats
 
 
+class CurveColumns(BaseModel):
+    wind_speed_ms: list[float]
+    power_kw: list[float]
+
+
+class PowerCurveColumnarResponse(BaseModel):
+    turbine_id: str
+    method: str
+    curve: CurveColumns
+    scatter: CurveColumns
+    stats: PowerCurveStats
+
+
 class ElectricalLossRequest(BaseModel):
     uncertainty: bool = False
     num_sim: int = Field(default=200, ge=1, le=20000)
@@ -158,13 +181,55 @@ class AEPResult(BaseModel):
     iterations_gwh: list[float]
 
 
+JobStatus = Literal["queued", "running", "completed", "failed", "cancelled"]
+
+
 class AEPTaskResponse(BaseModel):
     task_id: str
-    status: Literal["running", "completed", "failed"]
+    status: JobStatus
 
 
 class AEPStatusResponse(BaseModel):
     task_id: str
-    status: Literal["running", "completed", "failed"]
+    status: JobStatus
     result: AEPResult | None = None
     error: str | None = None
+    completed_iterations: int = 0
+    total_iterations: int | None = None
+
+
+class IterationSummary(BaseModel):
+    mean: float | None = None
+    p05: float | None = None
+    p95: float | None = None
+    n: int = 0
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    analysis: str
+    status: JobStatus
+    completed_iterations: int = 0
+    total_iterations: int | None = None
+    progress: float | None = None
+    eta_seconds: float | None = None
+    summary: dict[str, IterationSummary] = Field(default_factory=dict)
+    cancel_requested: bool = False
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: str
+    updated_at: str
+
+
+class ResultCacheStatsResponse(BaseModel):
+    hits: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    expirations: int
+    memory_evictions: int
+    disk_evictions: int
+    memory_entries: int
+    memory_bytes: int
+    disk_entries: int
+    disk_bytes: int
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import threading
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from hashlib import sha256
 from typing import Any, Callable
 from uuid import uuid4
 
+import numpy as np
+
+from backend.app.config import settings
+from backend.app.services.plant_loader import plant_fingerprint
+from backend.app.services.result_cache import get_result_cache
+from backend.app.services.worker_pool import create_shared_state
+
 
 _lock = threading.Lock()
-_cache: dict[str, Any] = {}
-_task_index_by_key: dict[str, str] = {}
-_aep_tasks: dict[str, dict[str, Any]] = {}
+_jobs: dict[str, dict[str, Any]] = {}
+_job_index_by_key: dict[str, str] = {}
+_executor: ThreadPoolExecutor | None = None
+_inflight: dict[str, tuple[Future, Progress]] = {}
+_MISSING = object()
+_RETRY = object()
+_WAIT_SECONDS = 0.2
 
 
 def _now_iso() -> str:
@@ -28,85 +41,312 @@ def build_cache_key(namespace: str, params: dict[str, Any]) -> str:
     return f"{namespace}:{_stable_hash(params)}"
 
 
-def run_cached(namespace: str, params: dict[str, Any], compute: Callable[[], Any]) -> Any:
-    key = build_cache_key(namespace, params)
+def _result_key(namespace: str, params: dict[str, Any]) -> str:
+    # Results computed from a previously loaded version of the plant data are never reused
+    return f"{build_cache_key(namespace, params)}:{plant_fingerprint()}"
+
+
+def run_cached(
+    namespace: str,
+    params: dict[str, Any],
+    compute: Callable[[Progress], Any],
+    progress: Progress | None = None,
+) -> Any:
+    """Returns the cached result of ``compute(progress)``, or computes and caches it.
+
+    Concurrent identical calls wait for the first one instead of repeating the computation. A job
+    passes its ``progress``, which then follows the progress of the computation it waits for, and
+    stops waiting when the job is cancelled. When the computing job is cancelled, the waiting
+    calls start over instead of failing, and one of them computes the result.
+    """
+    cache = get_result_cache()
+    key = _result_key(namespace, params)
+    while True:
+        result = cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        # Concurrent identical requests wait for the first one instead of repeating the computation
+        with _lock:
+            inflight = _inflight.get(key)
+            if inflight is None:
+                leader = progress if progress is not None else Progress(*create_shared_state())
+                future = Future()
+                _inflight[key] = (future, leader)
+        if inflight is None:
+            return _compute_cached(cache, key, future, leader, compute)
+
+        result = _wait(*inflight, progress)
+        if result is not _RETRY:
+            return result
+
+
+def _compute_cached(
+    cache: Any, key: str, future: Future, progress: Progress, compute: Callable[[Progress], Any]
+) -> Any:
+    try:
+        # A previous leader may have finished between the lookup above and registering this one
+        result = cache.get(key, _MISSING) if key in cache else _MISSING
+        if result is _MISSING:
+            result = compute(progress)
+            cache.put(key, result)
+    except JobCancelled:
+        # Only the cancelled job fails, and the requests waiting for it start over
+        future.set_result(_RETRY)
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+    return result
+
+
+def _wait(future: Future, leader: Progress, progress: Progress | None) -> Any:
+    if progress is None:
+        return future.result()
+    while True:
+        if progress.is_cancelled():
+            raise JobCancelled("The job was cancelled")
+        progress.follow(leader)
+        done, _ = wait([future], timeout=_WAIT_SECONDS)
+        if done:
+            return future.result()
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def _summarize(values: list[float]) -> dict[str, float | int | None]:
+    finite = np.asarray(values, dtype=float)
+    finite = finite[np.isfinite(finite)]
+    if finite.size == 0:
+        return {"mean": None, "p05": None, "p95": None, "n": 0}
+    p05, p95 = np.percentile(finite, [5, 95])
+    return {"mean": float(finite.mean()), "p05": float(p05), "p95": float(p95), "n": finite.size}
+
+
+class Progress:
+    """Tracks the iterations completed by a job's analysis and the running mean, P05, and P95 of
+    each iteration result, and stops the analysis when the job is cancelled. Instances are passed
+    to the analyses as their iteration callback, and can be sent to the worker processes when the
+    state is shared through a multiprocessing manager."""
+
+    def __init__(self, state: MutableMapping[str, Any], cancel_event: Any) -> None:
+        self._state = state
+        self._cancel_event = cancel_event
+        self._values: dict[str, list[float]] = {}
+
+    def start(self, total: int) -> None:
+        self._values = {}
+        self._state.update(total=total, completed=0, started_at=time.time(), summary={})
+
+    def __call__(self, iteration: int, results: dict[str, float]) -> None:
+        if self.is_cancelled():
+            raise JobCancelled("The job was cancelled")
+
+        # The values are kept by the analysis' process, and only their summary is shared
+        for name, value in results.items():
+            self._values.setdefault(str(name), []).append(float(value))
+        summary = {name: _summarize(values) for name, values in self._values.items()}
+        self._state.update(completed=iteration + 1, summary=summary)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def follow(self, other: Progress) -> None:
+        """Copies the state of ``other``, the progress of the computation this one waits for."""
+        if other is not self:
+            self._state.update(other.snapshot())
+
+    def snapshot(self) -> dict[str, Any]:
+        return self._state.copy()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.job_concurrency, thread_name_prefix="openoa-job"
+        )
+    return _executor
+
+
+def _new_job(namespace: str, key: str, status: str) -> dict[str, Any]:
+    now = _now_iso()
+    job = {
+        "job_id": str(uuid4()),
+        "analysis": namespace,
+        "key": key,
+        "status": status,
+        "progress": Progress(*create_shared_state()) if status == "queued" else None,
+        "future": None,
+        "cancel_requested": False,
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+        "finished_at": None,
+    }
+    _jobs[job["job_id"]] = job
+    _job_index_by_key[key] = job["job_id"]
+    return job
+
+
+def _finish_job(
+    job: dict[str, Any], status: str, result: Any = None, error: str | None = None
+) -> None:
+    job.update(
+        status=status,
+        result=result,
+        error=error,
+        updated_at=_now_iso(),
+        finished_at=time.monotonic(),
+    )
+
+
+def _job_view(job: dict[str, Any]) -> dict[str, Any]:
+    state = job["progress"].snapshot() if job["progress"] is not None else {}
+    total = state.get("total")
+    completed = state.get("completed", 0)
+    if job["status"] == "completed" and total is not None:
+        completed = total
+
+    eta = None
+    if job["status"] == "running" and total and completed:
+        elapsed = time.time() - state["started_at"]
+        eta = elapsed / completed * (total - completed)
+
+    return {
+        "job_id": job["job_id"],
+        "analysis": job["analysis"],
+        "status": job["status"],
+        "completed_iterations": completed,
+        "total_iterations": total,
+        "progress": completed / total if total else None,
+        "eta_seconds": eta,
+        "summary": state.get("summary", {}),
+        "cancel_requested": job["cancel_requested"],
+        "result": job["result"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+    }
+
+
+def _collect_garbage() -> None:
+    now = time.monotonic()
+    expired = [
+        job_id
+        for job_id, job in _jobs.items()
+        if job["finished_at"] is not None and now - job["finished_at"] > settings.job_ttl_seconds
+    ]
+    for job_id in expired:
+        job = _jobs.pop(job_id)
+        if _job_index_by_key.get(job["key"]) == job_id:
+            del _job_index_by_key[job["key"]]
+
+
+def _run_job(job_id: str, params: dict[str, Any], compute: Callable[[Progress], Any]) -> None:
     with _lock:
-        if key in _cache:
-            return _cache[key]
+        job = _jobs[job_id]
+        if job["cancel_requested"]:
+            _finish_job(job, "cancelled")
+            return
+        job.update(status="running", updated_at=_now_iso())
+        progress = job["progress"]
 
-    result = compute()
+    try:
+        result = run_cached(job["analysis"], params, compute, progress)
+    except JobCancelled:
+        with _lock:
+            _finish_job(job, "cancelled")
+    except Exception as exc:
+        with _lock:
+            _finish_job(job, "failed", error=str(exc))
+    else:
+        with _lock:
+            _finish_job(job, "completed", result=result)
 
+
+def submit_job(
+    namespace: str, params: dict[str, Any], compute: Callable[[Progress], Any]
+) -> dict[str, Any]:
+    """Runs ``compute(progress)`` in the background and returns the status of the new job, or of
+    the existing job with the same parameters. Raises ``JobQueueFull`` when the maximum number of
+    queued and running jobs is reached."""
+    key = _result_key(namespace, params)
     with _lock:
-        _cache[key] = result
+        _collect_garbage()
+        job_id = _job_index_by_key.get(key)
+        if job_id is not None and _jobs[job_id]["status"] in {"queued", "running", "completed"}:
+            return _job_view(_jobs[job_id])
 
-    return result
+    cached = get_result_cache().get(key, _MISSING)
+
+    with _lock:
+        if cached is not _MISSING:
+            job = _new_job(namespace, key, "completed")
+            _finish_job(job, "completed", result=cached)
+            return _job_view(job)
 
+        n_active = sum(job["status"] in {"queued", "running"} for job in _jobs.values())
+        if n_active >= settings.job_queue_size:
+            raise JobQueueFull(
+                f"There are already {n_active} queued or running analyses, try again later"
+            )
 
-async def submit_aep_task(params: dict[str, Any], compute: Callable[[], Any]) -> tuple[str, str]:
-    key = build_cache_key("aep", params)
+        job = _new_job(namespace, key, "queued")
+        job["future"] = _get_executor().submit(_run_job, job["job_id"], params, compute)
+        return _job_view(job)
 
+
+def get_job(job_id: str) -> dict[str, Any] | None:
     with _lock:
-        if key in _cache:
-            task_id = _task_index_by_key.get(key)
-            if task_id is None:
-                task_id = str(uuid4())
-                _task_index_by_key[key] = task_id
-                _aep_tasks[task_id] = {
-                    "task_id": task_id,
-                    "status": "completed",
-                    "result": _cache[key],
-                    "error": None,
-                    "updated_at": _now_iso(),
-                }
-            return task_id, "completed"
-
-        existing_task_id = _task_index_by_key.get(key)
-        if existing_task_id:
-            task = _aep_tasks.get(existing_task_id)
-            if task and task["status"] in {"running", "completed"}:
-                return existing_task_id, task["status"]
-
-        task_id = str(uuid4())
-        _task_index_by_key[key] = task_id
-        _aep_tasks[task_id] = {
-            "task_id": task_id,
-            "status": "running",
-            "result": None,
-            "error": None,
-            "updated_at": _now_iso(),
-        }
-
-    async def _runner() -> None:
-        try:
-            result = await asyncio.to_thread(compute)
-            with _lock:
-                _cache[key] = result
-                _aep_tasks[task_id].update(
-                    {
-                        "status": "completed",
-                        "result": result,
-                        "error": None,
-                        "updated_at": _now_iso(),
-                    }
-                )
-        except Exception as exc:  # pragma: no cover
-            with _lock:
-                _aep_tasks[task_id].update(
-                    {
-                        "status": "failed",
-                        "result": None,
-                        "error": str(exc),
-                        "updated_at": _now_iso(),
-                    }
-                )
-
-    asyncio.create_task(_runner())
-    return task_id, "running"
-
-
-def get_aep_task(task_id: str) -> dict[str, Any] | None:
+        _collect_garbage()
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        return _job_view(job)
+
+
+def cancel_job(job_id: str) -> dict[str, Any] | None:
+    """Cancels a queued job immediately, and stops a running job at the analysis' next
+    iteration."""
     with _lock:
-        task = _aep_tasks.get(task_id)
-        if not task:
+        job = _jobs.get(job_id)
+        if job is None:
             return None
-        return dict(task)
+        if job["status"] in {"queued", "running"}:
+            job.update(cancel_requested=True, updated_at=_now_iso())
+            job["progress"].cancel()
+            if job["future"].cancel():
+                _finish_job(job, "cancelled")
+        return _job_view(job)
+
+
+def get_cache_stats() -> dict[str, int]:
+    return get_result_cache().stats()
+
+
+def shutdown_jobs() -> None:
+    global _executor
+    with _lock:
+        for job in _jobs.values():
+            if job["status"] in {"queued", "running"}:
+                job["cancel_requested"] = True
+                job["progress"].cancel()
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+
+
+# "stride" keeps evenly spaced points, "minmax" keeps the extremes of each bucket, and "lttb"
+# keeps the point of each bucket that best preserves the visual shape of the line
+DownsampleMethod = Literal["lttb", "minmax", "stride"]
+
+
+def _bucket_edges(n: int, n_buckets: int) -> np.ndarray:
+    return np.linspace(0, n, n_buckets + 1).astype(int)
+
+
+def stride_indices(n: int, n_out: int) -> np.ndarray:
+    """Returns ``n_out`` evenly spaced indices of ``n`` points, including the first and last."""
+    if n <= n_out:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, n_out).astype(int))
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Returns the sorted indices of the minimum and maximum of ``y`` in each of ``n_out // 2``
+    equally sized buckets, so that peaks and drops are kept regardless of the number of points
+    dropped. NaN values are only kept for buckets without any other values.
+
+    Args:
+        y (np.ndarray): The values to downsample.
+        n_out (int): The maximum number of indices to return.
+
+    Returns:
+        np.ndarray: The indices of the kept points.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    n_buckets = n_out // 2
+    if n <= n_out or n_buckets < 1:
+        return np.arange(n)
+
+    # Pad the buckets to the same length, so that the extremes are found in a single pass
+    edges = _bucket_edges(n, n_buckets)
+    width = np.diff(edges).max()
+    positions = edges[:-1, None] + np.arange(width)
+    valid = positions < edges[1:, None]
+    positions = np.where(valid, positions, edges[1:, None] - 1)
+
+    values = y[positions]
+    missing = np.isnan(values) | ~valid
+    low = np.where(missing, np.inf, values).argmin(axis=1)
+    high = np.where(missing, -np.inf, values).argmax(axis=1)
+    rows = np.arange(n_buckets)
+    return np.unique(np.concatenate([positions[rows, low], positions[rows, high]]))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Returns the indices selected by the Largest-Triangle-Three-Buckets algorithm, which keeps
+    the first and last points, and from each of the ``n_out - 2`` equally sized buckets in between,
+    the point forming the largest triangle with the point kept from the previous bucket and the
+    mean of the next bucket.
+
+    The bucket means and the candidate triangles' terms are computed for all buckets at once, and
+    only the choice of each bucket's point, which depends on the previous bucket's, is sequential.
+    Points with a NaN ``y`` are only kept for buckets without any other values.
+
+    Args:
+        x (np.ndarray): The x values, such as the timestamps as numbers, in increasing order.
+        y (np.ndarray): The y values.
+        n_out (int): The number of indices to return.
+
+    Returns:
+        np.ndarray: The indices of the kept points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n <= n_out or n_out < 3:
+        return np.arange(n) if n <= n_out else stride_indices(n, n_out)
+
+    # The first and last points are kept, and the points in between are split into buckets
+    n_buckets = n_out - 2
+    edges = 1 + _bucket_edges(n - 2, n_buckets)
+    width = np.diff(edges).max()
+    positions = edges[:-1, None] + np.arange(width)
+    valid = positions < edges[1:, None]
+    positions = np.where(valid, positions, edges[1:, None] - 1)
+
+    bucket_x = x[positions]
+    bucket_y = y[positions]
+    present = valid & ~np.isnan(bucket_y)
+    counts = present.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.where(present, bucket_x, 0).sum(axis=1) / counts
+        mean_y = np.where(present, bucket_y, 0).sum(axis=1) / counts
+
+    # The next bucket's mean, where the last bucket's next point is the last point, and buckets
+    # without values are represented by the next bucket with values
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+    has_next = np.append(counts[1:] > 0, True)
+    fill = np.minimum.accumulate(np.where(has_next, np.arange(n_buckets), n_buckets - 1)[::-1])
+    next_x, next_y = next_x[fill[::-1]], next_y[fill[::-1]]
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    anchor_x, anchor_y = x[0], y[0]
+    for i in range(n_buckets):
+        # Twice the area of the triangle, which has the same maximum
+        area = np.abs(
+            (anchor_x - next_x[i]) * (bucket_y[i] - anchor_y)
+            - (anchor_x - bucket_x[i]) * (next_y[i] - anchor_y)
+        )
+        best = np.where(present[i], np.nan_to_num(area), -1.0).argmax()
+        selected[i + 1] = positions[i, best]
+        if present[i, best]:
+            anchor_x, anchor_y = bucket_x[i, best], bucket_y[i, best]
+    return np.unique(selected)
+
+
+def downsample_indices(
+    x: np.ndarray, y: np.ndarray, n_out: int, method: DownsampleMethod = "lttb"
+) -> np.ndarray:
+    """Returns the indices of at most ``n_out`` points of the line ``(x, y)`` selected with
+    :py:attr:`method`, see :py:func:`lttb_indices`, :py:func:`minmax_indices`, and
+    :py:func:`stride_indices`."""
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    if method == "stride":
+        return stride_indices(len(y), n_out)
+    raise ValueError(f"Invalid downsampling method: {method}")
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import threading
+from hashlib import sha256
 from pathlib import Path
 
+import pandas as pd
 from examples.project_ENGIE import prepare
 from openoa.plant import PlantData
 
 from backend.app.config import settings
+from backend.app.services.plant_snapshot import PlantSnapshot
 
 
 _lock = threading.Lock()
 _plant: PlantData | None = None
+_fingerprint: str | None = None
+_snapshot: PlantSnapshot | None = None
 
 
 def repo_root() -> Path:
@@ -18,22 +23,92 @@ def repo_root() -> Path:
 
 
 def load_plant(force_reload: bool = False) -> PlantData:
-    global _plant
+    global _plant, _fingerprint
     with _lock:
-        if _plant is not None and not force_reload:
+        is_current = _snapshot is None or _snapshot.is_current()
+        if _plant is not None and not force_reload and is_current:
             return _plant
 
+        _fingerprint = None
         data_path = settings.resolve_data_path(repo_root())
-        _plant = prepare(path=data_path, return_value="plantdata")
+        snapshot = _get_snapshot()
+        if snapshot is None:
+            _plant = prepare(
+                path=data_path, return_value="plantdata", compact=settings.compact_data
+            )
+            return _plant
+
+        # Only one process prepares the data, and the others wait for it and attach to its snapshot
+        source = _snapshot_source(data_path)
+        with snapshot.lock():
+            attached = None if force_reload else snapshot.attach(source)
+            if attached is None:
+                plant = prepare(
+                    path=data_path, return_value="plantdata", compact=settings.compact_data
+                )
+                snapshot.publish(plant, _hash_plant(plant), source)
+                attached = snapshot.attach(source)
+        _plant, _fingerprint = attached
         return _plant
 
 
+def _get_snapshot() -> PlantSnapshot | None:
+    global _snapshot
+    if _snapshot is None:
+        path = settings.resolve_plant_snapshot_path(repo_root())
+        if path is not None:
+            _snapshot = PlantSnapshot(path)
+    return _snapshot
+
+
+def _snapshot_source(data_path: Path) -> str:
+    # The snapshot is prepared again when the data files or the preparation settings change
+    files = sorted(path for path in data_path.parent.glob(f"{data_path.name}*") if path.is_file())
+    files += sorted(path for path in data_path.rglob("*") if path.is_file())
+    stats = [(str(path), path.stat().st_size, path.stat().st_mtime_ns) for path in files]
+    return repr((str(data_path), settings.compact_data, stats))
+
+
+def set_plant(plant: PlantData, fingerprint: str | None = None) -> None:
+    global _plant, _fingerprint
+    with _lock:
+        _plant = plant
+        _fingerprint = fingerprint
+
+
 def get_plant() -> PlantData:
     plant = _plant
-    if plant is None:
+    if plant is None or (_snapshot is not None and not _snapshot.is_current()):
         return load_plant()
     return plant
 
 
+def _hash_plant(plant: PlantData) -> str:
+    digest = sha256()
+    frames = {name: df for name, df in plant.data_dict.items() if name != "reanalysis"}
+    frames.update({f"reanalysis-{name}": df for name, df in (plant.reanalysis or {}).items()})
+    for name, df in sorted(frames.items()):
+        if df is None:
+            continue
+        # Shapely geometries are derived from the coordinates and cannot be hashed by pandas
+        df = df.drop(columns="geometry", errors="ignore")
+        digest.update(f"{name}:{list(df.columns)}:{list(df.dtypes.astype(str))}".encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    for name, store in sorted(plant.stores.items()):
+        digest.update(f"{name}:{store.version}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def plant_fingerprint() -> str:
+    """Returns a hash of the loaded plant data, so that cached results are not reused after the
+    data changes."""
+    global _fingerprint
+    plant = get_plant()
+    with _lock:
+        if _fingerprint is None:
+            _fingerprint = _hash_plant(plant)
+        return _fingerprint
+
+
 def is_plant_loaded() -> bool:
     return _plant is not None
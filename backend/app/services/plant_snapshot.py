@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import copy
+import os
+import pickle
+import shutil
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+from openoa.plant import PlantData
+
+
+_FRAMES = ("scada", "meter", "tower", "status", "curtail", "asset")
+_CURRENT = "current"
+_LOCK = ".lock"
+_INFO = "plant.pkl"
+
+
+def _write_array(values: Any, directory: Path, name: str) -> dict[str, Any]:
+    # NumPy arrays of fixed size values are memory mapped when reading, and all other values, such
+    # as strings and geometries, are pickled with the snapshot information
+    if isinstance(values, pd.Categorical):
+        codes = _write_array(values.codes, directory, f"{name}-codes")
+        return {"codes": codes, "categories": values.categories, "ordered": values.ordered}
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biufcmM":
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(values), allow_pickle=False)
+        return {"file": f"{name}.npy"}
+    return {"values": values}
+
+
+def _read_array(spec: dict[str, Any], directory: Path) -> Any:
+    if "codes" in spec:
+        codes = _read_array(spec["codes"], directory)
+        return pd.Categorical.from_codes(codes, spec["categories"], ordered=spec["ordered"])
+    if "file" in spec:
+        return np.load(directory / spec["file"], mmap_mode="r", allow_pickle=False)
+    return spec["values"]
+
+
+def _write_index(index: pd.Index, directory: Path, name: str) -> dict[str, Any]:
+    if isinstance(index, pd.MultiIndex):
+        return {
+            "levels": [
+                _write_index(level, directory, f"{name}-level{i}")
+                for i, level in enumerate(index.levels)
+            ],
+            "codes": [
+                _write_array(codes, directory, f"{name}-codes{i}")
+                for i, codes in enumerate(index.codes)
+            ],
+            "names": list(index.names),
+        }
+    is_extension = isinstance(index.dtype, pd.api.extensions.ExtensionDtype)
+    values = index.array if is_extension else index.to_numpy()
+    return {
+        "values": _write_array(values, directory, name),
+        "dtype": index.dtype,
+        "name": index.name,
+        "freq": index.freqstr if isinstance(index, pd.DatetimeIndex) else None,
+    }
+
+
+def _read_index(spec: dict[str, Any], directory: Path) -> pd.Index:
+    if "levels" in spec:
+        return pd.MultiIndex(
+            levels=[_read_index(level, directory) for level in spec["levels"]],
+            codes=[_read_array(codes, directory) for codes in spec["codes"]],
+            names=spec["names"],
+            verify_integrity=False,
+        )
+    values = _read_array(spec["values"], directory)
+    if spec["freq"] is not None:
+        return pd.DatetimeIndex(values, freq=spec["freq"], name=spec["name"], copy=False)
+    return pd.Index(values, dtype=spec["dtype"], name=spec["name"], copy=False)
+
+
+def _write_frame(df: pd.DataFrame, directory: Path) -> dict[str, Any]:
+    directory.mkdir(parents=True)
+    values = []
+    for i, (_, column) in enumerate(df.items()):
+        is_extension = isinstance(column.dtype, pd.api.extensions.ExtensionDtype)
+        array = column.array if is_extension else column.to_numpy()
+        values.append(_write_array(array, directory, f"column{i}"))
+    return {
+        "index": _write_index(df.index, directory, "index"),
+        "columns": df.columns,
+        "values": values,
+    }
+
+
+def _read_frame(spec: dict[str, Any], directory: Path) -> pd.DataFrame:
+    index = _read_index(spec["index"], directory)
+    values = {i: _read_array(column, directory) for i, column in enumerate(spec["values"])}
+    df = pd.DataFrame(values, index=index, copy=False)
+    df.columns = spec["columns"]
+    return df
+
+
+class PlantSnapshot:
+    """Snapshot of a :py:class:`PlantData` in a directory, that processes attach to without copying
+    the data, so that multiple web server workers share a single copy of the plant data.
+
+    The numeric and datetime columns and indexes of the plant's data frames are stored as NumPy
+    files, which are memory mapped read-only when attaching, so the operating system shares their
+    pages between all processes. The rest of the plant, including the metadata and any text
+    columns, is pickled.
+
+    The attached data frames are read-only, and setting values in them raises a ``ValueError``, so
+    analyses must modify the data through :py:meth:`PlantData.view`, which only copies the
+    modified columns with pandas' copy-on-write mode. Replacing or adding columns, or replacing
+    whole data frames, works as usual.
+
+    Each snapshot is written to a new subdirectory, and the ``current`` file pointing to it is
+    replaced atomically, so that processes attach either to the previous or the new snapshot, and
+    can check whether a newer snapshot was published with :py:meth:`is_current`. The snapshot
+    files are pickled, so the directory should only be writable by trusted users.
+
+    Args:
+        path (str | Path): The snapshot directory.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).resolve()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.snapshot_id: str | None = None
+        self._stamp: tuple[int, int] | None = None
+
+    def _current_stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path / _CURRENT)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Holds an exclusive lock on the snapshot directory across processes, so that only one
+        process builds the snapshot while the others wait to attach to it."""
+        if sys.platform == "win32":
+            raise NotImplementedError("Plant snapshots are not supported on Windows")
+        import fcntl
+
+        with open(self.path / _LOCK, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def is_current(self) -> bool:
+        """Checks if the attached snapshot is still the most recently published one."""
+        return self._stamp is not None and self._stamp == self._current_stamp()
+
+    def publish(self, plant: PlantData, fingerprint: str, source: str) -> None:
+        """Writes :py:attr:`plant` to a new snapshot, makes it the current snapshot, and removes
+        the previous snapshots, whose files stay available to the processes that mapped them.
+
+        Args:
+            plant (PlantData): The plant data.
+            fingerprint (str): The plant data's fingerprint, see ``plant_loader.plant_fingerprint``.
+            source (str): A key of the source of the data, such as its path and modification
+                times, which :py:meth:`attach` compares to decide if the snapshot is up to date.
+        """
+        snapshot_id = uuid4().hex
+        directory = self.path / f"{snapshot_id}.tmp"
+
+        # The data frames are stored separately, and the rest of the plant is pickled
+        skeleton = copy.copy(plant)
+        frames = {}
+        for name in _FRAMES:
+            df = getattr(plant, name)
+            if df is not None:
+                frames[name] = _write_frame(df, directory / name)
+            object.__setattr__(skeleton, name, None)
+        reanalysis = {}
+        for product, df in (plant.reanalysis or {}).items():
+            reanalysis[product] = _write_frame(df, directory / f"reanalysis-{product}")
+        object.__setattr__(skeleton, "reanalysis", None if plant.reanalysis is None else {})
+        object.__setattr__(skeleton, "_cache", {})
+
+        info = {
+            "skeleton": skeleton,
+            "frames": frames,
+            "reanalysis": reanalysis,
+            "fingerprint": fingerprint,
+            "source": source,
+        }
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / _INFO, "wb") as f:
+            pickle.dump(info, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(directory, self.path / snapshot_id)
+
+        pointer = self.path / f"{_CURRENT}.{snapshot_id}.tmp"
+        pointer.write_text(snapshot_id)
+        os.replace(pointer, self.path / _CURRENT)
+
+        for old in self.path.iterdir():
+            if old.is_dir() and old.name != snapshot_id:
+                shutil.rmtree(old, ignore_errors=True)
+
+    def attach(self, source: str | None = None) -> tuple[PlantData, str] | None:
+        """Attaches to the current snapshot.
+
+        Args:
+            source (str | None, optional): The expected source key of the snapshot, or None to
+                attach to the current snapshot regardless of its source. Defaults to None.
+
+        Returns:
+            tuple[PlantData, str] | None: The plant data and its fingerprint, or None if there is
+                no snapshot, or if it was created from a different source.
+        """
+        stamp = self._current_stamp()
+        if stamp is None:
+            return None
+        snapshot_id = (self.path / _CURRENT).read_text().strip()
+        directory = self.path / snapshot_id
+        try:
+            with open(directory / _INFO, "rb") as f:
+                info = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        if source is not None and info["source"] != source:
+            return None
+
+        plant = info["skeleton"]
+        for name, spec in info["frames"].items():
+            object.__setattr__(plant, name, _read_frame(spec, directory / name))
+        if info["reanalysis"]:
+            reanalysis = {
+                product: _read_frame(spec, directory / f"reanalysis-{product}")
+                for product, spec in info["reanalysis"].items()
+            }
+            object.__setattr__(plant, "reanalysis", reanalysis)
+
+        self.snapshot_id = snapshot_id
+        self._stamp = stamp
+        return plant, info["fingerprint"]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import threading
+
+from openoa.utils.power_curve import PowerCurveRegistry
+
+from backend.app.config import settings
+from backend.app.services.plant_loader import repo_root
+
+
+_lock = threading.Lock()
+_registry: PowerCurveRegistry | None = None
+
+
+def get_power_curve_registry() -> PowerCurveRegistry:
+    global _registry
+    with _lock:
+        if _registry is None:
+            _registry = PowerCurveRegistry(
+                settings.resolve_power_curve_cache_path(repo_root()),
+                max_entries=settings.power_curve_cache_max_entries,
+            )
+        return _registry
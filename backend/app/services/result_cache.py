@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from backend.app.config import settings
+from backend.app.services.plant_loader import repo_root
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Two-tier cache of analysis results.
+
+    Both tiers hold each entry as a zlib-compressed pickle. The first tier is an in-memory LRU
+    bounded by the total size of the compressed entries, which are unpickled on every hit, so
+    that the bound is the memory actually used and callers never share a cached object. The
+    second tier is a directory with one file per entry, bounded by its total size on disk, that
+    survives restarts. Entries older than ``ttl_seconds`` are treated as misses
+    and removed. Entries are pickled, so the cache directory should only be shared with trusted
+    users.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        memory_max_bytes: int | None = 256 * 2**20,
+        disk_max_bytes: int | None = 2 * 2**30,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self.path = Path(path).resolve()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._memory_bytes = 0
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{sha256(key.encode('utf-8')).hexdigest()}.pkl.z"
+
+    def _entries(self) -> list[Path]:
+        return list(self.path.glob("*.pkl.z"))
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    def get(self, key: str, default: Any = None) -> Any:
+        payload = None
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created, payload = entry
+                if self._expired(created):
+                    self._forget(key)
+                    payload = None
+                else:
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+        if payload is not None:
+            self._touch(self._entry_path(key))
+            return pickle.loads(zlib.decompress(payload))[2]
+
+        entry = self._load(key)
+        with self._lock:
+            if entry is None:
+                self._counters["misses"] += 1
+                return default
+            created, payload, value = entry
+            self._counters["disk_hits"] += 1
+            self._remember(key, created, payload)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[0]):
+                return True
+        return self._entry_path(key).is_file()
+
+    def put(self, key: str, value: Any) -> None:
+        created = time.time()
+        try:
+            payload = zlib.compress(pickle.dumps((created, key, value), pickle.HIGHEST_PROTOCOL))
+        except Exception as exc:  # noqa: disable=E722
+            logger.warning(f"Not caching the unserializable result of {key}: {exc}")
+            return
+
+        with self._lock:
+            self._remember(key, created, payload)
+
+        # Write to a temporary file first, so readers never see a partially written entry
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False) as f:
+            f.write(payload)
+        os.replace(f.name, self._entry_path(key))
+        self.evict()
+
+    def _load(self, key: str) -> tuple[float, bytes, Any] | None:
+        fn = self._entry_path(key)
+        try:
+            with open(fn, "rb") as f:
+                payload = f.read()
+            created, stored_key, value = pickle.loads(zlib.decompress(payload))
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: disable=E722
+            logger.warning(f"Removing the unreadable result cache entry: {fn}")
+            fn.unlink(missing_ok=True)
+            return None
+
+        if stored_key != key:
+            return None
+        if self._expired(created):
+            fn.unlink(missing_ok=True)
+            with self._lock:
+                self._counters["expirations"] += 1
+            return None
+
+        self._touch(fn)
+        return created, payload, value
+
+    @staticmethod
+    def _touch(fn: Path) -> None:
+        # Mark the entry as recently used, including when it is served from memory, so that the
+        # most used entries are the last to be evicted from the disk
+        try:
+            os.utime(fn)
+        except FileNotFoundError:
+            pass
+
+    def _remember(self, key: str, created: float, payload: bytes) -> None:
+        size = len(payload)
+        if self.memory_max_bytes is not None and size > self.memory_max_bytes:
+            return
+        self._forget(key)
+        self._memory[key] = (created, payload)
+        self._memory_bytes += size
+        while self.memory_max_bytes is not None and self._memory_bytes > self.memory_max_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._counters["memory_evictions"] += 1
+
+    def _forget(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry[1])
+
+    def evict(self) -> None:
+        """Removes the expired entries on disk, then the least recently used entries until the
+        total size is within ``disk_max_bytes``.
+        """
+        entries = []
+        for fn in self._entries():
+            try:
+                stat = fn.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fn))
+        entries.sort(key=lambda x: x[0])
+
+        n_bytes = sum(size for _, size, _ in entries)
+        evicted = 0
+        for mtime, size, fn in entries:
+            # Entries are rewritten when they are created, so an entry that has not been used
+            # within the TTL must have been created before it
+            stale = self.ttl_seconds is not None and time.time() - mtime > self.ttl_seconds
+            too_large = self.disk_max_bytes is not None and n_bytes > self.disk_max_bytes
+            if not (stale or too_large):
+                break
+            fn.unlink(missing_ok=True)
+            n_bytes -= size
+            evicted += 1
+
+        with self._lock:
+            self._counters["disk_evictions"] += evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        for fn in self._entries():
+            fn.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        disk_bytes = 0
+        disk_entries = 0
+        for fn in self._entries():
+            try:
+                disk_bytes += fn.stat().st_size
+            except FileNotFoundError:
+                continue
+            disk_entries += 1
+
+        with self._lock:
+            return {
+                **self._counters,
+                "hits": self._counters["memory_hits"] + self._counters["disk_hits"],
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": disk_entries,
+                "disk_bytes": disk_bytes,
+            }
+
+
+_lock = threading.Lock()
+_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache:
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = ResultCache(
+                settings.resolve_result_cache_path(repo_root()),
+                memory_max_bytes=settings.result_cache_memory_bytes,
+                disk_max_bytes=settings.result_cache_disk_bytes,
+                ttl_seconds=settings.result_cache_ttl_seconds or None,
+            )
+        return _cache
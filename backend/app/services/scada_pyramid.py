@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import threading
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from openoa.plant import PlantData
+from pandas.tseries.offsets import BaseOffset, Tick
+
+from backend.app.services.plant_loader import get_plant
+
+
+# How each column is combined across the turbines for the plant-wide series
+SCADA_COLUMNS = {
+    "WTUR_W": "sum",
+    "WMET_HorWdSpd": "mean",
+    "WMET_HorWdDir": "mean",
+    "WMET_EnvTmp": "mean",
+}
+
+# The levels above the SCADA frequency, which all use bins starting at the Unix epoch, so that
+# each level's bins are made up of whole bins of the finer levels
+PYRAMID_LEVELS = ("1h", "1D", "7D")
+
+# How each statistic of the finer level's bins is combined into the coarser level's bins
+_STATISTICS = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+# Frequencies that pandas resamples with bins closed on the right, see ``pd.DataFrame.resample``
+_RIGHT_CLOSED = {"ME", "YE", "QE", "BME", "BYE", "BQE", "W"}
+
+_DAY = pd.Timedelta("1D").value
+_EPOCH = pd.Timestamp(0)
+
+_lock = threading.Lock()
+_pyramid: ScadaPyramid | None = None
+_plant: PlantData | None = None
+_scada: pd.DataFrame | None = None
+
+
+def _drop_empty(stats: pd.DataFrame) -> pd.DataFrame:
+    return stats.loc[stats["count"].sum(axis=1) > 0]
+
+
+def _rollup(df: pd.DataFrame, freq: BaseOffset) -> pd.DataFrame:
+    """Computes the sum, count, minimum, and maximum of each column of ``df`` per bin."""
+    resampler = df.astype(float).resample(freq, origin="epoch")
+    return _drop_empty(
+        pd.concat({stat: getattr(resampler, stat)() for stat in _STATISTICS}, axis=1)
+    )
+
+
+def _combine(
+    stats: pd.DataFrame, freq: BaseOffset, origin: str | pd.Timestamp = "epoch"
+) -> pd.DataFrame:
+    """Combines the statistics from :py:func:`_rollup` into the bins of a coarser ``freq``."""
+    return _drop_empty(
+        pd.concat(
+            {
+                stat: stats[stat].resample(freq, origin=origin).agg(how)
+                for stat, how in _STATISTICS.items()
+            },
+            axis=1,
+        )
+    )
+
+
+class ScadaPyramid:
+    """Time-bucketed sums, counts, minimums, and maximums of the SCADA data, per turbine and for
+    the plant, at the SCADA frequency and at each of the coarser :py:data:`PYRAMID_LEVELS`.
+
+    A query for any date range and frequency slices the coarsest level that the requested bins are
+    made up of, and only recomputes the partially included bins at the edges of the date range from
+    the finest level, so its cost depends on the length of the date range in that level's bins
+    instead of on the length of the data. The results are the same as resampling the SCADA data,
+    assuming its timestamps are on the grid of the SCADA frequency.
+    """
+
+    def __init__(self, scada: pd.DataFrame, frequency: str) -> None:
+        self.frequency = to_offset(frequency)
+        coarser = [to_offset(level) for level in PYRAMID_LEVELS]
+        self.levels = [self.frequency] + [
+            level for level in coarser if level.nanos > self.frequency.nanos
+        ]
+        self.end: pd.Timestamp | None = None
+        self.n_rows = 0
+        self._stats: dict[str | None, list[pd.DataFrame]] = {}
+        self.append(scada)
+
+    @property
+    def turbine_ids(self) -> list[str]:
+        return [turbine_id for turbine_id in self._stats if turbine_id is not None]
+
+    def append(self, scada: pd.DataFrame) -> None:
+        """Adds new SCADA data, which must start after the end of the existing data, and only
+        recomputes the last bin of each level.
+
+        Args:
+            scada (pd.DataFrame): The new SCADA data, with a ("time", "asset_id") index.
+
+        Raises:
+            ValueError: Raised if :py:attr:`scada` starts at or before the end of the existing data.
+        """
+        if scada.empty:
+            return
+        times = scada.index.get_level_values("time")
+        if self.end is not None and times.min() <= self.end:
+            raise ValueError(
+                f"The new SCADA data must start after the end of the existing data: {self.end}"
+            )
+
+        columns = [column for column in SCADA_COLUMNS if column in scada.columns]
+        scada = scada[columns]
+        new = {None: scada.groupby(level="time").agg({c: SCADA_COLUMNS[c] for c in columns})}
+        new.update(
+            (str(turbine_id), df.droplevel("asset_id"))
+            for turbine_id, df in scada.groupby(level="asset_id")
+        )
+        for key, df in new.items():
+            self._extend(key, df.sort_index())
+
+        self.end = times.max() if self.end is None else max(self.end, times.max())
+        self.n_rows += len(scada)
+
+    def _extend(self, key: str | None, df: pd.DataFrame) -> None:
+        base = _rollup(df, self.frequency)
+        if key not in self._stats:
+            self._stats[key] = [base] + [_combine(base, level) for level in self.levels[1:]]
+            return
+
+        stats = self._stats[key]
+        stats[0] = pd.concat([stats[0], base])
+        for i, level in enumerate(self.levels[1:], start=1):
+            # Only the last bin of the coarser levels can include both old and new data
+            cut = base.index[0].floor(level)
+            tail = _combine(stats[i - 1].loc[cut:], level)
+            stats[i] = pd.concat([stats[i].loc[: cut - pd.Timedelta(1)], tail])
+
+    def _select_level(self, freq: BaseOffset, origin: pd.Timestamp) -> int:
+        if isinstance(freq, Tick):
+            # The requested bins start at midnight of the first day, like ``resample`` does
+            aligned = [
+                freq.nanos % level.nanos == 0 and (origin - _EPOCH).value % level.nanos == 0
+                for level in self.levels
+            ]
+        elif freq.rule_code.split("-")[0] in _RIGHT_CLOSED:
+            # Bins that include their end don't align with the levels' bins
+            return 0
+        else:
+            aligned = [_DAY % level.nanos == 0 for level in self.levels]
+        return max((i for i, is_aligned in enumerate(aligned) if is_aligned), default=0)
+
+    def query(
+        self,
+        turbine_id: str | None = None,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+        freq: str = "1h",
+        how: str = "mean",
+    ) -> pd.DataFrame:
+        """Returns the SCADA data resampled to :py:attr:`freq`, like
+        ``df.loc[start:end].resample(freq)`` followed by the aggregation in :py:attr:`how`.
+
+        Args:
+            turbine_id (str | None, optional): The turbine to return, or None for the plant-wide
+                data, which sums the power and averages the other columns across the turbines.
+                Defaults to None.
+            start (pd.Timestamp | None, optional): The first timestamp to include. Defaults to None.
+            end (pd.Timestamp | None, optional): The last timestamp to include. Defaults to None.
+            freq (str, optional): The resampling frequency. Defaults to "1h".
+            how (str, optional): One of "mean", "sum", "min", "max", or "count". Defaults to
+                "mean".
+
+        Raises:
+            KeyError: Raised if :py:attr:`turbine_id` is not in the SCADA data.
+            ValueError: Raised if :py:attr:`freq` is not a valid frequency.
+
+        Returns:
+            pd.DataFrame: The resampled data, without any bins that have no data.
+        """
+        if how not in ("mean", *_STATISTICS):
+            raise ValueError(f"Invalid aggregation: {how}")
+        offset = to_offset(freq)
+        stats = self._stats[turbine_id]
+
+        index = stats[0].index
+        lo = 0 if start is None else index.searchsorted(start, side="left")
+        hi = len(index) if end is None else index.searchsorted(end, side="right")
+        if lo >= hi:
+            return pd.DataFrame(
+                columns=list(SCADA_COLUMNS), index=pd.DatetimeIndex([], name="time")
+            )
+
+        origin = index[lo].normalize()
+        level = self._select_level(offset, origin)
+        if level == 0:
+            result = _combine(stats[0].iloc[lo:hi], offset, origin)
+        else:
+            first = None if start is None else start.floor(self.levels[level])
+            result = _combine(stats[level].loc[first:end], offset, origin)
+
+            # The bins at the edges of the date range may only be partially included, so they are
+            # recomputed from the finest level
+            if start is not None or end is not None:
+                for label in {result.index[0], result.index[-1]}:
+                    a = max(lo, index.searchsorted(label, side="left"))
+                    b = min(hi, index.searchsorted(label + offset, side="left"))
+                    edge = _combine(stats[0].iloc[a:b], offset, origin)
+                    if label in edge.index:
+                        result.loc[label] = edge.loc[label]
+                    else:
+                        result = result.drop(index=label)
+
+        counts = result["count"]
+        if how == "mean":
+            values = result["sum"] / counts.where(counts > 0)
+        elif how == "count":
+            values = counts
+        else:
+            values = result[how].where(counts > 0)
+        values.index.name = "time"
+        return values.reindex(columns=list(SCADA_COLUMNS)).dropna(how="all")
+
+
+def get_scada_pyramid() -> ScadaPyramid:
+    """Returns the SCADA pyramid of the loaded plant data, which is built on first use, extended
+    when SCADA data is appended to the plant, and rebuilt when the plant data is reloaded."""
+    global _pyramid, _plant, _scada
+    plant = get_plant()
+    with _lock:
+        scada = plant.scada
+        if _pyramid is not None and plant is _plant:
+            if scada is _scada:
+                return _pyramid
+
+            # ``PlantData.append`` only adds data after the end of the existing data
+            if _pyramid.end is not None:
+                new = scada.loc[scada.index.get_level_values("time") > _pyramid.end]
+                if len(scada) - len(new) == _pyramid.n_rows:
+                    _pyramid.append(new)
+                    _scada = scada
+                    return _pyramid
+
+        _pyramid = ScadaPyramid(scada, plant.metadata.scada.frequency)
+        _plant = plant
+        _scada = scada
+        return _pyramid
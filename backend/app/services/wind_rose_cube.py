@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+from openoa.plant import PlantData
+
+from backend.app.services.plant_loader import get_plant
+
+
+WIND_ROSE_COLUMNS = ["WMET_HorWdDir", "WMET_HorWdSpd"]
+
+_lock = threading.Lock()
+_cube: WindRoseCube | None = None
+_plant: PlantData | None = None
+_scada: pd.DataFrame | None = None
+
+
+class WindRoseCube:
+    """Wind direction and speed histograms of the SCADA data, per turbine and for the plant, on a
+    fine base grid, that answer wind rose queries for any date range and any bins on the grid.
+
+    Each sample's cell on the base grid is stored in time order, together with the cumulative
+    histogram of the samples before every :py:attr:`checkpoint_size`-th sample. The histogram of a
+    date range is the difference of the cumulative histograms at the checkpoints inside the range,
+    plus the cells of the fewer than :py:attr:`checkpoint_size` samples between each end of the
+    range and its nearest checkpoint, so its cost doesn't depend on the length of the data. The
+    requested bins are then summed from the base grid's cells.
+
+    Speeds that are exactly on a grid edge have their own cell, so that the requested histograms
+    match ``np.histogram2d``, whose last speed bin includes its right edge.
+
+    Args:
+        scada (pd.DataFrame): The SCADA data, with a ("time", "asset_id") index.
+        direction_resolution (float, optional): The width of the base grid's direction bins, in
+            degrees. Defaults to 1.
+        speed_resolution (float, optional): The width of the base grid's speed bins, in m/s.
+            Defaults to 0.5.
+        max_speed (float, optional): The last edge of the base grid's speed bins, in m/s. Defaults
+            to 40.
+        checkpoint_size (int, optional): The number of samples between the cumulative histograms.
+            Defaults to 65536.
+    """
+
+    def __init__(
+        self,
+        scada: pd.DataFrame,
+        direction_resolution: float = 1.0,
+        speed_resolution: float = 0.5,
+        max_speed: float = 40.0,
+        checkpoint_size: int = 65536,
+    ) -> None:
+        self.direction_edges = np.arange(0, 360 / direction_resolution + 1) * direction_resolution
+        self.speed_edges = np.arange(0, max_speed / speed_resolution + 1) * speed_resolution
+        self.checkpoint_size = checkpoint_size
+
+        # Speed class 2k is exactly on edge k, and 2k + 1 is between edges k and k + 1
+        self.n_speed_classes = 2 * self.speed_edges.size - 1
+        self.n_cells = (self.direction_edges.size - 1) * self.n_speed_classes
+        self.end: pd.Timestamp | None = None
+        self.n_rows = 0
+
+        self._times: dict[str | None, np.ndarray] = {}
+        self._cells: dict[str | None, np.ndarray] = {}
+        self._cumulative: dict[str | None, np.ndarray] = {}
+        self.append(scada)
+
+    @property
+    def turbine_ids(self) -> list[str]:
+        return [turbine_id for turbine_id in self._times if turbine_id is not None]
+
+    def _to_cells(self, directions: np.ndarray, speeds: np.ndarray) -> np.ndarray:
+        # Cells past the grid are counted as valid samples outside the grid, and samples with
+        # missing values are counted separately from those
+        directions = np.mod(directions, 360.0)
+        direction_bin = np.searchsorted(self.direction_edges, directions, side="right") - 1
+        speed_edge = np.searchsorted(self.speed_edges, speeds, side="right") - 1
+        on_grid = (speed_edge >= 0) & (speed_edge < self.speed_edges.size)
+        speed_edge = np.clip(speed_edge, 0, self.speed_edges.size - 1)
+        on_edge = self.speed_edges[speed_edge] == speeds
+        speed_class = 2 * speed_edge + ~on_edge
+        on_grid &= speed_class < self.n_speed_classes
+
+        cells = direction_bin * self.n_speed_classes + speed_class
+        cells = np.where(on_grid, cells, self.n_cells)
+        cells = np.where(np.isnan(directions) | np.isnan(speeds), self.n_cells + 1, cells)
+        return cells.astype(np.int32)
+
+    def _histogram(self, cells: np.ndarray) -> np.ndarray:
+        return np.bincount(cells, minlength=self.n_cells + 2).astype(np.int32)
+
+    def append(self, scada: pd.DataFrame) -> None:
+        """Adds new SCADA data, which must start after the end of the existing data.
+
+        Args:
+            scada (pd.DataFrame): The new SCADA data, with a ("time", "asset_id") index.
+
+        Raises:
+            ValueError: Raised if :py:attr:`scada` starts at or before the end of the existing data.
+        """
+        if scada.empty:
+            return
+        times = scada.index.get_level_values("time")
+        if self.end is not None and times.min() <= self.end:
+            raise ValueError(
+                f"The new SCADA data must start after the end of the existing data: {self.end}"
+            )
+
+        scada = scada[WIND_ROSE_COLUMNS]
+        new = {None: scada.groupby(level="time").mean()}
+        new.update(
+            (str(turbine_id), df.droplevel("asset_id"))
+            for turbine_id, df in scada.groupby(level="asset_id")
+        )
+        for key, df in new.items():
+            df = df.sort_index()
+            directions = df["WMET_HorWdDir"].to_numpy(dtype=float)
+            cells = self._to_cells(directions, df["WMET_HorWdSpd"].to_numpy(dtype=float))
+            self._extend(key, df.index.asi8, cells)
+
+        self.end = times.max() if self.end is None else max(self.end, times.max())
+        self.n_rows += len(scada)
+
+    def _extend(self, key: str | None, times: np.ndarray, cells: np.ndarray) -> None:
+        if key in self._times:
+            times = np.concatenate([self._times[key], times])
+            cells = np.concatenate([self._cells[key], cells])
+            cumulative = [*self._cumulative[key]]
+        else:
+            cumulative = [np.zeros(self.n_cells + 2, dtype=np.int32)]
+
+        # Only the checkpoints after the previous end of the data are computed
+        for k in range(len(cumulative), cells.size // self.checkpoint_size + 1):
+            chunk = cells[(k - 1) * self.checkpoint_size : k * self.checkpoint_size]
+            cumulative.append(cumulative[-1] + self._histogram(chunk))
+
+        self._times[key] = times
+        self._cells[key] = cells
+        self._cumulative[key] = np.stack(cumulative)
+
+    def _counts(self, key: str | None, lo: int, hi: int) -> np.ndarray:
+        size = self.checkpoint_size
+        cells = self._cells[key]
+        first = -(-lo // size)
+        last = hi // size
+        if first >= last:
+            return self._histogram(cells[lo:hi])
+
+        cumulative = self._cumulative[key]
+        return (
+            cumulative[last]
+            - cumulative[first]
+            + self._histogram(cells[lo : first * size])
+            + self._histogram(cells[last * size : hi])
+        )
+
+    def query(
+        self,
+        turbine_id: str | None,
+        start: pd.Timestamp | None,
+        end: pd.Timestamp | None,
+        direction_edges: np.ndarray,
+        speed_edges: np.ndarray,
+    ) -> tuple[np.ndarray, int]:
+        """Returns the wind direction and speed histogram between :py:attr:`start` and
+        :py:attr:`end`, like ``np.histogram2d(directions % 360, speeds, [direction_edges,
+        speed_edges])``.
+
+        Args:
+            turbine_id (str | None): The turbine to return, or None for the plant, which averages
+                the directions and speeds across the turbines.
+            start (pd.Timestamp | None): The first timestamp to include.
+            end (pd.Timestamp | None): The last timestamp to include.
+            direction_edges (np.ndarray): The direction bin edges, from 0 to 360.
+            speed_edges (np.ndarray): The increasing speed bin edges.
+
+        Raises:
+            KeyError: Raised if :py:attr:`turbine_id` is not in the SCADA data.
+            ValueError: Raised if any of the bin edges are not edges of the base grid.
+
+        Returns:
+            tuple[np.ndarray, int]: The (direction x speed) histogram, and the number of samples
+                with both a direction and a speed, including those outside of the bins.
+        """
+        if (
+            direction_edges[0] != 0
+            or direction_edges[-1] != 360
+            or not np.isin(direction_edges, self.direction_edges).all()
+            or not np.isin(speed_edges, self.speed_edges).all()
+        ):
+            raise ValueError("The bin edges are not on the wind rose base grid")
+        direction_index = np.searchsorted(self.direction_edges, direction_edges)
+        speed_index = np.searchsorted(self.speed_edges, speed_edges)
+
+        times = self._times[turbine_id]
+        lo = 0 if start is None else np.searchsorted(times, start.value, side="left")
+        hi = times.size if end is None else np.searchsorted(times, end.value, side="right")
+        counts = self._counts(turbine_id, lo, hi)
+        n_valid = int(counts[: self.n_cells + 1].sum())
+
+        grid = counts[: self.n_cells].reshape(-1, self.n_speed_classes)
+
+        # Sum the base grid's direction bins, then the speed classes from the exact lower edge up
+        # to the upper edge, which is only included in the last bin
+        grid = np.add.reduceat(grid, direction_index[:-1], axis=0)
+        classes = np.zeros((grid.shape[0], grid.shape[1] + 1), dtype=np.int64)
+        classes[:, 1:] = grid.cumsum(axis=1)
+        upper = 2 * speed_index[1:]
+        upper[-1] += 1
+        histogram = classes[:, upper] - classes[:, 2 * speed_index[:-1]]
+        return histogram.astype(float), n_valid
+
+
+def get_wind_rose_cube() -> WindRoseCube:
+    """Returns the wind rose cube of the loaded plant data, which is built on first use, extended
+    when SCADA data is appended to the plant, and rebuilt when the plant data is reloaded."""
+    global _cube, _plant, _scada
+    plant = get_plant()
+    with _lock:
+        scada = plant.scada
+        if _cube is not None and plant is _plant:
+            if scada is _scada:
+                return _cube
+
+            # ``PlantData.append`` only adds data after the end of the existing data
+            if _cube.end is not None:
+                new = scada.loc[scada.index.get_level_values("time") > _cube.end]
+                if len(scada) - len(new) == _cube.n_rows:
+                    _cube.append(new)
+                    _scada = scada
+                    return _cube
+
+        _cube = WindRoseCube(scada)
+        _plant = plant
+        _scada = scada
+        return _cube
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import tempfile
+import threading
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.managers import SyncManager
+from pathlib import Path
+from typing import Any, Callable
+
+from fastapi import HTTPException
+
+from backend.app.config import settings
+from backend.app.services.plant_loader import get_plant, load_plant, plant_fingerprint, set_plant
+
+
+class WorkerHTTPException(Exception):
+    """Carries an ``HTTPException`` raised in a worker back to the server process, since
+    ``HTTPException`` cannot be pickled."""
+
+    def __init__(self, status_code: int, detail: Any) -> None:
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_fingerprint: str | None = None
+_snapshot_path: Path | None = None
+_manager: SyncManager | None = None
+
+
+def _initialize_worker(snapshot_path: str | None, fingerprint: str) -> None:
+    if snapshot_path is None:
+        # The workers attach to the shared plant snapshot instead
+        load_plant()
+        return
+    with open(snapshot_path, "rb") as f:
+        plant = pickle.load(f)
+    set_plant(plant, fingerprint)
+
+
+def _call(fn: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+    try:
+        return fn(*args)
+    except HTTPException as exc:
+        raise WorkerHTTPException(exc.status_code, exc.detail) from None
+
+
+def _shutdown_pool() -> None:
+    global _pool, _pool_fingerprint, _snapshot_path
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    if _snapshot_path is not None:
+        _snapshot_path.unlink(missing_ok=True)
+    _pool = None
+    _pool_fingerprint = None
+    _snapshot_path = None
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    global _pool, _pool_fingerprint, _snapshot_path
+    plant = get_plant()
+    fingerprint = plant_fingerprint()
+    with _lock:
+        if _pool is not None and _pool_fingerprint == fingerprint:
+            return _pool
+
+        # The plant data was reloaded, so the workers' copies are out of date
+        _shutdown_pool()
+
+        # Workers load a snapshot of the plant data once when they start, instead of preparing
+        # the data again or receiving it with every analysis
+        if not settings.plant_snapshot_path:
+            with tempfile.NamedTemporaryFile(
+                prefix="openoa-plant-", suffix=".pkl", delete=False
+            ) as f:
+                pickle.dump(plant, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _snapshot_path = Path(f.name)
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.analysis_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(None if _snapshot_path is None else str(_snapshot_path), fingerprint),
+        )
+        _pool_fingerprint = fingerprint
+        return _pool
+
+
+def run_analysis(fn: Callable[..., Any], *args: Any) -> Any:
+    """Runs ``fn(*args)`` in the worker pool, or in the calling thread when the pool is disabled
+    with ``OPENOA_ANALYSIS_WORKERS=0``. ``fn`` and ``args`` must be picklable, and ``fn`` gets the
+    plant data from ``get_plant``."""
+    if settings.analysis_workers <= 0:
+        return fn(*args)
+
+    pool = get_worker_pool()
+    try:
+        return pool.submit(_call, fn, args).result()
+    except WorkerHTTPException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail) from None
+    except BrokenProcessPool:
+        # A worker died, e.g., from running out of memory, so start over with a new pool
+        with _lock:
+            if _pool is pool:
+                _shutdown_pool()
+        raise
+
+
+def create_shared_state() -> tuple[MutableMapping[str, Any], Any]:
+    """Creates a dictionary and an event that an analysis can update and check while it runs, which
+    are shared through a multiprocessing manager when the analyses run in the worker pool."""
+    global _manager
+    if settings.analysis_workers <= 0:
+        return {}, threading.Event()
+    with _lock:
+        if _manager is None:
+            _manager = multiprocessing.get_context("spawn").Manager()
+        return _manager.dict(), _manager.Event()
+
+
+def shutdown_worker_pool() -> None:
+    global _manager
+    with _lock:
+        _shutdown_pool()
+        if _manager is not None:
+            _manager.shutdown()
+            _manager = None
@@ -113,7 +113,9 @@ def clean_scada(scada_file: str | Path) -> pd.DataFrame:
     return scada_df
 
 
-def load_cleansed_data(path: str | Path, return_value="plantdata") -> PlantData:
+def load_cleansed_data(
+    path: str | Path, return_value="plantdata", compact: bool = False
+) -> PlantData:
     """Loads the already created data in `path`/cleansed, if previously parsed.
 
     Args:
@@ -121,6 +123,8 @@ def load_cleansed_data(path: str | Path, return_value="plantdata") -> PlantData:
             "data/la_haute_borne".
         return_value (str, optional): "plantdata" will return a fully constructed PlantData object.
             "dataframes" will return a list of dataframes instead. Defaults to "plantdata".
+        compact (bool, optional): Store the PlantData time series in compact data types. Defaults
+            to False.
 
     Returns:
         PlantData | tuple[pandas.DataFrame, ...]
@@ -150,6 +154,7 @@ def load_cleansed_data(path: str | Path, return_value="plantdata") -> PlantData:
             curtail=curtail_df,
             asset=asset_df,
             reanalysis=reanalysis,
+            compact=compact,
         )
         return engie_plantdata
     else:
@@ -157,7 +162,10 @@ def load_cleansed_data(path: str | Path, return_value="plantdata") -> PlantData:
 
 
 def prepare(
-    path: str | Path = "data/la_haute_borne", return_value="plantdata", use_cleansed: bool = False
+    path: str | Path = "data/la_haute_borne",
+    return_value="plantdata",
+    use_cleansed: bool = False,
+    compact: bool = False,
 ):
     """
     Do all loading and preparation of the data for this plant.
@@ -166,6 +174,7 @@ def prepare(
     - scada_df (pandas.DataFrame): Override the scada dataframe with one provided by the user.
     - return_value (str): "plantdata" will return a fully constructed PlantData object. "dataframes" will return a list of dataframes instead.
     - use_cleansed (bool): Use previously prepared data if the the "cleansed" folder exists above the main `path`. Defaults to False.
+    - compact (bool): Store the PlantData time series in compact data types. Defaults to False.
     """
 
     if isinstance(path, str):
@@ -173,7 +182,7 @@ def prepare(
 
     # Load the pre-cleaned data, if available
     if use_cleansed and (path.parent / "cleansed").is_dir():
-        return load_cleansed_data(path=path.parent, return_value=return_value)
+        return load_cleansed_data(path=path.parent, return_value=return_value, compact=compact)
 
     # Extract data if necessary
     extract_data(path)
@@ -295,6 +304,7 @@ def prepare(
             curtail=curtail_df,
             asset=asset_df,
             reanalysis={"era5": reanalysis_era5_df, "merra2": reanalysis_merra2_df},
+            compact=compact,
         )
         return engie_plantdata
     else:
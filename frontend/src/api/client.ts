@@ -31,6 +31,15 @@ export type ScadaPoint = {
   temperature_c: number | null
 }
 
+export type DownsampleMethod = 'lttb' | 'minmax' | 'stride'
+
+export type ScadaColumns = {
+  turbine_id: string | null
+  resample: string
+  how: string
+  columns: { [K in keyof ScadaPoint]: ScadaPoint[K][] }
+}
+
 export type WindRoseSector = {
   direction_center_deg: number
   counts: number[]
@@ -88,26 +97,55 @@ export type YawResult = {
   }>
 }
 
+export type JobStatus = 'queued' | 'running' | 'completed' | 'failed' | 'cancelled'
+
 export type AepTask = {
   task_id: string
-  status: 'running' | 'completed' | 'failed'
+  status: JobStatus
+}
+
+export type AepResult = {
+  aep_mean_gwh: number
+  aep_p05_gwh: number
+  aep_p95_gwh: number
+  availability_mean_pct: number
+  curtailment_mean_pct: number
+  lt_por_ratio_mean: number
+  iterations_gwh: number[]
 }
 
 export type AepStatus = {
   task_id: string
-  status: 'running' | 'completed' | 'failed'
-  result: {
-    aep_mean_gwh: number
-    aep_p05_gwh: number
-    aep_p95_gwh: number
-    availability_mean_pct: number
-    curtailment_mean_pct: number
-    lt_por_ratio_mean: number
-    iterations_gwh: number[]
-  } | null
+  status: JobStatus
+  completed_iterations: number
+  total_iterations: number | null
+  result: AepResult | null
   error: string | null
 }
 
+export type IterationSummary = {
+  mean: number | null
+  p05: number | null
+  p95: number | null
+  n: number
+}
+
+export type Job<T> = {
+  job_id: string
+  analysis: string
+  status: JobStatus
+  completed_iterations: number
+  total_iterations: number | null
+  progress: number | null
+  eta_seconds: number | null
+  summary: Record<string, IterationSummary>
+  cancel_requested: boolean
+  result: T | null
+  error: string | null
+  created_at: string
+  updated_at: string
+}
+
 const API_BASE = import.meta.env.VITE_API_BASE ?? ''
 
 async function request<T>(path: string, init?: RequestInit): Promise<T> {
@@ -154,16 +192,27 @@ export const api = {
     start?: string
     end?: string
     resample?: string
+    how?: 'mean' | 'sum' | 'min' | 'max' | 'count'
+    downsample?: DownsampleMethod
+    max_points?: number
   }) => {
     const query = new URLSearchParams()
     if (params.turbine_id) query.set('turbine_id', params.turbine_id)
     if (params.start) query.set('start', params.start)
     if (params.end) query.set('end', params.end)
     if (params.resample) query.set('resample', params.resample)
-    return request<{ points: ScadaPoint[] }>(`/api/data/scada?${query.toString()}`)
+    if (params.how) query.set('how', params.how)
+    if (params.downsample) query.set('downsample', params.downsample)
+    if (params.max_points) query.set('max_points', String(params.max_points))
+    query.set('format', 'columnar')
+    return request<ScadaColumns>(`/api/data/scada?${query.toString()}`)
   },
 
-  runPowerCurve: (payload: { turbine_id: string; method: 'IEC' | 'logistic_5' | 'gam' }) =>
+  runPowerCurve: (payload: {
+    turbine_id: string
+    method: 'IEC' | 'logistic_5' | 'gam'
+    downsample?: DownsampleMethod
+  }) =>
     request<PowerCurveResponse>('/api/analysis/power-curve', {
       method: 'POST',
       body: JSON.stringify(payload)
@@ -209,5 +258,12 @@ export const api = {
       body: JSON.stringify(payload)
     }),
 
-  getAepStatus: (taskId: string) => request<AepStatus>(`/api/analysis/aep/status/${taskId}`)
+  getAepStatus: (taskId: string) => request<AepStatus>(`/api/analysis/aep/status/${taskId}`),
+
+  cancelJob: (jobId: string) =>
+    request<Job<unknown>>(`/api/analysis/jobs/${jobId}`, {
+      method: 'DELETE'
+    }),
+
+  jobEventsUrl: (jobId: string) => `${API_BASE}/api/analysis/jobs/${jobId}/events`
 }
@@ -1,7 +1,7 @@
 import { useEffect, useMemo, useState } from 'react'
 import { Bar, BarChart, ResponsiveContainer, Tooltip, XAxis, YAxis } from 'recharts'
 
-import { api, type AepStatus } from '../api/client'
+import { api, type AepResult, type Job } from '../api/client'
 import { ChartCard } from '../components/ChartCard'
 import { StatusBadge } from '../components/StatusBadge'
 
@@ -15,7 +15,7 @@ export function AEPAnalysis() {
     reg_wind_direction: false
   })
   const [taskId, setTaskId] = useState<string | null>(null)
-  const [status, setStatus] = useState<AepStatus | null>(null)
+  const [status, setStatus] = useState<Job<AepResult> | null>(null)
   const [error, setError] = useState<string | null>(null)
 
   const runAnalysis = async () => {
@@ -28,33 +28,44 @@ export function AEPAnalysis() {
     }
   }
 
+  const stopAnalysis = async () => {
+    if (!taskId) return
+    try {
+      await api.cancelJob(taskId)
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to stop AEP analysis')
+    }
+  }
+
   useEffect(() => {
     if (!taskId) return
 
-    let intervalId: number | null = null
-
-    const poll = async () => {
-      try {
-        const nextStatus = await api.getAepStatus(taskId)
-        setStatus(nextStatus)
-        if (nextStatus.status === 'completed' || nextStatus.status === 'failed') {
-          if (intervalId) window.clearInterval(intervalId)
-        }
-      } catch (err) {
-        setError(err instanceof Error ? err.message : 'Failed to poll AEP status')
-      }
+    // Follow the iterations and running statistics of the analysis as the server streams them
+    const source = new EventSource(api.jobEventsUrl(taskId))
+    const onProgress = (event: MessageEvent<string>) => {
+      setStatus(JSON.parse(event.data) as Job<AepResult>)
+    }
+    const onFinished = (event: MessageEvent<string>) => {
+      onProgress(event)
+      source.close()
     }
 
-    void poll()
-    intervalId = window.setInterval(() => {
-      void poll()
-    }, 2000)
-
-    return () => {
-      if (intervalId) window.clearInterval(intervalId)
+    source.addEventListener('progress', onProgress)
+    for (const name of ['completed', 'failed', 'cancelled']) {
+      source.addEventListener(name, onFinished)
     }
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        setError('Lost connection to the AEP analysis')
+      }
+    }
+
+    return () => source.close()
   }, [taskId])
 
+  // Before interannual variability, which is only applied once all iterations are done
+  const runningAep = status?.result ? null : status?.summary.aep_GWh ?? null
+
   const histogramData = useMemo(() => {
     const values = status?.result?.iterations_gwh ?? []
     return values.map((value, index) => ({ index: index + 1, aep: Number(value.toFixed(3)) }))
@@ -69,6 +80,9 @@ export function AEPAnalysis() {
         </div>
         <StatusBadge tone={status?.status === 'failed' ? 'error' : status?.status === 'completed' ? 'ok' : 'warn'}>
           {status?.status ?? 'idle'}
+          {status?.status === 'running' && status.total_iterations
+            ? ` ${status.completed_iterations}/${status.total_iterations}`
+            : ''}
         </StatusBadge>
       </header>
 
@@ -125,6 +139,12 @@ export function AEPAnalysis() {
         <button className="button-primary" onClick={() => void runAnalysis()}>
           Run Analysis
         </button>
+
+        {status?.status === 'queued' || status?.status === 'running' ? (
+          <button onClick={() => void stopAnalysis()} disabled={status.cancel_requested}>
+            Stop
+          </button>
+        ) : null}
       </section>
 
       {error ? <p className="error-text">{error}</p> : null}
@@ -157,6 +177,23 @@ export function AEPAnalysis() {
                 <strong>{status.result.lt_por_ratio_mean.toFixed(3)}</strong>
               </div>
             </div>
+          ) : runningAep ? (
+            <div className="stats-stack">
+              <div className="stat-line">
+                <span>Running AEP Mean</span>
+                <strong>{runningAep.mean?.toFixed(3) ?? '-'} GWh</strong>
+              </div>
+              <div className="stat-line">
+                <span>Running P05 / P95</span>
+                <strong>
+                  {runningAep.p05?.toFixed(3) ?? '-'} / {runningAep.p95?.toFixed(3) ?? '-'} GWh
+                </strong>
+              </div>
+              <div className="stat-line">
+                <span>Remaining</span>
+                <strong>{status?.eta_seconds != null ? `${Math.ceil(status.eta_seconds)} s` : '-'}</strong>
+              </div>
+            </div>
           ) : (
             <p className="muted-text">Submit analysis to populate results.</p>
           )}
@@ -1,7 +1,7 @@
 import { useEffect, useMemo, useState } from 'react'
 import { Line, LineChart, ResponsiveContainer, Tooltip, XAxis, YAxis } from 'recharts'
 
-import { api, type ScadaPoint, type TurbineInfo, type WindRoseResponse } from '../api/client'
+import { api, type ScadaColumns, type TurbineInfo, type WindRoseResponse } from '../api/client'
 import { ChartCard } from '../components/ChartCard'
 import { LoadingSpinner } from '../components/LoadingSpinner'
 import { WindRose } from '../components/WindRose'
@@ -15,7 +15,7 @@ export function DataExplorer() {
   const [draftStart, setDraftStart] = useState('')
   const [draftEnd, setDraftEnd] = useState('')
 
-  const [scada, setScada] = useState<ScadaPoint[]>([])
+  const [scada, setScada] = useState<ScadaColumns | null>(null)
   const [windRose, setWindRose] = useState<WindRoseResponse | null>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
@@ -48,7 +48,7 @@ export function DataExplorer() {
           api.getScada({ turbine_id: selectedTurbine, start: start || undefined, end: end || undefined, resample }),
           api.getWindRose({ turbine_id: selectedTurbine, start: start || undefined, end: end || undefined, direction_bins: 24 })
         ])
-        setScada(scadaRes.points)
+        setScada(scadaRes)
         setWindRose(windRoseRes)
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Failed to load data explorer content')
@@ -60,17 +60,17 @@ export function DataExplorer() {
     void run()
   }, [selectedTurbine, resample, start, end])
 
-  const chartData = useMemo(
-    () =>
-      scada.map((point) => ({
-        time: new Date(point.time).toLocaleDateString(undefined, { month: 'short', day: 'numeric' }),
-        power: point.power_kw,
-        ws: point.wind_speed_ms
-      })),
-    [scada]
-  )
-
-  if (loading && !scada.length) return <LoadingSpinner label="Loading data explorer" />
+  const chartData = useMemo(() => {
+    if (!scada) return []
+    const { time, power_kw, wind_speed_ms } = scada.columns
+    return time.map((timestamp, index) => ({
+      time: new Date(timestamp).toLocaleDateString(undefined, { month: 'short', day: 'numeric' }),
+      power: power_kw[index],
+      ws: wind_speed_ms[index]
+    }))
+  }, [scada])
+
+  if (loading && !scada) return <LoadingSpinner label="Loading data explorer" />
 
   return (
     <div className="page">
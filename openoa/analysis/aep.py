@@ -4,6 +4,7 @@ import sys
 import random
 import datetime
 from copy import deepcopy
+from typing import Callable
 
 import attrs
 import numpy as np
@@ -199,6 +200,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         init=False,
     )
     _reanalysis_aggregate: pd.DataFrame = field(init=False)
+    _ws_dens_corr: dict[str, pd.Series] = field(factory=dict, init=False)
     num_sim: int = field(init=False)
     long_term_losses: tuple[pd.Series, pd.Series] = field(init=False)
     mc_inputs: pd.DataFrame = field(init=False)
@@ -250,7 +252,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             self.plant.analysis_type.append(analysis_type)
 
         # Ensure the data are up to spec before continuing with initialization
-        self.plant.validate()
+        self.plant.validate(force=False)
 
         logger.info("Initializing MonteCarloAEP Analysis Object")
 
@@ -298,6 +300,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         end_date_lt: str | pd.Timestamp | None = None,
         ml_setup_kwargs: dict = None,
         progress_bar: bool = True,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
     ) -> None:
         """
         Process all appropriate data and run the MonteCarlo AEP analysis.
@@ -339,6 +342,12 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                 :py:class:`openoa.utils.machine_learning_setup.MachineLearningSetup` class. Defaults to {}.
             progress_bar(:obj:`bool`): Flag to use a progress bar for the iterations in the AEP
                 calculation. Defaults to ``True``.
+            callback(:obj:`Callable[[int, dict[str, float]], None]`): Function called after each
+                Monte Carlo iteration with the iteration number and its AEP, availability and
+                curtailment losses, and long-term to period of record ratio, such as for reporting
+                progress. The AEP does not yet include the interannual variability, which is
+                applied after all iterations. Raising an exception in the callback stops the
+                analysis. Defaults to None.
 
         Returns:
             None
@@ -397,7 +406,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         # Start the computation
         self.calculate_long_term_losses()
         self.setup_monte_carlo_inputs()
-        self.results = self.run_AEP_monte_carlo(progress_bar=progress_bar)
+        self.results = self.run_AEP_monte_carlo(progress_bar=progress_bar, callback=callback)
 
         # Log the completion of the run
         logger.info("Run completed")
@@ -426,6 +435,29 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
 
         return df_grouped
 
+    @logged_method_call
+    def _percent_nan(self, data_type: str, col: str) -> pd.Series:
+        """
+        Calculates the fraction of NaN data in :py:attr:`col` of the :py:attr:`data_type` data for
+        each period of the time resolution, using the plant's cached daily data availability counts
+        for daily and monthly time resolutions.
+
+        Args:
+            data_type(:obj:`str`): The name of the ``PlantData`` data type, such as "meter".
+            col(:obj:`str`): The name of the column in the :py:attr:`data_type` data.
+
+        Returns:
+            :obj:`pandas.Series`: The fraction of NaN data in each period, or 1 if a period has no
+                data.
+        """
+        if self.resample_freq not in ("MS", "ME", "D"):
+            df = getattr(self.plant, data_type)
+            return df.resample(self.resample_freq)[col].apply(tm.percent_nan)
+
+        counts = self.plant.availability(data_type, freq=self.resample_freq, by_asset=False)
+        n_rows = counts["n_rows"]
+        return (1 - counts[col] / n_rows).where(n_rows > 0, 1.0)
+
     @logged_method_call
     def calculate_aggregate_dataframe(self):
         """
@@ -462,14 +494,14 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         df = self.plant.meter  # Get the meter data frame
 
         # Create the monthly/daily data frame by summing meter energy, in GWh
-        self.aggregate = df.resample(self.resample_freq)["MMTR_SupWh"].sum().to_frame() / 1e6
+        self.aggregate = (
+            self.plant.aggregate("meter", self.resample_freq, ["MMTR_SupWh"], "sum") / 1e6
+        )
         self.aggregate.rename(columns={"MMTR_SupWh": "energy_gwh"}, inplace=True)
 
         # Determine how much 10-min data was missing for each year-month/daily energy value. Flag accordigly if any is missing
         # Get percentage of meter data that were NaN when summing to monthly/daily
-        self.aggregate["energy_nan_perc"] = df.resample(self.resample_freq)["MMTR_SupWh"].apply(
-            tm.percent_nan
-        )
+        self.aggregate["energy_nan_perc"] = self._percent_nan("meter", "MMTR_SupWh")
 
         if self.time_resolution in ("MS", "ME"):
             # Create a column with expected number of days per month (to be used when normalizing to 30-days for regression)
@@ -490,10 +522,11 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
     @logged_method_call
     def process_loss_estimates(self):
         """Append availability and curtailment losses to monthly data frame."""
-        df = self.plant.curtail.copy()
-
         curt_aggregate = np.divide(
-            df.resample(self.resample_freq)[["IAVL_DnWh", "IAVL_ExtPwrDnWh"]].sum(), 1e6
+            self.plant.aggregate(
+                "curtail", self.resample_freq, ["IAVL_DnWh", "IAVL_ExtPwrDnWh"], "sum"
+            ),
+            1e6,
         )  # Get sum of avail and curt losses in GWh
 
         curt_aggregate.rename(
@@ -521,12 +554,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         )
 
         # Get percentage of 10-min meter data that were NaN when summing to monthly/daily
-        self.aggregate["avail_nan_perc"] = df.resample(self.resample_freq)["IAVL_DnWh"].apply(
-            tm.percent_nan
-        )
-        self.aggregate["curt_nan_perc"] = df.resample(self.resample_freq)["IAVL_ExtPwrDnWh"].apply(
-            tm.percent_nan
-        )
+        self.aggregate["avail_nan_perc"] = self._percent_nan("curtail", "IAVL_DnWh")
+        self.aggregate["curt_nan_perc"] = self._percent_nan("curtail", "IAVL_ExtPwrDnWh")
 
         # If more than 1% of data are NaN, set flag to True
         self.aggregate["nan_flag"] = False  # Set flag to false by default
@@ -623,33 +652,40 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                     "perform the long-term correction."
                 )
 
-        # Correct each reanalysis product, density-correct wind speeds, and take monthly averages
-        for key in self.reanalysis_products:
-            rean_df = self.plant.reanalysis[key]
-            # rean_df = rean_df.rename(self.plant.metadata[key].col_map)
-            rean_df["ws_dens_corr"] = mt.air_density_adjusted_wind_speed(
-                rean_df["WMETR_HorWdSpd"], rean_df["WMETR_AirDen"]
-            )
-            self._reanalysis_aggregate[key] = rean_df.resample(self.resample_freq)[
-                "ws_dens_corr"
-            ].mean()  # .to_frame()
-
-            if self.reg_wind_direction | self.reg_temperature:
-                cols = [f"{key}_{var}" for var in self.reanalysis_vars]
-                self._reanalysis_aggregate[cols] = (
-                    rean_df[self.reanalysis_vars].resample(self.resample_freq).mean()
-                )
+        # Density-correct the wind speeds of each reanalysis product, which are kept with the
+        # analysis rather than added to the shared reanalysis data
+        self._ws_dens_corr = {
+            key: mt.air_density_adjusted_wind_speed(
+                self.plant.reanalysis[key]["WMETR_HorWdSpd"],
+                self.plant.reanalysis[key]["WMETR_AirDen"],
+            ).rename("ws_dens_corr")
+            for key in self.reanalysis_products
+        }
 
+        # Take monthly/daily averages of all reanalysis products, aligned to the period of interest
+        index = self._reanalysis_aggregate.index
+        variables = []
+        if self.reg_wind_direction | self.reg_temperature:
+            variables = self.reanalysis_vars
+            cube = self.plant.reanalysis_cube(
+                variables, self.reanalysis_products, freq=self.resample_freq, join="outer"
+            )
+            ix = cube.time.get_indexer(index)
+            values = np.where((ix > -1)[:, None, None], cube.values[ix], np.nan)
+        if self.reg_wind_direction:
+            u = values[:, :, cube.variables.get_loc("WMETR_HorWdSpdU")]
+            v = values[:, :, cube.variables.get_loc("WMETR_HorWdSpdV")]
+            wind_direction = np.rad2deg(np.pi - np.arctan2(-u, v))  # Calculate wind direction
+
+        aggregate = {}
+        for i, key in enumerate(self.reanalysis_products):
+            ws_dens_corr = self._ws_dens_corr[key].resample(self.resample_freq).mean()
+            aggregate[key] = ws_dens_corr.reindex(index).to_numpy(dtype=float)
+            for j, var in enumerate(variables):
+                aggregate[f"{key}_{var}"] = values[:, i, j]
             if self.reg_wind_direction:
-                self._reanalysis_aggregate[key + "_WMETR_HorWdDir"] = np.rad2deg(
-                    np.pi
-                    - (
-                        np.arctan2(
-                            -self._reanalysis_aggregate[key + "_WMETR_HorWdSpdU"],
-                            self._reanalysis_aggregate[key + "_WMETR_HorWdSpdV"],
-                        )
-                    )
-                )  # Calculate wind direction
+                aggregate[f"{key}_WMETR_HorWdDir"] = wind_direction[:, i]
+        self._reanalysis_aggregate = pd.DataFrame(aggregate, index=index, dtype=float)
 
         self.aggregate = self.aggregate.join(
             self._reanalysis_aggregate
@@ -981,13 +1017,19 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             return self.opt_model[(self._run.reanalysis_product)]
 
     @logged_method_call
-    def run_AEP_monte_carlo(self, progress_bar: bool = True):
+    def run_AEP_monte_carlo(
+        self,
+        progress_bar: bool = True,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
+    ):
         """
         Loop through OA process a number of times and return array of AEP results each time
 
         Args:
             progress_bar(:obj:`bool`): Flag to use a progress bar for the iterations in the AEP
                 calculation. Defaults to ``True``.
+            callback(:obj:`Callable[[int, dict[str, float]], None]`): Function called after each
+                iteration with the iteration number and its results. Defaults to None.
 
         Returns:
             :obj:`numpy.ndarray` Array of AEP, long-term avail, long-term curtailment calculations
@@ -1098,6 +1140,17 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             )
             lt_por_ratio[n] = (gross_lt.sum() / self._run.num_years_windiness) / gps
 
+            if callback is not None:
+                callback(
+                    n,
+                    {
+                        "aep_GWh": aep_GWh[n],
+                        "avail_pct": avail_pct[n],
+                        "curt_pct": curt_pct[n],
+                        "lt_por_ratio": lt_por_ratio[n],
+                    },
+                )
+
         # Calculate mean IAV for gross energy
         iav_avg = iav.mean()
 
@@ -1253,7 +1306,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                 True, then the figure and axes objects are returned for further tinkering/saving.
         """
         return plot.plot_monthly_reanalysis_windspeed(
-            data=self.plant.reanalysis,
+            data={key: ws.to_frame() for key, ws in self._ws_dens_corr.items()},
             windspeed_col="ws_dens_corr",
             plant_por=(self.aggregate.index[0], self.aggregate.index[-1]),
             xlim=xlim,
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import datetime
 from copy import deepcopy
+from typing import Callable
 
 import attrs
 import numpy as np
@@ -111,7 +112,7 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             self.plant.analysis_type.append("ElectricalLosses")
 
         # Ensure the data are up to spec before continuing with initialization
-        self.plant.validate()
+        self.plant.validate(force=False)
 
         logger.info("Initializing Electrical Losses Object")
 
@@ -135,6 +136,7 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         uncertainty_meter: NDArrayFloat | float = None,
         uncertainty_scada: NDArrayFloat | float = None,
         uncertainty_correction_threshold: NDArrayFloat | tuple[float, float] | float = None,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
     ):
         """
         Run the electrical losses calculation.
@@ -152,6 +154,10 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
                 the range of (0, 1], under which months should be eliminated. If :py:attr:`UQ` = True,
                 then a 2-element tuple containing an upper and lower bound for a randomly selected value
                 should be given, otherwise, a scalar value should be provided.
+            callback(:obj:`Callable[[int, dict[str, float]], None]`): Function called after each
+                Monte Carlo iteration with the iteration number and its electrical losses, such as for
+                reporting progress. Raising an exception in the callback stops the analysis. Defaults
+                to None.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -176,7 +182,7 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
 
         # Setup Monte Carlo approach, and calculate the electrical losses
         self.setup_inputs()
-        self.calculate_electrical_losses()
+        self.calculate_electrical_losses(callback=callback)
 
         # Reset the class arguments back to the initialized values
         self.set_values(initial_parameters)
@@ -221,16 +227,18 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         """
         logger.info("Processing SCADA data")
 
-        scada_df = self.plant.scada.copy()
+        scada_df = self.plant.view("scada", ["WTUR_SupWh"])
 
-        # Sum up SCADA data power and energy and count number of entries
-        ix_time = self.plant.scada.index.get_level_values("time")
-        self.scada_sum = scada_df.groupby(ix_time)[["WTUR_SupWh"]].sum()
-        self.scada_sum["count"] = scada_df.groupby(ix_time)[["WTUR_SupWh"]].count()
+        # Sum up SCADA data power and energy
+        ix_time = scada_df.index.get_level_values("time")
+        self.scada_sum = scada_df.groupby(ix_time).sum()
 
-        # Calculate daily sum of all turbine energy production and count number of entries
+        # Calculate daily sum of all turbine energy production, and get the number of entries from
+        # the plant's daily data availability counts
         self.scada_daily = self.scada_sum.resample("D")["WTUR_SupWh"].sum().to_frame()
-        self.scada_daily["count"] = self.scada_sum.resample("D")["count"].sum()
+        self.scada_daily["count"] = self.plant.availability("scada", freq="D", by_asset=False)[
+            "WTUR_SupWh"
+        ].reindex(self.scada_daily.index, fill_value=0)
 
         # Specify expected count provided all turbines reporting
         expected_count = (
@@ -256,11 +264,9 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         """
         logger.info("Processing meter data")
 
-        meter_df = self.plant.meter.copy()
-
         # Sum up meter data to daily
-        self.meter_daily = meter_df.resample("D").sum()
-        self.meter_daily["count"] = meter_df.resample("D")["MMTR_SupWh"].count()
+        self.meter_daily = self.plant.aggregate("meter", "D", how="sum")
+        self.meter_daily["count"] = self.plant.aggregate("meter", "D", ["MMTR_SupWh"], "count")
 
         # Specify expected count provided all timestamps reporting
         expected_count = (
@@ -273,17 +279,24 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         self.meter_daily = self.meter_daily[self.meter_daily["count"] == expected_count]
 
     @logged_method_call
-    def calculate_electrical_losses(self):
+    def calculate_electrical_losses(
+        self, callback: Callable[[int, dict[str, float]], None] | None = None
+    ):
         """
         Apply Monte Carlo approach to calculate electrical losses and their uncertainty based on the
         difference in the sum of turbine and metered energy over the compiled days.
+
+        Args:
+            callback(:obj:`Callable[[int, dict[str, float]], None]`): Function called after each
+                Monte Carlo iteration with the iteration number and its electrical losses. Defaults
+                to None.
         """
         logger.info("Calculating electrical losses")
 
         # Loop through number of simulations, calculate losses each time, store results
+        meter_df = self.plant.view("meter")
         for n in tqdm(np.arange(self.num_sim)):
             _run = self.inputs.loc[n]
-            meter_df = self.plant.meter.copy()
 
             # If monthly meter data, sum the corrected daily turbine energy to monthly and merge
             if self.monthly_meter:
@@ -291,7 +304,9 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
                 scada_monthly.columns = ["WTUR_SupWh"]
 
                 # Determine availability for each month represented
-                scada_monthly["count"] = self.scada_sum.resample("MS")["count"].sum()
+                scada_monthly["count"] = self.plant.availability(
+                    "scada", freq="MS", by_asset=False
+                )["WTUR_SupWh"]
                 scada_monthly["expected_count_monthly"] = (
                     scada_monthly.index.daysinmonth
                     * HOURS_PER_DAY
@@ -328,6 +343,9 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
 
             self.electrical_losses[n] = 1 - self.total_meter_energy / self.total_turbine_energy
 
+            if callback is not None:
+                callback(n, {"electrical_losses": self.electrical_losses[n].item()})
+
     def plot_monthly_losses(
         self,
         xlim: tuple[datetime.datetime | None, datetime.datetime | None] = (None, None),
@@ -158,7 +158,7 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             self.plant.analysis_type.append("TurbineLongTermGrossEnergy")
 
         # Ensure the data are up to spec before continuing with initialization
-        self.plant.validate()
+        self.plant.validate(force=False)
 
         logger.info("Initializing TurbineLongTermGrossEnergy Object")
 
@@ -187,6 +187,7 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         wind_bin_threshold: float | tuple[float, float] | None = None,
         max_power_filter: float | tuple[float, float] | None = None,
         correction_threshold: float | tuple[float, float] | None = None,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
     ) -> None:
         """
         Pre-process the run-specific data settings for each simulation, then fit and apply the
@@ -215,6 +216,10 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
                 scada energy data should be corrected. When :py:attr:`UQ` is True, then this should be a
                 tuple of the lower and upper limits of this threshold, otherwise a single value should
                 be used. Defaults to (0.85, 0.95)
+            callback(:obj:`Callable[[int, dict[str, float]], None]`): Function called after each
+                simulation with the simulation number and its long-term gross energy, such as for
+                reporting progress. Raising an exception in the callback stops the analysis. Defaults
+                to None.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -254,6 +259,9 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             self.fit_model()  # Fit daily turbine energy to atmospheric data
             self.apply_model(i)  # Apply fitting result to long-term reanalysis data
 
+            if callback is not None:
+                callback(i, {"plant_gross": self.plant_gross[i].item()})
+
         # Log the completion of the run
         logger.info("Run completed")
 
@@ -311,7 +319,7 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         Sorts the SCADA DataFrame by the asset_id and timestamp index columns, respectively.
         """
 
-        df = self.plant.scada.copy()
+        df = self.plant.view("scada")
         dic = self.scada_dict
 
         # Loop through turbine IDs
@@ -394,18 +402,18 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             self.daily_reanalysis = df_daily.copy()
             return
 
-        # Capture the runs reanalysis data set and ensure the U/V components exist
-        reanalysis_df = self.plant.reanalysis[self._run.reanalysis_product]
-        if len({"WMETR_HorWdSpdU", "WMETR_HorWdSpdV"}.intersection(reanalysis_df.columns)) < 2:
+        # Resample at a daily resolution and recalculate daily average wind direction
+        columns = ["WMETR_HorWdSpdU", "WMETR_HorWdSpdV", "WMETR_HorWdSpd", "WMETR_AirDen"]
+        reanalysis_df = self.plant.view(self._run.reanalysis_product)
+        if len({"WMETR_HorWdSpdU", "WMETR_HorWdSpdV"}.intersection(reanalysis_df.columns)) == 2:
+            df_daily = self.plant.aggregate(self._run.reanalysis_product, "D", columns, "mean")
+        else:
+            # Calculate the U/V components without adding them to the plant's reanalysis data
             (
                 reanalysis_df["WMETR_HorWdSpdU"],
                 reanalysis_df["WMETR_HorWdSpdV"],
             ) = met.compute_u_v_components("WMETR_HorWdSpd", "WMETR_HorWdDir", reanalysis_df)
-
-        # Resample at a daily resolution and recalculate daily average wind direction
-        df_daily = reanalysis_df.groupby([pd.Grouper(freq="D", level="time")])[
-            ["WMETR_HorWdSpdU", "WMETR_HorWdSpdV", "WMETR_HorWdSpd", "WMETR_AirDen"]
-        ].mean()
+            df_daily = reanalysis_df[columns].resample("D").mean()
         wd = met.compute_wind_direction(u="WMETR_HorWdSpdU", v="WMETR_HorWdSpdV", data=df_daily)
         df_daily = df_daily.assign(WMETR_HorWdDir=wd.values)
         self.daily_reanalysis = df_daily
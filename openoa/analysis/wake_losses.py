@@ -375,7 +375,7 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
                 self.plant.analysis_type.append("WakeLosses-tower")
 
         # Ensure the data are up to spec before continuing with initialization
-        self.plant.validate()
+        self.plant.validate(force=False)
 
         # Check that selected UQ is allowed and reset num_sim if no UQ
         if self.UQ:
@@ -439,6 +439,7 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         no_wakes_ws_thresh_LT_corr: float | None = None,
         min_ws_bin_lin_reg: float | None = None,
         bin_count_thresh_lin_reg: int | None = None,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
     ):
         """
         Estimates wake losses by comparing wind plant energy production to energy production of the
@@ -538,6 +539,10 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             bin_count_thresh_lin_reg (int, optional): The minimum number of samples required in a
                 wind speed bin to include when finding linear regression from SCADA freestream wind
                 speeds to reanalysis wind speeds. Defaults to 50.
+            callback (Callable[[int, dict[str, float]], None], optional): Function called after
+                each Monte Carlo iteration with the iteration number and its plant wake losses, such
+                as for reporting progress. Raising an exception in the callback stops the analysis.
+                Defaults to None.
         """
         initial_parameters = {}
         # Assign default parameter values depending on whether UQ is performed
@@ -647,12 +652,21 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
                 )
 
             if self.correct_for_ws_heterogeneity:
-                # Create a representative power curve model for the turbines in the plant
-                self.power_curve_func = power_curve.IEC(
-                    self.aggregate_df_sample.loc[:, "windspeed_normal"].stack(future_stack=True),
-                    self.aggregate_df_sample.loc[:, "power_normal"].stack(future_stack=True),
-                    windspeed_end=100.0,
-                    interpolate=True,
+                # Create a representative power curve model for the turbines in the plant, and
+                # tabulate it onto a grid containing the bin centers because it is evaluated for
+                # every turbine in each wind direction sector
+                self.power_curve_func = power_curve.compile_power_curve(
+                    power_curve.IEC(
+                        self.aggregate_df_sample.loc[:, "windspeed_normal"].stack(
+                            future_stack=True
+                        ),
+                        self.aggregate_df_sample.loc[:, "power_normal"].stack(future_stack=True),
+                        windspeed_end=100.0,
+                        interpolate=True,
+                    ),
+                    ws_min=0.0,
+                    ws_max=100.0,
+                    resolution=0.05,
                 )
 
                 # Create column for speedup factor during normal operation (NaN otherwise)
@@ -972,6 +986,11 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
                 self.turbine_wake_losses_lt_ws[n, :, :] = turbine_wake_losses_lt_ws
                 self.energy_lt_ws[n, :] = energy_lt_ws
 
+                if callback is not None:
+                    callback(
+                        n, {"wake_losses_por": wake_losses_por, "wake_losses_lt": wake_losses_lt}
+                    )
+
         if not self.UQ:
             # apply long-term correction to wake losses and average results over all reanalysis products
             self.wake_losses_por = wake_losses_por
@@ -1081,6 +1100,15 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             self.turbine_wake_losses_lt_ws = np.mean(turbine_wake_losses_lt_ws_all_products, axis=0)
             self.energy_lt_ws = np.mean(energy_lt_ws_all_products, axis=0)
 
+            if callback is not None:
+                callback(
+                    0,
+                    {
+                        "wake_losses_por": self.wake_losses_por,
+                        "wake_losses_lt": self.wake_losses_lt,
+                    },
+                )
+
         else:
             # Calculate mean and standard deviation of wake losses from Monte Carlo simulations
             self.wake_losses_lt_mean = np.mean(self.wake_losses_lt)
@@ -1251,10 +1279,10 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         # combine all wind speed and wind direction reanalysis variables into aggregate data frame
 
         for product in self.reanalysis_products:
-            df_rean = self.plant.reanalysis[product][["WMETR_HorWdSpd", "WMETR_HorWdDir"]].copy()
-
-            # Drop minute field
-            df_rean.index = df_rean.index.floor("h")
+            # Drop minute field by taking the first value in each hour
+            df_rean = self.plant.aggregate(
+                product, "h", ["WMETR_HorWdSpd", "WMETR_HorWdDir"], "first"
+            ).dropna(how="all")
 
             # Upsample to match SCADA data frequency
             df_rean = df_rean.resample(self.plant.metadata.scada.frequency).ffill()
@@ -1429,21 +1457,20 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         )
 
         # get reanalysis data and limit date range
-        df_reanal = self.plant.reanalysis[self._run.reanalysis_product].copy()
-        df_reanal = df_reanal.loc[
-            (df_reanal.index <= self.end_date_lt)
-            & (
-                df_reanal.index
-                > self.end_date_lt - pd.offsets.DateOffset(years=self._run.num_years_LT)
-            )
-        ]
-        df_reanal["windspeed_bin"] = (
-            self.ws_bin_width_LT_corr
-            * (df_reanal["WMETR_HorWdSpd"] / self.ws_bin_width_LT_corr).round()
+        cube = self.plant.reanalysis_cube(
+            ["WMETR_HorWdSpd", "WMETR_HorWdDir"], self.reanalysis_products, join="outer"
         )
-        df_reanal["wind_direction_bin"] = (
-            self.wd_bin_width_LT_corr
-            * (df_reanal["WMETR_HorWdDir"] / self.wd_bin_width_LT_corr).round()
+        in_range = (cube.time <= self.end_date_lt) & (
+            cube.time > self.end_date_lt - pd.offsets.DateOffset(years=self._run.num_years_LT)
+        )
+        windspeed, wind_direction = cube.take([self._run.reanalysis_product])[in_range, 0].T
+        df_reanal = pd.DataFrame(
+            {
+                "windspeed_bin": self.ws_bin_width_LT_corr
+                * np.round(windspeed / self.ws_bin_width_LT_corr),
+                "wind_direction_bin": self.wd_bin_width_LT_corr
+                * np.round(wind_direction / self.wd_bin_width_LT_corr),
+            }
         )
         df_reanal.loc[df_reanal["wind_direction_bin"] == 360.0, "wind_direction_bin"] = 0.0
 
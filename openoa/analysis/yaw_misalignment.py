@@ -35,6 +35,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from typing import Callable
 
 import attrs
 import numpy as np
@@ -230,7 +231,7 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             self.plant.analysis_type.append("StaticYawMisalignment")
 
         # Ensure the data are up to spec before continuing with initialization
-        self.plant.validate()
+        self.plant.validate(force=False)
 
         logger.info("Initializing StaticYawMisalignment analysis object")
 
@@ -258,6 +259,7 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         max_power_filter: float | None = None,
         power_bin_mad_thresh: float | None = None,
         use_power_coeff: bool | None = None,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
     ):
         """
         Estimates static yaw misalignment for each wind speed bin for each specified wind turbine.
@@ -305,6 +307,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             use_power_coeff (bool, optional): If True, power performance as a function of wind vane
                 angle will be quantified by normalizing power by the cube of the wind speed,
                 approximating the power coefficient. If False, only power will be used. Defaults to False.
+            callback (Callable[[int, dict[str, float]], None], optional): Function called after
+                each Monte Carlo iteration with the iteration number and the yaw misalignment of
+                each turbine, such as for reporting progress. Raising an exception in the callback
+                stops the analysis. Defaults to None.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -404,6 +410,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
                     self.yaw_misalignment[i] = np.mean(self.yaw_misalignment_ws[i, :])
                     self.mean_vane_angle[i] = np.mean(self.mean_vane_angle_ws[i, :])
 
+            if callback is not None:
+                yaw_misalignment = self.yaw_misalignment[n] if self.UQ else self.yaw_misalignment
+                callback(n, dict(zip(self.turbine_ids, yaw_misalignment)))
+
         # Compute mean, std. dev., and 95% confidence intervals of yaw misalginments
         if self.UQ:
             self.yaw_misalignment_avg = np.mean(self.yaw_misalignment, 0)
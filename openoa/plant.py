@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import csv
 import sys
 import logging
+import weakref
 import itertools
+from copy import deepcopy
 from typing import Callable, Optional, Sequence
 from pathlib import Path
 
@@ -15,11 +18,13 @@ from pyproj import Transformer
 from tabulate import tabulate
 from IPython.display import Markdown, display
 from shapely.geometry import Point
+from pandas.tseries.api import guess_datetime_format
 
 import openoa.utils.timeseries as ts
 import openoa.utils.met_data_processing as met
 from openoa.logging import set_log_level, setup_logging, logged_method_call
 from openoa.schema.metadata import ANALYSIS_REQUIREMENTS, PlantMetaData
+from openoa.utils.parquet_store import ParquetStore
 from openoa.utils.metadata_fetch import attach_eia_data
 from openoa.utils.unit_conversion import convert_power_to_energy
 
@@ -266,12 +271,101 @@ def dtype_converter(df: pd.DataFrame, column_types={}) -> list[str]:
     return errors
 
 
+def _parse_time_column(values: pd.Series, first_value: str | None) -> pd.Series:
+    """Parses a column of timestamp strings using the format of :py:attr:`first_value`, falling
+    back to pandas' per-element format inference for inconsistently formatted timestamps.
+    """
+    fmt = None if first_value is None else guess_datetime_format(first_value)
+    try:
+        return pd.to_datetime(values, format=fmt)
+    except ValueError:
+        return pd.to_datetime(values, format="mixed")
+
+
 @logged_method_call
-def load_to_pandas(data: str | Path | pd.DataFrame) -> pd.DataFrame | None:
+def read_csv(
+    path: str | Path, col_map: dict[str, str], dtypes: dict[str, type], block_size: int = 1 << 24
+) -> pd.DataFrame:
+    """Reads only the columns of the CSV file in :py:attr:`path` that are mapped in
+    :py:attr:`col_map`, with the data types set while reading. When the pyarrow package is
+    installed, the file is read with its multithreaded CSV reader in blocks of
+    :py:attr:`block_size` bytes, otherwise the pandas CSV reader is used. Timestamps are parsed
+    with the format of the first timestamp, rather than inferred for every element.
+
+    Args:
+        path (str | Path): The CSV file.
+        col_map (dict[str, str]): The mapping of OpenOA column names to the file's column names,
+            as provided by the metadata ``col_map``.
+        dtypes (dict[str, type]): The mapping of OpenOA column names to the expected data type, as
+            provided by the metadata ``dtypes``.
+        block_size (int, optional): The number of bytes read at a time by the pyarrow CSV reader.
+            Defaults to 16 MB.
+
+    Returns:
+        pd.DataFrame: The data with the file's column names, for the mapped columns that exist in
+            the file. Columns that can't be converted to their data type are loaded as is, and are
+            reported by the :py:class:`PlantData` validation.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        first_row = dict(zip(header, next(reader, [])))
+
+    mapped = {file_col: name for name, file_col in col_map.items()}
+    usecols = [col for col in header if col in mapped]
+    kinds = {col: dtypes.get(mapped[col]) for col in usecols}
+    time_cols = [col for col, kind in kinds.items() if kind in (np.datetime64, pd.DatetimeIndex)]
+    float_cols = [col for col, kind in kinds.items() if kind is float]
+    str_cols = [col for col, kind in kinds.items() if kind is str]
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ModuleNotFoundError:
+        pa = None
+
+    df = None
+    if pa is not None:
+        column_types = {col: pa.float64() for col in float_cols}
+        column_types.update({col: pa.string() for col in str_cols + time_cols})
+        try:
+            table = pa_csv.read_csv(
+                path,
+                read_options=pa_csv.ReadOptions(block_size=block_size),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=usecols, column_types=column_types
+                ),
+            )
+            df = table.to_pandas()
+        except pa.ArrowInvalid:
+            logger.info(f"Falling back to the pandas CSV reader for {path}")
+    if df is None:
+        try:
+            df = pd.read_csv(
+                path,
+                usecols=usecols,
+                dtype={col: float for col in float_cols} | {col: str for col in str_cols},
+            )
+        except ValueError:
+            df = pd.read_csv(path, usecols=usecols)
+
+    for col in time_cols:
+        df[col] = _parse_time_column(df[col], first_row.get(col) or None)
+    return df
+
+
+@logged_method_call
+def load_to_pandas(
+    data: str | Path | pd.DataFrame, metadata: object | None = None
+) -> pd.DataFrame | None:
     """Loads the input data or filepath to apandas DataFrame.
 
     Args:
         data (str | Path | pd.DataFrame): The input data.
+        metadata (object | None, optional): The metadata of the data type, such as
+            ``SCADAMetaData``, whose ``col_map`` and ``dtypes`` are used to only read the mapped
+            columns of a CSV file with the expected data types. See :py:func:`read_csv`. If None,
+            all columns are read with inferred data types. Defaults to None.
 
     Raises:
         ValueError: Raised if an invalid data type was passed.
@@ -283,7 +377,9 @@ def load_to_pandas(data: str | Path | pd.DataFrame) -> pd.DataFrame | None:
         return data
     elif isinstance(data, (str, Path)):
         logger.info(f"Loading {data} to a pandas DataFrame")
-        return pd.read_csv(data)
+        if metadata is None:
+            return pd.read_csv(data)
+        return read_csv(data, metadata.col_map, metadata.dtypes)
     elif isinstance(data, pd.DataFrame):
         return data
     else:
@@ -292,12 +388,16 @@ def load_to_pandas(data: str | Path | pd.DataFrame) -> pd.DataFrame | None:
 
 def load_to_pandas_dict(
     data: dict[str | Path | pd.DataFrame],
+    metadata: dict[str, object] | None = None,
 ) -> dict[str, pd.DataFrame] | None:
     """Converts a dictionary of data or data locations to a dictionary of ``pd.DataFrame``s
     by iterating over the dictionary and passing each value to ``load_to_pandas``.
 
     Args:
         data (dict[str  |  Path  |  pd.DataFrame]): The input data.
+        metadata (dict[str, object] | None, optional): The metadata of each key in
+            :py:attr:`data`, such as ``ReanalysisMetaData``, passed to ``load_to_pandas``.
+            Defaults to None.
 
     Returns:
         dict[str, pd.DataFrame] | None: The passed ``None`` or the converted ``pd.DataFrame``
@@ -305,11 +405,89 @@ def load_to_pandas_dict(
     """
     if data is None:
         return data
+    metadata = {} if metadata is None else metadata
     for key, val in data.items():
-        data[key] = load_to_pandas(val)
+        data[key] = load_to_pandas(val, metadata.get(key))
     return data
 
 
+def _metadata_converter(name: str) -> attrs.Converter:
+    """Creates the converter of a :py:class:`PlantData` data field that loads files using the
+    already converted ``PlantData.metadata`` for the :py:attr:`name` data type.
+    """
+    if name == "reanalysis":
+        return attrs.Converter(
+            lambda data, self: load_to_pandas_dict(data, self.metadata.reanalysis),
+            takes_self=True,
+        )
+    return attrs.Converter(
+        lambda data, self: load_to_pandas(data, getattr(self.metadata, name)), takes_self=True
+    )
+
+
+def _add_reanalysis_columns(df: pd.DataFrame, col_map: dict) -> pd.DataFrame:
+    """Calculates the wind speed, wind direction, and air density of the reanalysis data in
+    :py:attr:`df` from the other variables, if they don't already exist.
+
+    Args:
+        df (pd.DataFrame): The reanalysis data, using the original column names.
+        col_map (dict): The ``ReanalysisMetaData.col_map`` of the reanalysis product.
+
+    Returns:
+        pd.DataFrame: The reanalysis data with the additional columns.
+    """
+    u = col_map["WMETR_HorWdSpdU"]
+    v = col_map["WMETR_HorWdSpdV"]
+    has_u_v = (u in df) & (v in df)
+
+    ws = col_map["WMETR_HorWdSpd"]
+    if ws not in df and has_u_v:
+        df[ws] = met.compute_wind_speed(df[u], df[v]).values
+
+    wd = col_map["WMETR_HorWdDir"]
+    if wd not in df and has_u_v:
+        # .values to fix an issue where df[u] and df[v] with ANY NaN values
+        # would cause df[wd] to be all NaN.
+        df[wd] = met.compute_wind_direction(df[u], df[v]).values
+
+    dens = col_map["WMETR_AirDen"]
+    sp = col_map["WMETR_EnvPres"]
+    temp = col_map["WMETR_EnvTmp"]
+    has_sp_temp = (sp in df) & (temp in df)
+    if dens not in df and has_sp_temp:
+        df[dens] = met.compute_air_density(df[temp], df[sp])
+    return df
+
+
+def _has_dtype(df: pd.DataFrame, column: str, dtype: type) -> bool:
+    """Checks if the :py:attr:`column` column or index level of :py:attr:`df` is already of a
+    type that satisfies the metadata :py:attr:`dtype`, including the compact data types.
+    """
+    if column in df.columns:
+        values = df[column]
+    elif column in df.index.names:
+        values = df.index.get_level_values(column)
+    else:
+        return False
+
+    if dtype in (np.datetime64, pd.DatetimeIndex):
+        return pd.api.types.is_datetime64_any_dtype(values)
+    if dtype is float:
+        return pd.api.types.is_float_dtype(values)
+    if dtype is str:
+        return isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values)
+    return values.dtype == dtype
+
+
+def _compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts the 64-bit float columns of :py:attr:`df` to 32-bit floats, and the string
+    columns to categoricals.
+    """
+    dtypes = {col: np.float32 for col in df.select_dtypes(np.float64).columns}
+    dtypes.update({col: "category" for col in df.select_dtypes([object, "string"]).columns})
+    return df.astype(dtypes)
+
+
 @logged_method_call
 def rename_columns(df: pd.DataFrame, col_map: dict, reverse: bool = True) -> pd.DataFrame:
     """Renames the pandas DataFrame columns using col_map. Intended to be used in
@@ -330,6 +508,97 @@ def rename_columns(df: pd.DataFrame, col_map: dict, reverse: bool = True) -> pd.
     return df.rename(columns=col_map)
 
 
+@define(frozen=True)
+class ReanalysisCube:
+    """Read-only view of multiple reanalysis products aligned on a common time index, as
+    produced by :py:meth:`PlantData.reanalysis_cube`.
+
+    Args:
+        time (pd.DatetimeIndex): The aligned time index.
+        products (pd.Index): The reanalysis product names.
+        variables (pd.Index): The variable (column) names.
+        values (np.ndarray): The (time x product x variable) array of values, with NaN where a
+            product has no data.
+        mask (np.ndarray): The (time x product x variable) boolean array that is True where
+            :py:attr:`values` is missing.
+    """
+
+    time: pd.DatetimeIndex
+    products: pd.Index
+    variables: pd.Index
+    values: np.ndarray
+    mask: np.ndarray
+
+    def take(
+        self, products: Sequence[str] | np.ndarray, variables: Sequence[str] | None = None
+    ) -> np.ndarray:
+        """Gathers the data of a sequence of reanalysis products, such as the products sampled for
+        each iteration of a Monte Carlo simulation, with a single indexing operation.
+
+        Args:
+            products (Sequence[str] | np.ndarray): The product names to gather, which may be
+                repeated.
+            variables (Sequence[str] | None, optional): The variables to gather. If None, then all
+                variables are gathered. Defaults to None.
+
+        Returns:
+            np.ndarray: The (time x len(products) x variable) array of values.
+        """
+        product_ix = self.products.get_indexer(np.asarray(products))
+        if (product_ix < 0).any():
+            raise KeyError(
+                f"Invalid reanalysis products: {set(np.asarray(products)[product_ix < 0])}"
+            )
+        if variables is None:
+            return self.values[:, product_ix]
+        variable_ix = self.variables.get_indexer(variables)
+        if (variable_ix < 0).any():
+            raise KeyError(
+                f"Invalid reanalysis variables: {set(np.asarray(variables)[variable_ix < 0])}"
+            )
+        return self.values[:, product_ix[:, None], variable_ix]
+
+    def to_frame(self, product: str) -> pd.DataFrame:
+        """Provides the data of a single reanalysis product as a DataFrame, without the timestamps
+        where all variables are missing.
+
+        Args:
+            product (str): The reanalysis product name.
+
+        Returns:
+            pd.DataFrame: The :py:attr:`product` data indexed by time.
+        """
+        ix = self.products.get_loc(product)
+        keep = ~self.mask[:, ix].all(axis=1)
+        return pd.DataFrame(self.values[keep, ix], index=self.time[keep], columns=self.variables)
+
+
+class _Identity:
+    """Identifies an object, such as a ``PlantData`` data frame, by a weak reference to it for the
+    cached results' versions, since its ``id`` can be reused by a new object after the object is
+    garbage collected. Identities are only equal while their object is alive, and are never equal
+    after being copied to another process.
+    """
+
+    __slots__ = ("_ref", "_id")
+
+    def __init__(self, obj: object | None) -> None:
+        self._ref = None if obj is None else weakref.ref(obj)
+        self._id = id(obj)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _Identity):
+            return NotImplemented
+        obj = None if self._ref is None else self._ref()
+        return obj is not None and other._ref is not None and obj is other._ref()
+
+    def __hash__(self) -> int:
+        return self._id
+
+    def __reduce__(self) -> tuple:
+        return _Identity, (None,)
+
+
 ############################
 # Define the PlantData class
 ############################
@@ -402,6 +671,11 @@ class PlantData:
             the data source, such as "era5" or "merra2", or a dictionary of paths to the
             location of the data to be imported following the same key naming convention.
             See :py:class:`ReanalysisMetaData` for column data specifications.
+        compact (``bool``): If True, the time series and reanalysis data are stored in a compact
+            form after validation to reduce the memory used by large plants: 64-bit float columns
+            are stored as 32-bit floats, and string columns, such as turbine status codes, are
+            stored as categoricals. Analyses will produce results that differ from the default
+            64-bit data by the 32-bit floating point precision. Defaults to False.
 
     Raises:
         ValueError: Raised if any analysis specific validation checks don't pass with an
@@ -424,15 +698,16 @@ class PlantData:
         ),
         on_setattr=[attrs.setters.convert, attrs.setters.validate],
     )
-    scada: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
-    meter: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
-    tower: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
-    status: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
-    curtail: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
-    asset: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
+    scada: pd.DataFrame | None = field(default=None, converter=_metadata_converter("scada"))
+    meter: pd.DataFrame | None = field(default=None, converter=_metadata_converter("meter"))
+    tower: pd.DataFrame | None = field(default=None, converter=_metadata_converter("tower"))
+    status: pd.DataFrame | None = field(default=None, converter=_metadata_converter("status"))
+    curtail: pd.DataFrame | None = field(default=None, converter=_metadata_converter("curtail"))
+    asset: pd.DataFrame | None = field(default=None, converter=_metadata_converter("asset"))
     reanalysis: dict[str, pd.DataFrame] | None = field(
-        default=None, converter=load_to_pandas_dict  # noqa: F821
+        default=None, converter=_metadata_converter("reanalysis")
     )
+    compact: bool = field(default=False, converter=bool)
 
     # No user initialization required for attributes defined below here
     # Error catching in validation
@@ -442,6 +717,11 @@ class PlantData:
     eia: dict = field(default={}, init=False)
     asset_distance_matrix: pd.DataFrame = field(init=False, default=pd.DataFrame([]))
     asset_direction_matrix: pd.DataFrame = field(init=False, default=pd.DataFrame([]))
+    _cache: dict[tuple, tuple] = field(init=False, factory=dict, repr=False)
+    _versions: dict[str, int] = field(init=False, factory=dict, repr=False)
+    stores: dict[str, ParquetStore] = field(init=False, factory=dict, repr=False)
+    _validation: dict[str, tuple] = field(init=False, factory=dict, repr=False)
+    _validated_types: set = field(init=False, factory=set, repr=False)
 
     def __attrs_post_init__(self):
         """Post-initialization hook."""
@@ -473,6 +753,9 @@ class PlantData:
         # Change the column names to the -25 convention for easier use in the rest of the code base
         self.update_column_names()
 
+        if self.compact:
+            self._compact_data()
+
     @scada.validator
     @meter.validator
     @tower.validator
@@ -652,6 +935,7 @@ class PlantData:
     @logged_method_call
     def _set_index_columns(self) -> None:
         """Sets the index value for each of the `PlantData` objects that are not `None`."""
+        self.clear_cache()
         with attrs.validators.disabled():
             if self.scada is not None:
                 time_col = self.metadata.scada.col_map["time"]
@@ -706,6 +990,7 @@ class PlantData:
         the :py:meth:`validate` to ensure the validation methods are able to find the index columns
         in the column space
         """
+        self.clear_cache()
         if self.scada is not None:
             self.scada.reset_index(drop=False, inplace=True)
         if self.meter is not None:
@@ -782,23 +1067,11 @@ class PlantData:
         if not save_path.exists():
             save_path.mkdir()
 
-        meta = self.metadata.column_map
-
         if not with_openoa_col_names:
+            meta = self.metadata.column_map
             self.update_column_names(to_original=True)
         else:
-            for name, col_map in meta.items():
-                if name == "reanalysis":
-                    for re_name, re_col_map in col_map.items():
-                        re_col_map = {k: k for k in re_col_map}
-                        re_col_map["frequency"] = self.metadata.reanalysis[re_name].frequency
-                        meta[name][re_name] = re_col_map
-                    continue
-                col_map = {k: k for k in col_map}
-                meta_obj = getattr(self.metadata, name)
-                if hasattr(meta_obj, "frequency"):
-                    col_map["frequency"] = meta_obj.frequency
-                meta[name] = col_map
+            meta = self._openoa_column_map()
 
         with open((save_path / metadata).with_suffix(".yml"), "w") as f:
             yaml.safe_dump(meta, f, default_flow_style=False, sort_keys=False)
@@ -839,6 +1112,121 @@ class PlantData:
                 df.reset_index(drop=False).to_csv(reanalysis_fn, index=False)
                 logger.info(f"{name} reanalysis data saved to: {reanalysis_fn}")
 
+    def _openoa_column_map(self) -> dict:
+        """Creates the metadata column mapping of the data using the OpenOA column names, so that
+        the saved data can be reloaded with the same metadata.
+        """
+        meta = self.metadata.column_map
+        for name, col_map in meta.items():
+            if name == "reanalysis":
+                for re_name, re_col_map in col_map.items():
+                    re_col_map = {k: k for k in re_col_map}
+                    re_col_map["frequency"] = self.metadata.reanalysis[re_name].frequency
+                    meta[name][re_name] = re_col_map
+                continue
+            col_map = {k: k for k in col_map}
+            meta_obj = getattr(self.metadata, name)
+            if hasattr(meta_obj, "frequency"):
+                col_map["frequency"] = meta_obj.frequency
+            meta[name] = col_map
+        return meta
+
+    @logged_method_call
+    def to_parquet(self, save_path: str | Path) -> None:
+        """Saves the data to Parquet files in the provided :py:attr:`save_path` directory, using the
+        OpenOA column names, so that it can be reloaded with :py:meth:`from_parquet`. The SCADA,
+        met tower, and status data are saved as a :py:class:`openoa.utils.parquet_store.ParquetStore`
+        that is partitioned by year and asset ID, and the remaining data are saved as a single
+        Parquet file each.
+
+        .. note:: This relies on the pyarrow package, which must be installed with
+            `pip install openoa[parquet]`.
+
+        Args:
+            save_path (str | Path): The folder where all the data should be saved.
+        """
+        save_path = Path(save_path).resolve()
+        save_path.mkdir(parents=True, exist_ok=True)
+
+        with open(save_path / "metadata.yml", "w") as f:
+            yaml.safe_dump(self._openoa_column_map(), f, default_flow_style=False, sort_keys=False)
+
+        for name in ("scada", "tower", "status"):
+            if (df := getattr(self, name)) is not None:
+                ParquetStore.write(df, save_path / name)
+                logger.info(f"{name} data saved to: {save_path / name}")
+
+        for name in ("meter", "curtail", "asset"):
+            if (df := getattr(self, name)) is not None:
+                fn = save_path / f"{name}.parquet"
+                df.to_parquet(fn)
+                logger.info(f"{name} data saved to: {fn}")
+
+        if self.reanalysis is not None:
+            for name, df in self.reanalysis.items():
+                fn = save_path / f"reanalysis_{name}.parquet"
+                df.to_parquet(fn)
+                logger.info(f"{name} reanalysis data saved to: {fn}")
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str | Path,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        columns: dict[str, list[str]] | None = None,
+        load_time_series: bool = True,
+        **kwargs,
+    ) -> PlantData:
+        """Loads the data saved with :py:meth:`to_parquet`, reading only the requested time range
+        and columns of the SCADA, met tower, and status data into memory. The on-disk data remain
+        available through :py:attr:`stores`, which is used by :py:meth:`turbine_df`,
+        :py:meth:`tower_df`, and :py:meth:`aggregate` for the data that are not loaded.
+
+        Args:
+            path (str | Path): The folder of the saved data.
+            start (str | pd.Timestamp | None, optional): The first timestamp of the SCADA, met
+                tower, and status data to load. If None, then the data are loaded from the start.
+                Defaults to None.
+            end (str | pd.Timestamp | None, optional): The last timestamp of the SCADA, met tower,
+                and status data to load. If None, then the data are loaded to the end. Defaults to
+                None.
+            columns (dict[str, list[str]] | None, optional): The columns to load for any of
+                "scada", "tower", or "status". If None, or for any data type not provided, all
+                columns are loaded. Defaults to None.
+            load_time_series (bool, optional): If False, the SCADA, met tower, and status data are
+                not loaded into memory, and are only available through :py:attr:`stores`.
+                Defaults to True.
+            kwargs: Additional arguments to :py:class:`PlantData`, such as ``analysis_type``.
+
+        Returns:
+            PlantData: The loaded plant data.
+        """
+        path = Path(path).resolve()
+        columns = {} if columns is None else columns
+        data = {}
+        stores = {}
+        for name in ("scada", "tower", "status"):
+            if not (path / name).is_dir():
+                continue
+            stores[name] = store = ParquetStore(path / name)
+            if load_time_series:
+                df = store.read(start=start, end=end, columns=columns.get(name))
+                data[name] = df.reset_index()
+        for name in ("meter", "curtail", "asset"):
+            if (fn := path / f"{name}.parquet").is_file():
+                data[name] = pd.read_parquet(fn).reset_index()
+        reanalysis = {
+            fn.stem.replace("reanalysis_", "", 1): pd.read_parquet(fn).reset_index()
+            for fn in sorted(path.glob("reanalysis_*.parquet"))
+        }
+        if reanalysis:
+            data["reanalysis"] = reanalysis
+
+        plant = cls(metadata=path / "metadata.yml", **data, **kwargs)
+        plant.stores = stores
+        return plant
+
     @logged_method_call
     def _validate_column_names(self, category: str = "all") -> dict[str, list[str]]:
         """Validates that the column names in each of the data types matches the mapping
@@ -985,28 +1373,84 @@ class PlantData:
         return invalid_freq
 
     @logged_method_call
-    def validate(self, metadata: dict | str | Path | PlantMetaData | None = None) -> None:
+    def validate(
+        self, metadata: dict | str | Path | PlantMetaData | None = None, force: bool = True
+    ) -> None:
         """Secondary method to validate the plant data objects after loading or changing
-        data with option to provide an updated `metadata` object/file as well
+        data with option to provide an updated `metadata` object/file as well.
+
+        The validation results of each data type are recorded with the version of the data, see
+        :py:meth:`clear_cache`. With ``force=False``, as used by the analyses, only data that were
+        replaced, resized, or invalidated since the last validation are checked again, and the
+        recorded results are otherwise filtered by the requirements of the current
+        :py:attr:`analysis_type`, so validating the same data for the same analysis types again
+        returns immediately. Data modified in place are then only checked again after calling
+        :py:meth:`clear_cache`.
 
         Args:
             metadata (Optional[dict]): Updated metadata object, dictionary, or file to
                 create the updated metadata for data validation, which should align with
                 the mapped column names during initialization.
+            force (bool, optional): If True, all of the data are checked again, otherwise only
+                the data that changed since the last validation. Defaults to True.
 
         Raises:
             ValueError: Raised at the end if errors are caught in the validation steps.
         """
         logger.info("Post-intialization data validation")
+        if metadata is not None:
+            self._validate_all(metadata)
+            return
+
+        if force:
+            self._validation.clear()
+            self._validated_types.clear()
+
+        targets = self._validation_targets()
+        stale = {
+            key: target
+            for key, target in targets.items()
+            if key not in self._validation
+            or self._validation[key][0] != self._validation_version(*target[1:])
+        }
+        if not stale and self._validated_types.issuperset(self.analysis_type):
+            logger.info("Skipping the validation of data that were already validated")
+            return
+
+        for key, (category, name, df) in stale.items():
+            self._validation[key] = self._validate_data(category, name, df)
+
+        # Filter the recorded results of each data type by the current analysis requirements
+        frequency_requirements = self.metadata.frequency_requirements(self.analysis_type)
+        self._errors = {"missing": {}, "dtype": {}, "frequency": {}}
+        for key, (_, missing, dtype, freq) in self._validation.items():
+            if key not in targets:
+                continue
+            self._errors["missing"][key] = missing
+            self._errors["dtype"][key] = dtype
+            if freq is None:
+                continue
+            valid_freq = frequency_requirements.get(targets[key][0])
+            is_valid = frequency_validator(freq, valid_freq, True)
+            is_valid |= frequency_validator(freq, valid_freq, False)
+            if not is_valid:
+                self._errors["frequency"][key] = freq
+
+        errors = deepcopy(self._errors)
+        error_message = _compose_error_message(errors, self.metadata, self.analysis_type)
+        if error_message:
+            raise ValueError(error_message)
+        self._validated_types.update(self.analysis_type)
+
+    def _validate_all(self, metadata: dict | str | Path | PlantMetaData) -> None:
+        """Validates all of the data against the updated :py:attr:`metadata`, see
+        :py:meth:`validate`.
+        """
         # Put the index columns back into the column space to ensure success of re-validation
         self._unset_index_columns()
-
-        # Initialization will have converted the column naming convention, but an updated
-        # metadata should account for the renaming of the columns
-        if metadata is None:
-            self.update_column_names(to_original=True)
-        else:
-            self.metadata = metadata
+        self.metadata = metadata
+        self._validation.clear()
+        self._validated_types.clear()
 
         # Reset the index columns to be part of the columns space so the validations still work
         self._errors = {
@@ -1022,6 +1466,229 @@ class PlantData:
             raise ValueError(error_message)
         self.update_column_names()
 
+        # Validation converts the data back to the full dtypes
+        if self.compact:
+            self._compact_data()
+
+    def _validation_targets(self) -> dict[str, tuple[str, str, pd.DataFrame | None]]:
+        """Maps the name of each data type, or "reanalysis-<product>" for the reanalysis data, as
+        used in the validation errors, to the data type, name, and data.
+        """
+        targets = {
+            name: (name, name, getattr(self, name))
+            for name in ("scada", "meter", "tower", "status", "curtail", "asset")
+        }
+        if self.reanalysis is None:
+            products = {name: None for name in self.metadata.reanalysis}
+        else:
+            products = self.reanalysis
+        targets.update(
+            {f"reanalysis-{name}": ("reanalysis", name, df) for name, df in products.items()}
+        )
+        return targets
+
+    def _validation_version(self, name: str, df: pd.DataFrame | None) -> tuple | None:
+        """Identifies the current contents of the :py:attr:`name` data for the validation
+        records, as in :py:meth:`_data_version`.
+        """
+        if df is None:
+            return None
+        return _Identity(df), df.shape, self._versions.get(name, 0)
+
+    def _validate_data(
+        self, category: str, name: str, df: pd.DataFrame | None
+    ) -> tuple[tuple | None, list[str], list[str], str | int | float | None]:
+        """Validates the column names, data types, and timestamp frequency of a single data type,
+        or reanalysis product, using the OpenOA column names. Only the columns that are not
+        already of the correct data type are converted, and the data are only replaced if any
+        column is converted.
+
+        Args:
+            category (str): The data type, which is "reanalysis" for the reanalysis products.
+            name (str): The name of the data type or reanalysis product.
+            df (pd.DataFrame | None): The data.
+
+        Returns:
+            tuple[tuple | None, list[str], list[str], str | int | float | None]: The version of
+                the validated data, the missing columns, the columns that could not be converted,
+                using the original column names, and the timestamp frequency of the data.
+        """
+        meta = (
+            self.metadata.reanalysis[name]
+            if category == "reanalysis"
+            else getattr(self.metadata, category)
+        )
+        if df is None:
+            columns = list(meta.col_map.values())
+            return None, columns, columns, None
+
+        logger.info(f"Validating the {name} data")
+        index_names = [level for level in df.index.names if level is not None]
+        missing = [col for col in meta.col_map if col not in df.columns and col not in index_names]
+        convert = {
+            col: dtype
+            for col, dtype in meta.dtypes.items()
+            if col in missing or not _has_dtype(df, col, dtype)
+        }
+        errors = [col for col in convert if col in missing]
+        if convert := {col: dtype for col, dtype in convert.items() if col not in missing}:
+            df = df.reset_index() if index_names else df.copy()
+            errors.extend(dtype_converter(df, column_types=convert))
+            if index_names:
+                df = df.set_index(index_names)
+            if self.compact and category != "asset":
+                df = _compact_frame(df)
+            with attrs.validators.disabled():
+                if category == "reanalysis":
+                    self.reanalysis[name] = df
+                else:
+                    setattr(self, name, df)
+            self.clear_cache(name)
+
+        freq = None
+        if category in ("scada", "status", "tower"):
+            freq = ts.determine_frequency(df, "time")
+        elif category != "asset":
+            freq = ts.determine_frequency(df)
+
+        missing = [meta.col_map[col] for col in missing]
+        errors = [meta.col_map[col] for col in errors]
+        return self._validation_version(name, df), missing, errors, freq
+
+    @logged_method_call
+    def append(
+        self,
+        scada: pd.DataFrame | None = None,
+        meter: pd.DataFrame | None = None,
+        tower: pd.DataFrame | None = None,
+        status: pd.DataFrame | None = None,
+        curtail: pd.DataFrame | None = None,
+        reanalysis: dict[str, pd.DataFrame] | None = None,
+    ) -> None:
+        """Appends new rows to the existing time series and reanalysis data, such as the latest
+        day of data, without rebuilding the ``PlantData`` object. Only the new rows are validated
+        against the metadata, and the derived columns, such as the turbine energy, are only
+        calculated for the new rows. Data stored in an on-disk store, see :py:meth:`from_parquet`,
+        are appended to the store.
+
+        The new data must use the original column names of the metadata, as the data provided at
+        initialization do, and must start one period of the metadata frequency after the end of
+        the existing data, or later, in which case a warning is logged for the gap.
+
+        Args:
+            scada (pd.DataFrame, optional): The new SCADA data. Defaults to None.
+            meter (pd.DataFrame, optional): The new meter data. Defaults to None.
+            tower (pd.DataFrame, optional): The new met tower data. Defaults to None.
+            status (pd.DataFrame, optional): The new status data. Defaults to None.
+            curtail (pd.DataFrame, optional): The new curtailment data. Defaults to None.
+            reanalysis (dict[str, pd.DataFrame], optional): The new data of each reanalysis
+                product. Defaults to None.
+
+        Raises:
+            AttributeError: Raised if there is no existing data to append to.
+            ValueError: Raised if the new data are missing any columns of the existing data,
+                columns can't be converted to the metadata data types, the frequency of the new
+                data is invalid for the :py:attr:`analysis_type`, or the new data overlap or are
+                misaligned with the existing data.
+        """
+        new = dict(scada=scada, meter=meter, tower=tower, status=status, curtail=curtail)
+        new = [(name, name, df) for name, df in new.items() if df is not None]
+        if reanalysis is not None:
+            new.extend(("reanalysis", name, df) for name, df in reanalysis.items())
+
+        # Validate all of the new data before modifying anything
+        prepared = [
+            (category, bucket, self._prepare_append(category, bucket, df))
+            for category, bucket, df in new
+        ]
+
+        with attrs.validators.disabled():
+            for category, bucket, df in prepared:
+                logger.info(f"Appending {df.shape[0]} rows to the {bucket} data")
+                if self._is_stored(bucket):
+                    ParquetStore.write(df, self.stores[bucket].path, append=True)
+                else:
+                    df = pd.concat([self._get_data(bucket), df])
+                    if self.compact:
+                        df = _compact_frame(df)
+                    if category == "reanalysis":
+                        self.reanalysis[bucket] = df
+                    else:
+                        setattr(self, bucket, df)
+                self.clear_cache(bucket)
+
+    def _prepare_append(self, category: str, bucket: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Validates and prepares the new :py:attr:`bucket` data for :py:meth:`append`.
+
+        Args:
+            category (str): The data type, which is "reanalysis" for the reanalysis products.
+            bucket (str): The name of the data type or reanalysis product.
+            df (pd.DataFrame): The new data, using the original column names.
+
+        Returns:
+            pd.DataFrame: The new data, indexed and using the OpenOA column names as the existing
+                data.
+        """
+        if category == "reanalysis":
+            if self.reanalysis is None or bucket not in self.reanalysis:
+                raise AttributeError(
+                    f"There is no existing `{bucket}` reanalysis data to append to."
+                )
+            meta = self.metadata.reanalysis[bucket]
+        else:
+            meta = getattr(self.metadata, category)
+        if self._is_stored(bucket):
+            store = self.stores[bucket]
+            index_names, columns, end = store.index_names, store.columns, store.end
+        else:
+            existing = self._get_data(bucket)
+            index_names, columns = list(existing.index.names), existing.columns.tolist()
+            end = existing.index.get_level_values("time").max()
+
+        df = df.copy()
+        if category == "reanalysis":
+            df = _add_reanalysis_columns(df, meta.col_map)
+
+        # Check the metadata columns of the existing data, except the derived turbine energy
+        required = {
+            key: value
+            for key, value in meta.col_map.items()
+            if key in index_names + columns and key != "WTUR_SupWh"
+        }
+        if missing := column_validator(df, column_names=required):
+            raise ValueError(f"`{bucket}` data is missing the following columns: {missing}")
+        if errors := dtype_converter(
+            df, {value: meta.dtypes[key] for key, value in required.items()}
+        ):
+            raise ValueError(f"`{bucket}` data columns were of the wrong type: {errors}")
+
+        df = rename_columns(df, meta.col_map, reverse=True)
+        df = df[index_names + [col for col in columns if col in df]].set_index(index_names)
+        if "WTUR_SupWh" in columns:
+            df["WTUR_SupWh"] = convert_power_to_energy(df["WTUR_W"], meta.frequency)
+
+        # Check the frequency of the new data, and its continuity with the existing data
+        time = df.index.get_level_values("time")
+        if time.unique().size > 2:
+            freq = ts.determine_frequency(df, "time" if len(index_names) > 1 else None)
+            valid_freq = self.metadata.frequency_requirements(self.analysis_type).get(category)
+            is_valid = frequency_validator(freq, valid_freq, True)
+            is_valid |= frequency_validator(freq, valid_freq, False)
+            if not is_valid:
+                raise ValueError(f"`{bucket}` data is of the wrong frequency: {freq}")
+        if end is not None and not pd.isnull(end):
+            start, expected_start = time.min(), end + pd.tseries.frequencies.to_offset(
+                meta.frequency
+            )
+            if start < expected_start:
+                raise ValueError(
+                    f"The new `{bucket}` data must start at or after {expected_start}, the period"
+                    f" after the end of the existing data, not: {start}"
+                )
+            if start > expected_start:
+                logger.warning(f"The `{bucket}` data has a gap from {end} to {start}")
+        return df
+
     @logged_method_call
     def _calculate_reanalysis_columns(self) -> None:
         """Calculates extra variables such as wind direction from the provided
@@ -1031,32 +1698,25 @@ class PlantData:
             return
 
         logger.info("Calculating extra variables for the reanalysis data")
-        reanalysis = {}
-        for name, df in self.reanalysis.items():
-            col_map = self.metadata.reanalysis[name].col_map
-            u = col_map["WMETR_HorWdSpdU"]
-            v = col_map["WMETR_HorWdSpdV"]
-            has_u_v = (u in df) & (v in df)
-
-            ws = col_map["WMETR_HorWdSpd"]
-            if ws not in df and has_u_v:
-                df[ws] = met.compute_wind_speed(df[u], df[v]).values
-
-            wd = col_map["WMETR_HorWdDir"]
-            if wd not in df and has_u_v:
-                # .values to fix an issue where df[u] and df[v] with ANY NaN values
-                # would cause df[wd] to be all NaN.
-                df[wd] = met.compute_wind_direction(df[u], df[v]).values
-
-            dens = col_map["WMETR_AirDen"]
-            sp = col_map["WMETR_EnvPres"]
-            temp = col_map["WMETR_EnvTmp"]
-            has_sp_temp = (sp in df) & (temp in df)
-            if dens not in df and has_sp_temp:
-                df[dens] = met.compute_air_density(df[temp], df[sp])
-
-            reanalysis[name] = df
-        self.reanalysis = reanalysis
+        self.reanalysis = {
+            name: _add_reanalysis_columns(df, self.metadata.reanalysis[name].col_map)
+            for name, df in self.reanalysis.items()
+        }
+
+    @logged_method_call
+    def _compact_data(self) -> None:
+        """Converts the 64-bit float columns of the time series and reanalysis data to 32-bit
+        floats, and the string columns to categoricals. The asset IDs are left as is because the
+        "asset_id" index level already stores each ID once, with integer codes for each row.
+        """
+        logger.info("Converting the data to compact data types")
+        self.clear_cache()
+        with attrs.validators.disabled():
+            for name in ("scada", "meter", "tower", "status", "curtail"):
+                if (df := getattr(self, name)) is not None:
+                    setattr(self, name, _compact_frame(df))
+            if self.reanalysis is not None:
+                self.reanalysis = {name: _compact_frame(df) for name, df in self.reanalysis.items()}
 
     @logged_method_call
     def parse_asset_geometry(
@@ -1130,6 +1790,7 @@ class PlantData:
         else:
             logger.info("Converting column names to OpenOA conventions")
 
+        self.clear_cache()
         with attrs.validators.disabled():
             if self.scada is not None:
                 self.scada = rename_columns(self.scada, meta.scada.col_map, reverse=reverse)
@@ -1157,6 +1818,7 @@ class PlantData:
         power_col = self.metadata.scada.WTUR_W
         frequency = self.metadata.scada.frequency
         self.scada[energy_col] = convert_power_to_energy(self.scada[power_col], frequency)
+        self.clear_cache("scada")
 
     @property
     def turbine_ids(self) -> np.ndarray:
@@ -1164,6 +1826,8 @@ class PlantData:
         SCADA data, if `asset` is undefined.
         """
         if self.asset is None:
+            if self._is_stored("scada"):
+                return self.stores["scada"].asset_ids
             return self.scada.index.get_level_values("asset_id").unique()
         return self.asset.loc[self.asset["type"] == "turbine"].index.values
 
@@ -1172,18 +1836,32 @@ class PlantData:
         """The number of turbines contained in the data."""
         return self.turbine_ids.size
 
-    def turbine_df(self, turbine_id: str) -> pd.DataFrame:
-        """Filters `scada` on a single `turbine_id` and returns the filtered data frame.
+    def turbine_df(
+        self,
+        turbine_id: str,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """Filters `scada` on a single `turbine_id` and returns the filtered data frame. If the
+        `scada` data is not loaded, then the data are read from the on-disk store in
+        :py:attr:`stores`.
 
         Args:
             turbine_id (str): The asset_id of the turbine to retrieve its data.
+            start (str | pd.Timestamp | None, optional): The first timestamp to retrieve. If None,
+                then the data are retrieved from the start. Defaults to None.
+            end (str | pd.Timestamp | None, optional): The last timestamp to retrieve. If None,
+                then the data are retrieved to the end. Defaults to None.
 
         Returns:
             pd.DataFrame: The turbine-specific SCADA data frame.
         """
         if self.scada is None:
-            raise AttributeError("This method can't be used unless `scada` data is provided.")
-        return self.scada.xs(turbine_id, level=1)
+            if "scada" not in self.stores:
+                raise AttributeError("This method can't be used unless `scada` data is provided.")
+            df = self.stores["scada"].read(start=start, end=end, asset_ids=[turbine_id])
+            return df.xs(str(turbine_id), level=1)
+        return self.scada.xs(turbine_id, level=1).loc[start:end]
 
     @property
     def tower_ids(self) -> np.ndarray:
@@ -1191,6 +1869,8 @@ class PlantData:
         tower data, if `asset` is undefined.
         """
         if self.asset is None:
+            if self._is_stored("tower"):
+                return self.stores["tower"].asset_ids
             return self.tower.index.get_level_values("asset_id").unique()
         return self.asset.loc[self.asset["type"] == "tower"].index.values
 
@@ -1199,18 +1879,32 @@ class PlantData:
         """The number of met towers contained in the data."""
         return self.tower_ids.size
 
-    def tower_df(self, tower_id: str) -> pd.DataFrame:
-        """Filters `tower` on a single `tower_id` and returns the filtered data frame.
+    def tower_df(
+        self,
+        tower_id: str,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        """Filters `tower` on a single `tower_id` and returns the filtered data frame. If the
+        `tower` data is not loaded, then the data are read from the on-disk store in
+        :py:attr:`stores`.
 
         Args:
             tower_id (str): The ID of the met tower to retrieve its data.
+            start (str | pd.Timestamp | None, optional): The first timestamp to retrieve. If None,
+                then the data are retrieved from the start. Defaults to None.
+            end (str | pd.Timestamp | None, optional): The last timestamp to retrieve. If None,
+                then the data are retrieved to the end. Defaults to None.
 
         Returns:
             pd.DataFrame: The met tower-specific data frame.
         """
         if self.tower is None:
-            raise AttributeError("This method can't be used unless `tower` data is provided.")
-        return self.tower.xs(tower_id, level=1)
+            if "tower" not in self.stores:
+                raise AttributeError("This method can't be used unless `tower` data is provided.")
+            df = self.stores["tower"].read(start=start, end=end, asset_ids=[tower_id])
+            return df.xs(str(tower_id), level=1)
+        return self.tower.xs(tower_id, level=1).loc[start:end]
 
     @property
     def asset_ids(self) -> np.ndarray:
@@ -1221,6 +1915,344 @@ class PlantData:
             return np.concatenate([self.turbine_ids, self.tower_ids])
         return self.asset.index.values
 
+    def _get_data(self, bucket: str) -> pd.DataFrame:
+        """Gets the data of a time series data type or reanalysis product.
+
+        Args:
+            bucket (str): The name of the time series data type, such as "scada", "tower",
+                "status", "meter", or "curtail", or the name of a reanalysis product.
+
+        Raises:
+            ValueError: Raised if :py:attr:`bucket` is not a time series data type or reanalysis
+                product.
+            AttributeError: Raised if there is no :py:attr:`bucket` data.
+
+        Returns:
+            pd.DataFrame: The :py:attr:`bucket` data.
+        """
+        if bucket in ("scada", "meter", "tower", "status", "curtail"):
+            df = getattr(self, bucket)
+        elif self.reanalysis is not None and bucket in self.reanalysis:
+            df = self.reanalysis[bucket]
+        else:
+            raise ValueError(
+                f"`bucket` must be a time series data type or reanalysis product, not: {bucket}"
+            )
+        if df is None:
+            raise AttributeError(f"This method can't be used unless `{bucket}` data is provided.")
+        return df
+
+    def view(self, bucket: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """Provides the data of a time series data type or reanalysis product for read-only use,
+        such as in an analysis, where modifying the returned data, including adding columns, never
+        modifies the ``PlantData`` data. This allows multiple analyses to safely share the same
+        ``PlantData`` object.
+
+        With the pandas copy-on-write mode, which is the default as of pandas 3.0 and can be
+        enabled with ``pd.set_option("mode.copy_on_write", True)``, the data are not copied, and
+        only the columns that are modified are copied. Otherwise, the data are copied.
+
+        Args:
+            bucket (str): The name of the time series data type, such as "scada", "tower",
+                "status", "meter", or "curtail", or the name of a reanalysis product.
+            columns (list[str] | None, optional): The columns to provide. If None, then all
+                columns are provided. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The :py:attr:`bucket` data.
+        """
+        df = self._get_data(bucket)
+        if columns is not None:
+            df = df[list(columns)]
+        return df.copy(deep=not pd.get_option("mode.copy_on_write"))
+
+    def _data_version(self, bucket: str) -> tuple[_Identity, tuple[int, int], int]:
+        """Identifies the current contents of the :py:attr:`bucket` data by the identity and shape
+        of the data, and the number of times :py:meth:`clear_cache` has been called for it.
+        """
+        if self._is_stored(bucket):
+            store = self.stores[bucket]
+            return _Identity(store), store.version, self._versions.get(bucket, 0)
+        df = self._get_data(bucket)
+        return _Identity(df), df.shape, self._versions.get(bucket, 0)
+
+    def _is_stored(self, bucket: str) -> bool:
+        """Checks if the :py:attr:`bucket` data is only available from the on-disk store."""
+        return bucket in self.stores and getattr(self, bucket) is None
+
+    def clear_cache(self, bucket: str | None = None) -> None:
+        """Invalidates the cached data availability counts, aggregations, and validation results
+        of the :py:attr:`bucket` data. Replacing the data, or adding or removing rows or columns, is
+        detected automatically, but this must be called after modifying the values of the data in
+        place.
+
+        Args:
+            bucket (str | None, optional): The name of the time series data type or reanalysis
+                product to invalidate, or None to invalidate all data. Defaults to None.
+        """
+        if bucket is None:
+            self._versions = {name: version + 1 for name, version in self._versions.items()}
+            self._cache.clear()
+            self._validation.clear()
+            self._validated_types.clear()
+            return
+
+        self._versions[bucket] = self._versions.get(bucket, 0) + 1
+        self._cache = {
+            key: value
+            for key, value in self._cache.items()
+            if bucket not in (key[1] if isinstance(key[1], tuple) else (key[1],))
+        }
+
+    @logged_method_call
+    def calculate_availability(self, data_type: str = "scada") -> pd.DataFrame:
+        """Counts the number of rows and valid (non-NaN) samples of every column for each asset and
+        day of the :py:attr:`data_type` data, and caches the counts so that subsequent calls to
+        :py:meth:`availability` do not need to revisit the raw data. See :py:meth:`clear_cache`
+        for when the cached counts are recalculated.
+
+        Args:
+            data_type (str, optional): The name of the time series data type, such as "scada",
+                "tower", "status", "meter", or "curtail", or the name of a reanalysis product.
+                Defaults to "scada".
+
+        Raises:
+            ValueError: Raised if :py:attr:`data_type` is not a time series data type or reanalysis
+                product.
+            AttributeError: Raised if there is no :py:attr:`data_type` data.
+
+        Returns:
+            pd.DataFrame: The daily counts with a "n_rows" column and a column for each of the data
+                columns, indexed by "asset_id" and "time" for data with asset IDs, otherwise by
+                "time", with every day from the first to the last day of data included.
+        """
+        df = self._get_data(data_type)
+        time = df.index.get_level_values("time")
+        valid_time = ~time.isna()
+        day = time.normalize()
+        days = pd.date_range(day[valid_time].min(), day[valid_time].max(), freq="D", name="time")
+        day_codes = np.searchsorted(days.asi8, day.asi8)
+
+        if "asset_id" in df.index.names:
+            asset_codes, assets = pd.factorize(df.index.get_level_values("asset_id"), sort=True)
+            valid_time &= asset_codes > -1
+            index = pd.MultiIndex.from_product([assets, days], names=["asset_id", "time"])
+        else:
+            asset_codes = np.zeros(day_codes.size, dtype=int)
+            index = days
+
+        # Count each column's valid samples in the flattened (asset, day) bins
+        n_bins = index.size
+        bins = asset_codes * days.size + day_codes
+        counts = {"n_rows": np.bincount(bins[valid_time], minlength=n_bins)}
+        for col in df.columns:
+            valid = valid_time & df[col].notna().to_numpy()
+            counts[col] = np.bincount(bins[valid], minlength=n_bins)
+        cube = pd.DataFrame(counts, index=index)
+
+        self._cache[("availability", data_type)] = (self._data_version(data_type), cube)
+        return cube
+
+    def availability(
+        self,
+        data_type: str = "scada",
+        freq: str = "D",
+        by_asset: bool = True,
+        normalize: bool = False,
+    ) -> pd.DataFrame:
+        """Provides the number of rows and valid (non-NaN) samples of every column of the
+        :py:attr:`data_type` data, rolled up from the cached daily counts of
+        :py:meth:`calculate_availability`, which are calculated as needed.
+
+        Args:
+            data_type (str, optional): The name of the time series data type, such as "scada",
+                "tower", "status", "meter", or "curtail", or the name of a reanalysis product.
+                Defaults to "scada".
+            freq (str, optional): The daily or coarser pandas offset alias of the periods to roll
+                the daily counts up to, such as "D", "MS", or "YS". Defaults to "D".
+            by_asset (bool, optional): If True, the counts are provided for each asset, otherwise
+                the counts are summed across all assets. Defaults to True.
+            normalize (bool, optional): If True, the counts are divided by the expected number of
+                samples in each period, based on the frequency of the data and, when summed across
+                all assets, the number of assets. Defaults to False.
+
+        Returns:
+            pd.DataFrame: The counts, or fraction of expected samples, with a "n_rows" column and a
+                column for each of the data columns, indexed by "asset_id" and "time" when
+                :py:attr:`by_asset` is True and the data has asset IDs, otherwise by "time".
+        """
+        version, cube = self._cache.get(("availability", data_type), (None, None))
+        if version != self._data_version(data_type):
+            cube = self.calculate_availability(data_type)
+
+        has_assets = isinstance(cube.index, pd.MultiIndex)
+        n_assets = cube.index.levshape[0] if has_assets else 1
+        if has_assets and by_asset:
+            counts = cube.groupby(["asset_id", pd.Grouper(level="time", freq=freq)]).sum()
+            time = counts.index.get_level_values("time")
+            n_expected = 1
+        else:
+            counts = cube.groupby(pd.Grouper(level="time", freq=freq)).sum()
+            time = counts.index
+            n_expected = n_assets
+
+        if not normalize:
+            return counts
+
+        # Count the days in each period from the daily index, rather than the data
+        if self.reanalysis is not None and data_type in self.reanalysis:
+            frequency = self.metadata.reanalysis[data_type].frequency
+        else:
+            frequency = getattr(self.metadata, data_type).frequency
+        days = cube.index.get_level_values("time").unique()
+        n_days = pd.Series(1, index=days).resample(freq).sum()
+        per_day = 86400 / ts.offset_to_seconds(frequency)
+        expected = n_days.reindex(time).to_numpy() * per_day * n_expected
+        return counts.div(expected, axis=0)
+
+    def aggregate(
+        self,
+        bucket: str,
+        freq: str,
+        columns: list[str] | None = None,
+        how: str = "mean",
+    ) -> pd.DataFrame:
+        """Resamples the :py:attr:`columns` of the :py:attr:`bucket` data to :py:attr:`freq` using
+        the aggregation or fill method :py:attr:`how`, separately for each asset for data with
+        asset IDs. The results are cached, so repeated requests for the same aggregation, such as
+        from multiple analyses of the same plant, only resample the data once. See
+        :py:meth:`clear_cache` for when the cached results are recalculated. Data that are only
+        available from the on-disk store in :py:attr:`stores` are resampled one batch of rows at a
+        time, for which :py:attr:`how` must be one of "sum", "count", "mean", "min", or "max".
+
+        Args:
+            bucket (str): The name of the time series data type, such as "scada", "tower",
+                "status", "meter", or "curtail", or the name of a reanalysis product.
+            freq (str): The pandas offset alias to resample the data to, such as "h", "D", or "MS".
+            columns (list[str] | None, optional): The columns to resample. If None, then all columns
+                are resampled. Defaults to None.
+            how (str, optional): The name of the pandas resampling method, such as "mean", "sum",
+                "count", "first", or "ffill". Defaults to "mean".
+
+        Raises:
+            ValueError: Raised if :py:attr:`bucket` is not a time series data type or reanalysis
+                product.
+            AttributeError: Raised if there is no :py:attr:`bucket` data.
+
+        Returns:
+            pd.DataFrame: A copy of the resampled data, indexed by "asset_id" and "time" for data
+                with asset IDs, otherwise by "time".
+        """
+        if self._is_stored(bucket):
+            store = self.stores[bucket]
+            all_columns = store.columns
+        else:
+            df = self._get_data(bucket)
+            all_columns = df.columns.tolist()
+        columns = all_columns if columns is None else convert_to_list(columns)
+        key = ("aggregate", bucket, freq, tuple(columns), how)
+        version, aggregated = self._cache.get(key, (None, None))
+        if version != (current := self._data_version(bucket)):
+            if self._is_stored(bucket):
+                aggregated = store.aggregate(freq, columns, how)
+            elif "asset_id" in df.index.names:
+                grouper = [pd.Grouper(level="asset_id"), pd.Grouper(level="time", freq=freq)]
+                aggregated = df.groupby(grouper)[columns].agg(how)
+            else:
+                aggregated = df[columns].resample(freq).agg(how)
+            self._cache[key] = (current, aggregated)
+        return aggregated.copy()
+
+    def reanalysis_cube(
+        self,
+        variables: list[str] | None = None,
+        products: list[str] | None = None,
+        freq: str | None = None,
+        how: str = "mean",
+        join: str = "inner",
+    ) -> ReanalysisCube:
+        """Aligns the :py:attr:`variables` of the reanalysis :py:attr:`products` into a single
+        (time x product x variable) array with a mask of the missing data, so that analyses can
+        select the data of any product, or of a sampled sequence of products, by integer indexing
+        instead of looking up and aligning each product's DataFrame. The results are cached in the
+        same manner as :py:meth:`aggregate`.
+
+        Args:
+            variables (list[str] | None, optional): The variables to include. If None, then the
+                variables common to all :py:attr:`products` are included. Defaults to None.
+            products (list[str] | None, optional): The reanalysis products to include. If None,
+                then all products are included. Defaults to None.
+            freq (str | None, optional): The pandas offset alias to resample each product to
+                with :py:meth:`aggregate` before aligning the products. If None, then the original
+                timestamps are used. Defaults to None.
+            how (str, optional): The name of the pandas resampling method used when
+                :py:attr:`freq` is provided. Defaults to "mean".
+            join (str, optional): One of "inner" to only include the time range common to all
+                products, or "outer" to include the time range covered by any product. Defaults
+                to "inner".
+
+        Raises:
+            AttributeError: Raised if there is no reanalysis data.
+            ValueError: Raised if :py:attr:`join` is not one of "inner" or "outer", or if there is
+                no time range common to all :py:attr:`products` for an "inner" join.
+
+        Returns:
+            ReanalysisCube: The aligned reanalysis data, which should not be modified.
+        """
+        if self.reanalysis is None:
+            raise AttributeError("This method can't be used unless `reanalysis` data is provided.")
+        if join not in ("inner", "outer"):
+            raise ValueError(f"`join` must be one of 'inner' or 'outer', not: {join}")
+
+        products = [*self.reanalysis] if products is None else convert_to_list(products)
+        if variables is None:
+            variables = [
+                col
+                for col in self._get_data(products[0]).columns
+                if all(col in self._get_data(product).columns for product in products[1:])
+            ]
+        variables = convert_to_list(variables)
+
+        key = ("reanalysis_cube", tuple(products), tuple(variables), freq, how, join)
+        current = tuple(self._data_version(product) for product in products)
+        version, cube = self._cache.get(key, (None, None))
+        if version == current:
+            return cube
+
+        if freq is None:
+            data = [self._get_data(product)[variables] for product in products]
+        else:
+            data = [self.aggregate(product, freq, variables, how) for product in products]
+
+        time = data[0].index
+        for df in data[1:]:
+            time = time.union(df.index)
+        if join == "inner":
+            start = max(df.index.min() for df in data)
+            end = min(df.index.max() for df in data)
+            if start > end:
+                raise ValueError(f"There is no time range common to all of: {products}")
+            time = time[(time >= start) & (time <= end)]
+
+        values = np.full((time.size, len(products), len(variables)), np.nan)
+        for i, df in enumerate(data):
+            ix = time.get_indexer(df.index)
+            keep = ix > -1
+            values[ix[keep], i] = df.to_numpy(dtype=float)[keep]
+        mask = np.isnan(values)
+        values.flags.writeable = False
+        mask.flags.writeable = False
+
+        cube = ReanalysisCube(
+            time=time.rename("time"),
+            products=pd.Index(products),
+            variables=pd.Index(variables),
+            values=values,
+            mask=mask,
+        )
+        self._cache[key] = (current, cube)
+        return cube
+
     # NOTE: v2 AssetData methods
 
     @logged_method_call
@@ -1249,7 +2281,7 @@ class PlantData:
 
         # Maintain v2 compatibility of np.inf for the diagonal
         distance = distance + distance.values.T - np.diag(np.diag(distance.values))
-        distance_array = distance.values
+        distance_array = distance.to_numpy(copy=True)
         np.fill_diagonal(distance_array, np.inf)
         distance.loc[:, :] = distance_array
         self.asset_distance_matrix = distance
@@ -1329,7 +2361,7 @@ class PlantData:
             + np.triu((direction.values - 180.0) % 360.0, 1).T
             - np.diag(np.diag(direction.values))
         )
-        direction_array = direction.values
+        direction_array = direction.to_numpy(copy=True)
         np.fill_diagonal(direction_array, np.inf)
         direction.loc[:, :] = direction_array
         self.asset_direction_matrix = direction
@@ -27,8 +27,7 @@ def asset_correlation_matrix(data: pd.DataFrame, value_col: str) -> pd.DataFrame
     corr_df = corr_df.droplevel(0).droplevel(0, axis=1)  # drop the added axes
     corr_df.index = corr_df.index.set_names(None)
     corr_df.columns = corr_df.index.set_names(None)
-    np.fill_diagonal(corr_df.values, np.nan)
-    return corr_df
+    return corr_df.mask(np.eye(corr_df.shape[0], dtype=bool))
 
 
 def impute_data(
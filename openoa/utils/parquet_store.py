@@ -0,0 +1,334 @@
+"""
+This module provides an on-disk store for time series data, such as SCADA, met tower, or status
+data, that is too large to keep in memory. The data are stored as Parquet files partitioned by
+year and asset ID, so that only the time ranges, assets, and columns that are requested are read
+from disk, and aggregations are computed in a streaming manner, one batch of rows at a time.
+
+.. note:: This module relies on the pyarrow package, which must be installed with
+    `pip install openoa[parquet]`.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from typing import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from attrs import field, define
+
+from openoa.logging import logging
+
+logger = logging.getLogger(__name__)
+
+STORE_INFO_FILE = "_openoa_store.json"
+STREAMING_AGGREGATIONS = ("sum", "count", "mean", "min", "max")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ModuleNotFoundError:
+        raise NotImplementedError(
+            "The pyarrow python package was not found. Please install it with `pip install openoa[parquet]`."
+        )
+    return pa, ds
+
+
+@define(auto_attribs=True)
+class ParquetStore:
+    """On-disk store of time series data indexed by "time", or by "time" and "asset_id", and
+    partitioned into one directory per year and asset ID. Use :py:meth:`write` to create a store.
+
+    Args:
+        path(:obj:`str` | `pathlib.Path`): Directory of the store.
+    """
+
+    path: Path = field(converter=lambda x: Path(x).resolve())
+    index_names: list[str] = field(init=False)
+
+    def __attrs_post_init__(self):
+        info = self.path / STORE_INFO_FILE
+        if not info.is_file():
+            raise FileNotFoundError(f"No ParquetStore was found in: {self.path}")
+        with open(info) as f:
+            self.index_names = json.load(f)["index_names"]
+
+    @property
+    def has_assets(self) -> bool:
+        """Indicates if the data are indexed by asset ID."""
+        return "asset_id" in self.index_names
+
+    def _partitioning(self):
+        pa, ds = _import_pyarrow()
+        fields = [("year", pa.int16())]
+        if self.has_assets:
+            fields.append(("asset_id", pa.string()))
+        return ds.partitioning(pa.schema(fields), flavor="hive")
+
+    @classmethod
+    def write(cls, df: pd.DataFrame, path: str | Path, append: bool = False) -> ParquetStore:
+        """Writes :py:attr:`df` to a partitioned store in :py:attr:`path`.
+
+        Args:
+            df(:obj:`pandas.DataFrame`): Data indexed by "time", or by "time" and "asset_id".
+            path(:obj:`str` | `pathlib.Path`): Directory of the store.
+            append(:obj:`bool`): If True, the data are added to the existing store, otherwise any
+                existing data in the store are removed. Defaults to False.
+
+        Returns:
+            :obj:`ParquetStore`: The store.
+        """
+        pa, ds = _import_pyarrow()
+        if "time" not in df.index.names:
+            raise ValueError("`df` must be indexed by 'time', or by 'time' and 'asset_id'.")
+
+        path = Path(path).resolve()
+        index_names = [name for name in ("time", "asset_id") if name in df.index.names]
+        if append:
+            if (store := cls(path)).index_names != index_names:
+                raise ValueError(f"`df` must be indexed by: {store.index_names}")
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            with open(path / STORE_INFO_FILE, "w") as f:
+                json.dump(dict(index_names=index_names), f)
+            store = cls(path)
+
+        df = df.reset_index()[index_names + [c for c in df.columns if c not in index_names]]
+        if store.has_assets:
+            df["asset_id"] = df["asset_id"].astype(str)
+        df["year"] = df["time"].dt.year.astype(np.int16)
+        df = df.sort_values("time", kind="stable")
+
+        ds.write_dataset(
+            pa.Table.from_pandas(df, preserve_index=False),
+            path,
+            format="parquet",
+            partitioning=store._partitioning(),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore" if append else "delete_matching",
+        )
+        return store
+
+    def dataset(self):
+        """The pyarrow dataset of all the files in the store."""
+        _, ds = _import_pyarrow()
+        return ds.dataset(
+            self.path,
+            format="parquet",
+            partitioning=self._partitioning(),
+            exclude_invalid_files=True,
+            ignore_prefixes=[".", "_"],
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        """The data columns, excluding the index and partitioning columns."""
+        return [
+            name
+            for name in self.dataset().schema.names
+            if name not in self.index_names and name != "year"
+        ]
+
+    @property
+    def asset_ids(self) -> np.ndarray:
+        """The asset IDs in the store."""
+        if not self.has_assets:
+            return np.array([], dtype=object)
+        ids = {p.name.split("=", 1)[1] for p in self.path.glob("year=*/asset_id=*")}
+        return np.array(sorted(ids), dtype=object)
+
+    @property
+    def end(self) -> pd.Timestamp | None:
+        """The last timestamp in the store, or None if the store is empty."""
+        _, ds = _import_pyarrow()
+        years = [int(p.name.split("=", 1)[1]) for p in self.path.glob("year=*")]
+        if not years:
+            return None
+        table = self.dataset().to_table(columns=["time"], filter=ds.field("year") == max(years))
+        return table.column("time").to_pandas().max()
+
+    @property
+    def version(self) -> tuple[int, float]:
+        """Identifies the current contents of the store by the number of files and the latest
+        modification time of the files.
+        """
+        stats = [fn.stat().st_mtime for fn in self.path.glob("year=*/**/*.parquet")]
+        return len(stats), max(stats, default=0.0)
+
+    def _filter(
+        self,
+        start: str | pd.Timestamp | None,
+        end: str | pd.Timestamp | None,
+        asset_ids: list[str] | None,
+    ):
+        _, ds = _import_pyarrow()
+        expression = None
+
+        def combine(expression, new):
+            return new if expression is None else expression & new
+
+        # Filter on the year partitions first to skip reading files that are out of range
+        if start is not None:
+            start = pd.Timestamp(start)
+            expression = combine(expression, ds.field("year") >= start.year)
+            expression = combine(expression, ds.field("time") >= start)
+        if end is not None:
+            end = pd.Timestamp(end)
+            expression = combine(expression, ds.field("year") <= end.year)
+            expression = combine(expression, ds.field("time") <= end)
+        if asset_ids is not None:
+            if not self.has_assets:
+                raise ValueError("`asset_ids` can only be used for data with asset IDs.")
+            asset_ids = [str(el) for el in np.atleast_1d(asset_ids)]
+            expression = combine(expression, ds.field("asset_id").isin(asset_ids))
+        return expression
+
+    def _to_pandas(self, data) -> pd.DataFrame:
+        df = data.to_pandas()
+        df = df.drop(columns="year", errors="ignore").set_index(self.index_names)
+        return df
+
+    def read(
+        self,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        columns: list[str] | None = None,
+        asset_ids: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Reads a subset of the data from disk.
+
+        Args:
+            start(:obj:`str` | `pandas.Timestamp` | `None`): The first timestamp to read. If None,
+                then the data are read from the start of the store. Defaults to None.
+            end(:obj:`str` | `pandas.Timestamp` | `None`): The last timestamp to read. If None,
+                then the data are read to the end of the store. Defaults to None.
+            columns(:obj:`list[str]` | `None`): The columns to read. If None, then all columns are
+                read. Defaults to None.
+            asset_ids(:obj:`list[str]` | `None`): The asset IDs to read. If None, then all assets
+                are read. Defaults to None.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The data indexed by "time", or by "time" and "asset_id", and
+                sorted by the index.
+        """
+        columns = self.columns if columns is None else list(columns)
+        table = self.dataset().to_table(
+            columns=self.index_names + columns, filter=self._filter(start, end, asset_ids)
+        )
+        return self._to_pandas(table).sort_index()
+
+    def iter_batches(
+        self,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        columns: list[str] | None = None,
+        asset_ids: list[str] | None = None,
+        batch_size: int = 1_000_000,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over a subset of the data from disk in batches of rows, in no particular order.
+
+        Args:
+            start(:obj:`str` | `pandas.Timestamp` | `None`): The first timestamp to read. If None,
+                then the data are read from the start of the store. Defaults to None.
+            end(:obj:`str` | `pandas.Timestamp` | `None`): The last timestamp to read. If None,
+                then the data are read to the end of the store. Defaults to None.
+            columns(:obj:`list[str]` | `None`): The columns to read. If None, then all columns are
+                read. Defaults to None.
+            asset_ids(:obj:`list[str]` | `None`): The asset IDs to read. If None, then all assets
+                are read. Defaults to None.
+            batch_size(:obj:`int`): The maximum number of rows in each batch. Defaults to 1,000,000.
+
+        Yields:
+            :obj:`pandas.DataFrame`: A batch of the data indexed by "time", or by "time" and
+                "asset_id".
+        """
+        columns = self.columns if columns is None else list(columns)
+        batches = self.dataset().to_batches(
+            columns=self.index_names + columns,
+            filter=self._filter(start, end, asset_ids),
+            batch_size=batch_size,
+        )
+        for batch in batches:
+            if batch.num_rows > 0:
+                yield self._to_pandas(batch)
+
+    def aggregate(
+        self,
+        freq: str,
+        columns: list[str] | None = None,
+        how: str = "sum",
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        asset_ids: list[str] | None = None,
+        batch_size: int = 1_000_000,
+    ) -> pd.DataFrame:
+        """Resamples the data to :py:attr:`freq`, separately for each asset for data with asset
+        IDs, by aggregating each batch of rows read from disk and combining the partial results, so
+        that only one batch of the raw data is held in memory at a time.
+
+        Args:
+            freq(:obj:`str`): The pandas offset alias to resample the data to, such as "D" or "MS".
+            columns(:obj:`list[str]` | `None`): The columns to resample. If None, then all columns
+                are resampled. Defaults to None.
+            how(:obj:`str`): One of "sum", "count", "mean", "min", or "max". Defaults to "sum".
+            start(:obj:`str` | `pandas.Timestamp` | `None`): The first timestamp to read. If None,
+                then the data are read from the start of the store. Defaults to None.
+            end(:obj:`str` | `pandas.Timestamp` | `None`): The last timestamp to read. If None,
+                then the data are read to the end of the store. Defaults to None.
+            asset_ids(:obj:`list[str]` | `None`): The asset IDs to read. If None, then all assets
+                are read. Defaults to None.
+            batch_size(:obj:`int`): The maximum number of rows read at a time. Defaults to
+                1,000,000.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The resampled data, matching the results of a pandas
+                resampling of the in-memory data, indexed by "asset_id" and "time" for data with
+                asset IDs, otherwise by "time".
+        """
+        if how not in STREAMING_AGGREGATIONS:
+            raise ValueError(f"`how` must be one of {STREAMING_AGGREGATIONS}, not: {how}")
+        columns = self.columns if columns is None else list(columns)
+
+        # The partial results of each batch are combined with these methods
+        partial_how = ["sum", "count"] if how == "mean" else [how]
+        combine_how = dict(sum="sum", count="sum", min="min", max="max")
+        if self.has_assets:
+            keys = [pd.Grouper(level="asset_id"), pd.Grouper(level="time", freq=freq)]
+        else:
+            keys = [pd.Grouper(level="time", freq=freq)]
+
+        def combine(partials: dict[str, list[pd.DataFrame]]) -> dict[str, list[pd.DataFrame]]:
+            levels = list(range(len(keys)))
+            return {
+                name: [pd.concat(dfs).groupby(level=levels).agg(combine_how[name])]
+                for name, dfs in partials.items()
+            }
+
+        partials = {name: [] for name in partial_how}
+        for i, df in enumerate(self.iter_batches(start, end, columns, asset_ids, batch_size)):
+            grouped = df.groupby(keys)[columns]
+            for name in partial_how:
+                partials[name].append(grouped.agg(name))
+            if i % 64 == 63:
+                partials = combine(partials)
+
+        if not partials[partial_how[0]]:
+            return pd.DataFrame(columns=columns, dtype=float)
+
+        partials = {name: dfs[0] for name, dfs in combine(partials).items()}
+        if how == "mean":
+            counts = partials["count"]
+            aggregated = partials["sum"].div(counts.where(counts > 0))
+        else:
+            aggregated = partials[how]
+
+        # Fill in the periods without any data, as pandas does when resampling data without asset
+        # IDs, whereas grouping by asset ID and time only produces the periods with data
+        if self.has_assets:
+            return aggregated
+        fill_value = 0 if how in ("sum", "count") else np.nan
+        return aggregated.asfreq(freq, fill_value=fill_value)
@@ -4,4 +4,7 @@ power generation.
 
 """
 
+from .compiled import compile_power_curve
+from .registry import PowerCurveRegistry
 from .functions import IEC, gam, gam_3param, logistic_5_parametric
+from .accumulator import BinnedPowerCurveAccumulator
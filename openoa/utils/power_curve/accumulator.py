@@ -0,0 +1,311 @@
+"""
+This module provides mergeable, incrementally updated accumulators for the binned (IEC) power
+curve. Rather than refitting :py:func:`openoa.utils.power_curve.functions.IEC` on the full history
+each time new SCADA data arrive, the accumulator keeps the per-turbine, per-bin count, sum, and sum
+of squares of power, so that each update only costs the size of the new batch, and memory only
+scales with the number of turbines and wind speed bins.
+
+Older data can optionally be down-weighted with an exponential time decay. The decay is applied
+with forward weights (i.e., new samples are up-weighted relative to a reference time), so an update
+never needs to rescale the existing bins, unless the weights grow large enough to require
+renormalization.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from attrs import field, define
+
+from openoa.utils.power_curve.functions import _IEC_curve
+
+# Largest allowed forward-decay exponent before the reference time is moved forward
+_MAX_EXPONENT = 500.0
+
+
+def _to_timedelta(value: str | pd.Timedelta | None) -> pd.Timedelta | None:
+    return None if value is None else pd.Timedelta(value)
+
+
+@define(auto_attribs=True)
+class BinnedPowerCurveAccumulator:
+    """Incrementally updated, mergeable IEC power curve statistics for any number of turbines.
+
+    Args:
+        bin_width(:obj:`float`): Width of windspeed bin. Defaults to 0.5 m/s, per the standard.
+        windspeed_start(:obj:`float`): Left edge of first windspeed bin. Defaults to 0.0.
+        windspeed_end(:obj:`float`): Right edge of last windspeed bin. Defaults to 30.0
+        half_life(:obj:`str` | `pandas.Timedelta` | `None`): The age at which a sample's weight is
+            halved, relative to the newest sample, or None to weight all samples equally. When
+            provided, the batches passed to :py:meth:`update` must contain a "time" index level or
+            column. Defaults to None.
+        power_bins(:obj:`numpy.ndarray` | `None`): Edges of a power histogram kept for each turbine
+            and wind speed bin to estimate the bin medians, or None to only track the moments.
+            Power values outside of the edges are assigned to the first or last histogram bin.
+            Defaults to None.
+        windspeed_col(:obj:`str`): The wind speed column of the batches. Defaults to
+            "WMET_HorWdSpd".
+        power_col(:obj:`str`): The power column of the batches. Defaults to "WTUR_W".
+    """
+
+    bin_width: float = field(default=0.5, converter=float)
+    windspeed_start: float = field(default=0.0, converter=float)
+    windspeed_end: float = field(default=30.0, converter=float)
+    half_life: pd.Timedelta | None = field(default=None, converter=_to_timedelta)
+    power_bins: np.ndarray | None = field(
+        default=None, converter=lambda x: None if x is None else np.asarray(x, dtype=np.float64)
+    )
+    windspeed_col: str = field(default="WMET_HorWdSpd")
+    power_col: str = field(default="WTUR_W")
+
+    # No user initialization required for attributes defined below here
+    bins: np.ndarray = field(init=False)
+    turbine_ids: list = field(init=False, factory=list)
+    count: np.ndarray = field(init=False)
+    sum: np.ndarray = field(init=False)
+    sum_squares: np.ndarray = field(init=False)
+    power_histogram: np.ndarray | None = field(init=False, default=None)
+    reference_time: pd.Timestamp | None = field(init=False, default=None)
+    _turbine_index: dict = field(init=False, factory=dict)
+
+    def __attrs_post_init__(self):
+        # Use the same bin edges as `IEC`, with any value over the maximum getting np.inf
+        n_bins = int(np.ceil((self.windspeed_end - self.windspeed_start) / self.bin_width)) + 1
+        self.bins = np.append(
+            np.linspace(self.windspeed_start, self.windspeed_end, n_bins), [np.inf]
+        )
+        self.count = np.zeros((0, self.n_bins))
+        self.sum = np.zeros((0, self.n_bins))
+        self.sum_squares = np.zeros((0, self.n_bins))
+        if self.power_bins is not None:
+            self.power_histogram = np.zeros((0, self.n_bins, self.power_bins.size - 1))
+
+    @property
+    def n_bins(self) -> int:
+        """The number of wind speed bins."""
+        return self.bins.size - 1
+
+    @property
+    def bin_centers(self) -> np.ndarray:
+        """The center of each wind speed bin, using the bin width for the last bin."""
+        return self.bins[:-1] + self.bin_width / 2
+
+    def _turbine_rows(self, turbine_ids: np.ndarray) -> np.ndarray:
+        """Maps the turbine IDs to their rows in the accumulator arrays, adding rows for any
+        turbine IDs that have not been seen before.
+        """
+        codes, uniques = pd.factorize(turbine_ids)
+        new = [t for t in uniques if t not in self._turbine_index]
+        if new:
+            for t in new:
+                self._turbine_index[t] = len(self.turbine_ids)
+                self.turbine_ids.append(t)
+            pad = ((0, len(new)), (0, 0))
+            self.count = np.pad(self.count, pad)
+            self.sum = np.pad(self.sum, pad)
+            self.sum_squares = np.pad(self.sum_squares, pad)
+            if self.power_histogram is not None:
+                self.power_histogram = np.pad(self.power_histogram, pad + ((0, 0),))
+        rows = np.array([self._turbine_index[t] for t in uniques], dtype=np.intp)
+        return rows[codes]
+
+    def _scale(self, factor: float) -> None:
+        """Multiplies all of the accumulated statistics by :py:attr:`factor`."""
+        self.count *= factor
+        self.sum *= factor
+        self.sum_squares *= factor
+        if self.power_histogram is not None:
+            self.power_histogram *= factor
+
+    def _rebase(self, reference_time: pd.Timestamp) -> None:
+        """Moves the reference time of the forward decay weights to :py:attr:`reference_time`,
+        decaying the accumulated statistics accordingly.
+        """
+        if self.reference_time is not None and reference_time != self.reference_time:
+            self._scale(2.0 ** ((self.reference_time - reference_time) / self.half_life))
+        self.reference_time = reference_time
+
+    def _weights(self, time: pd.DatetimeIndex) -> np.ndarray:
+        """Computes the forward decay weights of the samples at :py:attr:`time`."""
+        if self.reference_time is None:
+            self.reference_time = time.min()
+        if ((time.max() - self.reference_time) / self.half_life) > _MAX_EXPONENT:
+            self._rebase(time.max())
+        return 2.0 ** ((time - self.reference_time) / self.half_life).to_numpy(dtype=np.float64)
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Adds a batch of SCADA data to the accumulated statistics.
+
+        Args:
+            batch(:obj:`pandas.DataFrame`): New SCADA data with an "asset_id" index level or column,
+                the :py:attr:`windspeed_col` and :py:attr:`power_col` columns, and, when using
+                :py:attr:`half_life`, a "time" index level or column, such as
+                :py:attr:`openoa.plant.PlantData.scada`.
+        """
+        if batch.empty:
+            return
+
+        def _get(name):
+            if name in batch.columns:
+                return batch[name].to_numpy()
+            return batch.index.get_level_values(name).to_numpy()
+
+        windspeed = batch[self.windspeed_col].to_numpy(dtype=np.float64)
+        power = batch[self.power_col].to_numpy(dtype=np.float64)
+        valid = np.isfinite(windspeed) & np.isfinite(power) & (windspeed >= self.windspeed_start)
+        if not valid.any():
+            return
+
+        rows = self._turbine_rows(_get("asset_id")[valid])
+        windspeed = windspeed[valid]
+        power = power[valid]
+        weights = np.ones_like(power)
+        if self.half_life is not None:
+            weights = self._weights(pd.DatetimeIndex(_get("time")[valid]))
+
+        ix = np.searchsorted(self.bins, windspeed, side="right") - 1
+        np.add.at(self.count, (rows, ix), weights)
+        np.add.at(self.sum, (rows, ix), weights * power)
+        np.add.at(self.sum_squares, (rows, ix), weights * power**2)
+        if self.power_histogram is not None:
+            power_ix = np.searchsorted(self.power_bins, power, side="right") - 1
+            power_ix = np.clip(power_ix, 0, self.power_bins.size - 2)
+            np.add.at(self.power_histogram, (rows, ix, power_ix), weights)
+
+    def merge(self, other: BinnedPowerCurveAccumulator) -> None:
+        """Adds the statistics accumulated in :py:attr:`other`, such as from a separate worker or
+        data partition, to this accumulator.
+
+        Args:
+            other(:obj:`BinnedPowerCurveAccumulator`): An accumulator with the same wind speed bins,
+                :py:attr:`half_life`, and :py:attr:`power_bins`.
+        """
+        same_power_bins = (self.power_bins is None and other.power_bins is None) or (
+            self.power_bins is not None
+            and other.power_bins is not None
+            and np.array_equal(self.power_bins, other.power_bins)
+        )
+        if (
+            not np.array_equal(self.bins, other.bins)
+            or self.half_life != other.half_life
+            or not same_power_bins
+        ):
+            raise ValueError(
+                "Only accumulators with the same bins, `half_life`, and `power_bins` can be merged."
+            )
+        if not other.turbine_ids:
+            return
+
+        factor = 1.0
+        if self.half_life is not None:
+            if self.reference_time is None or other.reference_time > self.reference_time:
+                self._rebase(other.reference_time)
+            else:
+                factor = 2.0 ** ((other.reference_time - self.reference_time) / self.half_life)
+
+        rows = self._turbine_rows(np.asarray(other.turbine_ids, dtype=object))
+        self.count[rows] += other.count * factor
+        self.sum[rows] += other.sum * factor
+        self.sum_squares[rows] += other.sum_squares * factor
+        if self.power_histogram is not None:
+            self.power_histogram[rows] += other.power_histogram * factor
+
+    def _select(self, values: np.ndarray, turbine_id: str | None) -> np.ndarray:
+        """Returns the statistics of one turbine, or the sum over all turbines if None."""
+        if turbine_id is None:
+            return values.sum(axis=0)
+        return values[self._turbine_index[turbine_id]]
+
+    def _to_frame(self, values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            values,
+            index=pd.Index(self.turbine_ids, name="asset_id"),
+            columns=pd.Index(self.bin_centers, name="windspeed_bin"),
+        )
+
+    def mean(self) -> pd.DataFrame:
+        """The (weighted) average power of each turbine and wind speed bin.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The average power with a row per turbine and a column per wind
+                speed bin, and NaN for empty bins.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._to_frame(self.sum / self.count)
+
+    def std(self) -> pd.DataFrame:
+        """The (weighted) population standard deviation of power for each turbine and wind speed bin.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The standard deviation of power with a row per turbine and a
+                column per wind speed bin, and NaN for empty bins.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.sum / self.count
+            variance = np.maximum(self.sum_squares / self.count - mean**2, 0.0)
+        return self._to_frame(np.sqrt(variance))
+
+    def _median(self, histogram: np.ndarray) -> np.ndarray:
+        """Linearly interpolates the median power of each bin from the power histograms along the
+        last axis of :py:attr:`histogram`.
+        """
+        cumulative = np.cumsum(histogram, axis=-1)
+        half = cumulative[..., -1:] / 2
+        ix = np.minimum((cumulative < half).sum(axis=-1), histogram.shape[-1] - 1)
+        ix_ = ix[..., None]
+        below = np.take_along_axis(cumulative, ix_, axis=-1) - np.take_along_axis(
+            histogram, ix_, axis=-1
+        )
+        in_bin = np.take_along_axis(histogram, ix_, axis=-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = np.clip((half - below) / in_bin, 0.0, 1.0)[..., 0]
+        width = np.diff(self.power_bins)
+        median = self.power_bins[ix] + fraction * width[ix]
+        return np.where(cumulative[..., -1] > 0, median, np.nan)
+
+    def median(self) -> pd.DataFrame:
+        """The (weighted) median power of each turbine and wind speed bin, estimated from the power
+        histograms.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The median power with a row per turbine and a column per wind
+                speed bin, and NaN for empty bins.
+        """
+        if self.power_histogram is None:
+            raise ValueError("`power_bins` must be provided to estimate the median power.")
+        return self._to_frame(self._median(self.power_histogram))
+
+    def to_curve(
+        self, turbine_id: str | None = None, interpolate: bool = False, statistic: str = "mean"
+    ) -> Callable:
+        """Creates the IEC power curve from the accumulated statistics.
+
+        Args:
+            turbine_id(:obj:`str` | `None`): The turbine to create the power curve for, or None to
+                pool the data of all turbines. Defaults to None.
+            interpolate(:obj:`bool`): If True, returns a power curve that is linearly interpolated
+                between wind speed bin points. Otherwise, the bin-average power will be assigned to
+                all wind speeds within a particular bin. Defaults to False.
+            statistic(:obj:`str`): One of "mean" to use the bin-average power, as in
+                :py:func:`openoa.utils.power_curve.functions.IEC`, or "median" to use the bin
+                median power. Defaults to "mean".
+
+        Returns:
+            :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the
+                power curve.
+        """
+        if statistic == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                P_bin = self._select(self.sum, turbine_id) / self._select(self.count, turbine_id)
+        elif statistic == "median":
+            if self.power_histogram is None:
+                raise ValueError("`power_bins` must be provided to estimate the median power.")
+            P_bin = self._median(self._select(self.power_histogram, turbine_id))
+        else:
+            raise ValueError(f"`statistic` must be one of 'mean' or 'median', not: {statistic}")
+
+        # Linearly interpolate any missing bins
+        P_bin = pd.Series(data=P_bin).interpolate(method="linear").bfill().values
+        return _IEC_curve(self.bins, P_bin, self.windspeed_start, self.windspeed_end, interpolate)
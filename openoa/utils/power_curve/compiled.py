@@ -0,0 +1,86 @@
+"""
+This module provides a lookup-table representation of an already fitted power curve. The fitted
+curve is sampled once onto a uniform wind speed grid, and subsequent evaluations are resolved via
+index arithmetic and linear interpolation between the two neighboring grid points, which is
+considerably cheaper than re-evaluating a GAM basis or a parametric expression for every call.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def compile_power_curve(
+    fn: Callable,
+    ws_min: float = 0.0,
+    ws_max: float = 30.0,
+    resolution: float = 0.01,
+    fill_value: float | None = None,
+) -> Callable:
+    """Samples the power curve :py:attr:`fn` onto a uniform wind speed grid spanning
+    [:py:attr:`ws_min`, :py:attr:`ws_max`] and returns a power curve of the same signature that is
+    evaluated in constant time per point by linearly interpolating the sampled table.
+
+    For curves that are themselves piecewise linear, such as ``IEC(..., interpolate=True)``, the
+    compiled curve is exact whenever the knots of the curve fall on the grid (e.g., a
+    :py:attr:`resolution` that evenly divides the bin width).
+
+    Args:
+        fn(:obj:`Callable`): Fitted power curve of type (Array[float] -> Array[float]), such as
+            those returned by :py:func:`openoa.utils.power_curve.functions.IEC`,
+            :py:func:`openoa.utils.power_curve.functions.logistic_5_parametric`, or
+            :py:func:`openoa.utils.power_curve.functions.gam`.
+        ws_min(:obj:`float`): Lowest wind speed of the lookup table. Defaults to 0.0.
+        ws_max(:obj:`float`): Highest wind speed of the lookup table. Defaults to 30.0.
+        resolution(:obj:`float`): Maximum spacing of the lookup table's wind speed grid, in m/s.
+            Defaults to 0.01.
+        fill_value(:obj:`float` | `None`): Power assigned to wind speeds outside of
+            [:py:attr:`ws_min`, :py:attr:`ws_max`] and to non-finite wind speeds. If None, then
+            those points are passed through to :py:attr:`fn`, so the compiled curve matches the
+            original curve outside of the table. Defaults to None.
+
+    Returns:
+        :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the
+            tabulated power curve.
+    """
+    if resolution <= 0:
+        raise ValueError("`resolution` must be a positive number.")
+    if ws_max <= ws_min:
+        raise ValueError("`ws_max` must be larger than `ws_min`.")
+
+    # Sample the curve once, shrinking the grid spacing as needed so both end points are included
+    n_points = int(np.ceil((ws_max - ws_min) / resolution)) + 1
+    grid = np.linspace(ws_min, ws_max, n_points)
+    step = (ws_max - ws_min) / (n_points - 1)
+    table = np.asarray(fn(grid), dtype=np.float64).reshape(n_points)
+    slope = np.append(np.diff(table), 0.0)
+    last = n_points - 1
+
+    def pc_compiled(x):
+        if isinstance(x, (pd.Series, pd.DataFrame)):
+            x = x.values
+        x = np.asarray(x, dtype=np.float64)
+        shape = x.shape
+        x = x.reshape(-1)
+
+        in_range = (x >= ws_min) & (x <= ws_max)
+
+        # Fractional position on the grid, and the index of the grid point to its left
+        position = (x[in_range] - ws_min) / step
+        ix = np.minimum(position.astype(np.intp), last)
+
+        P = np.empty(x.shape, dtype=np.float64)
+        P[in_range] = table[ix] + (position - ix) * slope[ix]
+
+        out_of_range = ~in_range
+        if out_of_range.any():
+            if fill_value is None:
+                P[out_of_range] = np.asarray(fn(x[out_of_range]), dtype=np.float64).reshape(-1)
+            else:
+                P[out_of_range] = fill_value
+        return P.reshape(shape)
+
+    return pc_compiled
@@ -17,6 +17,9 @@ from openoa.utils._converters import series_method, dataframe_method
 from openoa.utils.power_curve.parametric_forms import logistic5param
 from openoa.utils.power_curve.parametric_optimize import least_squares, fit_parametric_power_curve
 
+# Parameter bounds for the 5 parameter logistic fit, with power in kW and wind speed in m/s
+LOGISTIC_5_BOUNDS = ((1200, 1800), (-10, -1e-3), (1e-3, 30), (1e-3, 1), (1e-3, 10))
+
 
 @series_method(data_cols=["windspeed_col", "power_col"])
 def IEC(
@@ -51,6 +54,32 @@ def IEC(
 
     """
 
+    bins, P_bin = _IEC_bin_power(
+        windspeed_col, power_col, bin_width, windspeed_start, windspeed_end
+    )
+    return _IEC_curve(bins, P_bin, windspeed_start, windspeed_end, interpolate)
+
+
+def _IEC_bin_power(
+    windspeed: pd.Series,
+    power: pd.Series,
+    bin_width: float,
+    windspeed_start: float,
+    windspeed_end: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Computes the bin edges and bin-average power of the IEC power curve.
+
+    Args:
+        windspeed(:obj:`pandas.Series`): Wind speed data.
+        power(:obj:`pandas.Series`): Power data.
+        bin_width(:obj:`float`): Width of windspeed bin.
+        windspeed_start(:obj:`float`): Left edge of first windspeed bin.
+        windspeed_end(:obj:`float`): Right edge of last windspeed bin.
+
+    Returns:
+        :obj:`tuple[numpy.ndarray, numpy.ndarray]`: The bin edges, with ``np.inf`` as the right edge
+            of the last bin, and the gap-filled average power of each bin.
+    """
     # Set up evenly spaced bins of fixed width, with any value over the maximum getting np.inf
     n_bins = int(np.ceil((windspeed_end - windspeed_start) / bin_width)) + 1
     bins = np.append(np.linspace(windspeed_start, windspeed_end, n_bins), [np.inf])
@@ -60,11 +89,35 @@ def IEC(
 
     # Compute the mean of each bin and set corresponding P_bin
     for ibin in range(0, len(bins) - 1):
-        indices = (windspeed_col >= bins[ibin]) & (windspeed_col < bins[ibin + 1])
-        P_bin[ibin] = power_col.loc[indices].mean()
+        indices = (windspeed >= bins[ibin]) & (windspeed < bins[ibin + 1])
+        P_bin[ibin] = power.loc[indices].mean()
 
     # Linearly interpolate any missing bins
     P_bin = pd.Series(data=P_bin).interpolate(method="linear").bfill().values
+    return bins, P_bin
+
+
+def _IEC_curve(
+    bins: np.ndarray,
+    P_bin: np.ndarray,
+    windspeed_start: float,
+    windspeed_end: float,
+    interpolate: bool,
+) -> Callable:
+    """Creates the IEC power curve function from the bin edges and bin-average power produced by
+    :py:func:`_IEC_bin_power`.
+
+    Args:
+        bins(:obj:`numpy.ndarray`): The wind speed bin edges.
+        P_bin(:obj:`numpy.ndarray`): The average power of each bin.
+        windspeed_start(:obj:`float`): Left edge of first windspeed bin.
+        windspeed_end(:obj:`float`): Right edge of last windspeed bin.
+        interpolate(:obj:`bool`): If True, returns a power curve that is linearly interpolated
+            between wind speed bin points, otherwise a step function of the bin averages.
+
+    Returns:
+        :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the power curve.
+    """
 
     # Create a closure over the computed bins which computes the power curve value for arbitrary array-like input
     def pc_iec_bin(x):
@@ -76,22 +129,24 @@ def IEC(
         P[cutoff_idx] = 0.0
         return P
 
+    if not interpolate:
+        return pc_iec_bin
+
+    # Build the interpolator once, rather than on every evaluation of the power curve
+    f_interp = interp1d(
+        bins[0:-1] + 0.5 / 2,
+        P_bin,
+        fill_value=(P_bin[0], P_bin[-1]),
+        bounds_error=False,
+    )
+
     def pc_iec_interp(x):
-        f = interp1d(
-            bins[0:-1] + 0.5 / 2,
-            P_bin,
-            fill_value=(P_bin[0], P_bin[-1]),
-            bounds_error=False,
-        )
-        P = f(x)
+        P = f_interp(x)
         cutoff_idx = (x < windspeed_start) | (x > windspeed_end)
         P[cutoff_idx] = 0.0
         return P
 
-    if interpolate:
-        return pc_iec_interp
-    else:
-        return pc_iec_bin
+    return pc_iec_interp
 
 
 @series_method(data_cols=["windspeed_col", "power_col"])
@@ -140,7 +195,7 @@ def logistic_5_parametric(
         curve=logistic5param,
         optimization_algorithm=differential_evolution,
         cost_function=least_squares,
-        bounds=((1200, 1800), (-10, -1e-3), (1e-3, 30), (1e-3, 1), (1e-3, 10)),
+        bounds=LOGISTIC_5_BOUNDS,
     )
 
 
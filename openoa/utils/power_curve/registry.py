@@ -0,0 +1,329 @@
+"""
+This module provides a persistent, on-disk registry of fitted power curves. Each fitted curve is
+stored alongside the state required to rebuild it (the binned table for the IEC method, the fitted
+parameters for the parametric methods, and the fitted model for the GAM method), and is keyed by
+the turbine ID, fitting method, hyperparameters, and a content hash of the wind speed and power
+data. Repeated requests for an unchanged turbine are then loaded from disk instead of being refit,
+and the least recently used curves are evicted once the registry exceeds its size limits.
+
+.. note:: Registry entries are stored with :py:mod:`pickle`, so a registry directory should only
+    be shared with trusted users.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import pickle
+import hashlib
+import inspect
+import tempfile
+from typing import Any, Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from attrs import field, define
+from pygam import LinearGAM
+from scipy.optimize import differential_evolution
+
+from openoa.logging import logging
+from openoa.utils.power_curve import functions
+from openoa.utils.power_curve.parametric_forms import logistic5param
+from openoa.utils.power_curve.parametric_optimize import least_squares, fit_parametric_power_curve
+
+logger = logging.getLogger(__name__)
+
+
+def _fit_IEC(windspeed: pd.Series, power: pd.Series, **kwargs) -> dict:
+    bins, P_bin = functions._IEC_bin_power(
+        windspeed,
+        power,
+        kwargs["bin_width"],
+        kwargs["windspeed_start"],
+        kwargs["windspeed_end"],
+    )
+    return dict(bins=bins, P_bin=P_bin)
+
+
+def _build_IEC(state: dict, **kwargs) -> Callable:
+    return functions._IEC_curve(
+        state["bins"],
+        state["P_bin"],
+        kwargs["windspeed_start"],
+        kwargs["windspeed_end"],
+        kwargs["interpolate"],
+    )
+
+
+def _fit_logistic_5_parametric(windspeed: pd.Series, power: pd.Series, **kwargs) -> dict:
+    _, fit = fit_parametric_power_curve(
+        windspeed,
+        power,
+        curve=logistic5param,
+        optimization_algorithm=differential_evolution,
+        cost_function=least_squares,
+        bounds=functions.LOGISTIC_5_BOUNDS,
+        return_params=True,
+    )
+    return dict(params=np.asarray(fit.x, dtype=float))
+
+
+def _build_logistic_5_parametric(state: dict, **kwargs) -> Callable:
+    params = state["params"]
+
+    def fit_curve(x):
+        return logistic5param(x, *params)
+
+    return fit_curve
+
+
+def _fit_gam(windspeed: pd.Series, power: pd.Series, **kwargs) -> dict:
+    model = LinearGAM(n_splines=kwargs["n_splines"]).fit(windspeed.values, power.values)
+    return dict(model=model)
+
+
+def _build_gam(state: dict, **kwargs) -> Callable:
+    return state["model"].predict
+
+
+# Mapping of the supported fitting methods to the power curve function, the method that produces
+# the storable state of a fit, and the method that rebuilds the power curve from that state
+FIT_METHODS = {
+    "IEC": (functions.IEC, _fit_IEC, _build_IEC),
+    "logistic_5_parametric": (
+        functions.logistic_5_parametric,
+        _fit_logistic_5_parametric,
+        _build_logistic_5_parametric,
+    ),
+    "gam": (functions.gam, _fit_gam, _build_gam),
+}
+
+
+def data_fingerprint(windspeed: np.ndarray | pd.Series, power: np.ndarray | pd.Series) -> str:
+    """Computes a content hash of the wind speed and power data used to fit a power curve.
+
+    Args:
+        windspeed(:obj:`numpy.ndarray` | `pandas.Series`): Wind speed data.
+        power(:obj:`numpy.ndarray` | `pandas.Series`): Power data.
+
+    Returns:
+        :obj:`str`: The hexadecimal SHA-256 digest of the data.
+    """
+    digest = hashlib.sha256()
+    for values in (windspeed, power):
+        values = np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+        digest.update(str(values.shape).encode("utf-8"))
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def _method_hyperparameters(method: str, kwargs: dict) -> dict:
+    """Merges the user-provided hyperparameters with the defaults of the fitting method, so that
+    explicitly passing a default value produces the same registry key as omitting it.
+    """
+    func = inspect.unwrap(FIT_METHODS[method][0])
+    defaults = {
+        name: param.default
+        for name, param in inspect.signature(func).parameters.items()
+        if name not in ("windspeed_col", "power_col", "data")
+    }
+    if invalid := set(kwargs).difference(defaults):
+        raise ValueError(f"Invalid hyperparameters for the `{method}` power curve: {invalid}")
+    defaults.update(kwargs)
+    return defaults
+
+
+@define(auto_attribs=True)
+class PowerCurveRegistry:
+    """Persistent registry of fitted power curves stored as one file per fitted curve in
+    :py:attr:`path`.
+
+    Args:
+        path(:obj:`str` | `pathlib.Path`): Directory where the fitted power curves are stored. The
+            directory is created if it does not already exist.
+        max_entries(:obj:`int` | `None`): Maximum number of fitted power curves to keep, after
+            which the least recently used curves are removed. If None, then the number of curves is
+            not limited. Defaults to 1000.
+        max_bytes(:obj:`int` | `None`): Maximum total size, in bytes, of the stored power curves,
+            after which the least recently used curves are removed. If None, then the size of the
+            registry is not limited. Defaults to None.
+    """
+
+    path: Path = field(converter=lambda x: Path(x).resolve())
+    max_entries: int | None = field(default=1000)
+    max_bytes: int | None = field(default=None)
+
+    def __attrs_post_init__(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def key(
+        self,
+        turbine_id: str,
+        method: str,
+        windspeed: np.ndarray | pd.Series,
+        power: np.ndarray | pd.Series,
+        **kwargs,
+    ) -> str:
+        """Creates the registry key for a power curve fit.
+
+        Args:
+            turbine_id(:obj:`str`): The turbine's asset ID.
+            method(:obj:`str`): One of "IEC", "logistic_5_parametric", or "gam".
+            windspeed(:obj:`numpy.ndarray` | `pandas.Series`): Wind speed data.
+            power(:obj:`numpy.ndarray` | `pandas.Series`): Power data.
+            kwargs: Hyperparameters of the fitting method.
+
+        Returns:
+            :obj:`str`: The registry key.
+        """
+        if method not in FIT_METHODS:
+            raise ValueError(f"`method` must be one of {[*FIT_METHODS]}, not: {method}")
+        payload = dict(
+            turbine_id=str(turbine_id),
+            method=method,
+            hyperparameters=_method_hyperparameters(method, kwargs),
+            data=data_fingerprint(windspeed, power),
+        )
+        payload = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}.pkl"
+
+    def __contains__(self, key: str) -> bool:
+        return self._entry_path(key).is_file()
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _entries(self) -> list[Path]:
+        return list(self.path.glob("*.pkl"))
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        fn = self._entry_path(key)
+        try:
+            with open(fn, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: disable=E722
+            logger.warning(f"Removing the unreadable power curve registry entry: {fn}")
+            fn.unlink(missing_ok=True)
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(fn)
+        except FileNotFoundError:
+            pass
+        return entry
+
+    def get(self, key: str) -> Callable | None:
+        """Loads the power curve stored under :py:attr:`key`.
+
+        Args:
+            key(:obj:`str`): A registry key created by :py:meth:`key`.
+
+        Returns:
+            :obj:`Callable` | `None`: The power curve, or None if it is not in the registry.
+        """
+        if (entry := self._load(key)) is None:
+            return None
+        build = FIT_METHODS[entry["method"]][2]
+        return build(entry["state"], **entry["hyperparameters"])
+
+    def get_or_fit(
+        self,
+        turbine_id: str,
+        method: str,
+        windspeed: np.ndarray | pd.Series,
+        power: np.ndarray | pd.Series,
+        **kwargs,
+    ) -> Callable:
+        """Returns the stored power curve for the turbine and data, if it exists, otherwise fits
+        the power curve and stores it in the registry.
+
+        Args:
+            turbine_id(:obj:`str`): The turbine's asset ID.
+            method(:obj:`str`): One of "IEC", "logistic_5_parametric", or "gam".
+            windspeed(:obj:`numpy.ndarray` | `pandas.Series`): Wind speed data.
+            power(:obj:`numpy.ndarray` | `pandas.Series`): Power data.
+            kwargs: Hyperparameters passed to the fitting method, such as ``bin_width`` for "IEC",
+                or ``n_splines`` for "gam".
+
+        Returns:
+            :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the
+                power curve.
+        """
+        key = self.key(turbine_id, method, windspeed, power, **kwargs)
+        if (curve := self.get(key)) is not None:
+            logger.info(f"Loaded the {method} power curve for {turbine_id} from the registry")
+            return curve
+
+        logger.info(f"Fitting the {method} power curve for {turbine_id}")
+        hyperparameters = _method_hyperparameters(method, kwargs)
+        windspeed = pd.Series(np.asarray(windspeed, dtype=np.float64))
+        power = pd.Series(np.asarray(power, dtype=np.float64))
+        _, fit, build = FIT_METHODS[method]
+        state = fit(windspeed, power, **hyperparameters)
+        self.put(key, turbine_id, method, hyperparameters, state)
+        return build(state, **hyperparameters)
+
+    def put(
+        self, key: str, turbine_id: str, method: str, hyperparameters: dict, state: dict
+    ) -> None:
+        """Stores the fitted state of a power curve, then evicts the least recently used entries
+        if the registry exceeds its size limits.
+
+        Args:
+            key(:obj:`str`): A registry key created by :py:meth:`key`.
+            turbine_id(:obj:`str`): The turbine's asset ID.
+            method(:obj:`str`): One of "IEC", "logistic_5_parametric", or "gam".
+            hyperparameters(:obj:`dict`): The complete set of hyperparameters of the fit.
+            state(:obj:`dict`): The fitted state that is used to rebuild the power curve.
+        """
+        entry = dict(
+            turbine_id=str(turbine_id),
+            method=method,
+            hyperparameters=hyperparameters,
+            state=state,
+        )
+
+        # Write to a temporary file first, so readers never see a partially written entry
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False) as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, self._entry_path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used power curves until the registry is within both
+        :py:attr:`max_entries` and :py:attr:`max_bytes`.
+        """
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        entries = []
+        for fn in self._entries():
+            try:
+                stat = fn.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fn))
+        entries.sort(key=lambda x: x[0])
+
+        n_entries = len(entries)
+        n_bytes = sum(size for _, size, _ in entries)
+        for _, size, fn in entries:
+            too_many = self.max_entries is not None and n_entries > self.max_entries
+            too_large = self.max_bytes is not None and n_bytes > self.max_bytes
+            if not (too_many or too_large):
+                break
+            fn.unlink(missing_ok=True)
+            n_entries -= 1
+            n_bytes -= size
+
+    def clear(self) -> None:
+        """Removes all power curves from the registry."""
+        for fn in self._entries():
+            fn.unlink(missing_ok=True)
@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Tuple, Union
+from typing import TYPE_CHECKING, Tuple, Union
 from datetime import datetime
 
 import pytz
-import h5pyd
 import numpy as np
 import pandas as pd
 import dateutil
 import matplotlib.pyplot as plt
+from attrs import define
 from pyproj import Proj
-from dateutil import tz
 
+from openoa.plant import PlantData
 from openoa.utils import timeseries as ts
 from openoa.logging import logging, logged_method_call
 from openoa.utils.plot import set_styling
 
+if TYPE_CHECKING:
+    import h5pyd
+
 Number = Union[int, float]
 logger = logging.getLogger(__name__)
 set_styling()
@@ -28,8 +31,8 @@ def _remove_tz(df: pd.DataFrame, t_local_column: str) -> tuple[np.ndarray, np.nd
     a truth array for filtering the values and the timezone-naive timestamps.
 
     This function should be used after all data has been converted to timestamps, and will
-    therefore only be checking for `float` data as invalid because this is the standard
-    fault data-type in the conversion to datetime data.
+    therefore mark any element that cannot be converted to a timestamp, such as the `float` NaN
+    values that are the standard fault data-type in the conversion to datetime data, as invalid.
 
     Args:
         df (:obj:`pandas.DataFrame`): The DataFrame of interest.
@@ -37,21 +40,14 @@ def _remove_tz(df: pd.DataFrame, t_local_column: str) -> tuple[np.ndarray, np.nd
 
     Returns:
         :obj:`numpy.ndarray`: Truth array that can be used to filter the timestamps and subsequent values.
-        :obj:`numpy.ndarray`: Array of timezone-naive python `datetime` objects.
+        :obj:`numpy.ndarray`: Array of timezone-naive ``numpy.datetime64`` timestamps, with NaT in
+            place of the invalid elements.
     """
-    arr = np.array(
-        [
-            (
-                [True, pd.to_datetime(el).tz_localize(None).to_pydatetime()]
-                if not isinstance(el, float)
-                else [False, np.nan]
-            )
-            for ix, el in enumerate(df.loc[:, t_local_column])
-        ]
-    )
-    ix_filter = arr[:, 0].astype(bool)
-    time_stamps = arr[:, 1]
-    return ix_filter, time_stamps
+    time_stamps = pd.to_datetime(df.loc[:, t_local_column], errors="coerce")
+    if time_stamps.dt.tz is not None:
+        time_stamps = time_stamps.dt.tz_localize(None)
+    ix_filter = time_stamps.notna().to_numpy()
+    return ix_filter, time_stamps.to_numpy()
 
 
 def _get_time_window(df, ix, hour_window, time_col, local_time_col, utc_time_col):
@@ -102,11 +98,12 @@ def determine_offset_dst(df: pd.DataFrame, local_tz: str) -> pd.DataFrames:
     _non_dst_offset = pytz.timezone(local_tz).localize(datetime(2021, 1, 1)).utcoffset()
 
     dt = df.copy().tz_convert(local_tz)
-    dt_col = dt.index.to_pydatetime()
 
-    # Determine the Daylight Savings Time status and UTC offset
-    dt[_offset] = [el.utcoffset() for el in dt_col]
-    dt[_dst] = (dt[_offset] != _non_dst_offset).astype(bool)
+    # Determine the Daylight Savings Time status and UTC offset from the difference between the
+    # local and UTC wall clock times
+    offset = dt.index.tz_localize(None) - dt.index.tz_convert("UTC").tz_localize(None)
+    dt[_offset] = offset.to_numpy()
+    dt[_dst] = np.asarray(offset != _non_dst_offset)
 
     # Convert back to UTC
     dt = dt.tz_convert("UTC")
@@ -145,9 +142,13 @@ def convert_datetime_column(
     # Convert the timestamps to datetime.datetime objects
     dt_col = df[time_col].values
 
-    # Check for raw timestamp inputs or pre-formatted
+    # Check for raw timestamp inputs or pre-formatted, and parse each string individually only if
+    # the strings do not share a consistent format
     if isinstance(dt_col[0], str):
-        dt_col = [dateutil.parser.parse(el) for el in dt_col]
+        try:
+            dt_col = pd.to_datetime(dt_col, utc=tz_aware)
+        except ValueError:
+            dt_col = pd.to_datetime(dt_col, utc=tz_aware, format="mixed")
 
     # Read the timestamps as UTC, then convert to the local timezone if the data are
     # timezone-aware, otherwise localize the timestamp to the local timezone
@@ -162,12 +163,7 @@ def convert_datetime_column(
     df = df.set_index(pd.DatetimeIndex(df[t_local]))
 
     # Create the UTC-converted time-stamp
-    try:
-        utc = tz.tzutc()
-        df[t_utc] = pd.to_datetime([el.astimezone(utc) for el in df.index]).tz_convert("UTC")
-    except AttributeError:  # catches numpy datetime error for astimezone() not existing
-        df = df.tz_convert("UTC")
-        df[t_utc] = df.index
+    df[t_utc] = df.index.tz_convert("UTC")
 
     # Adjust the index name to reflect the change to a UTC-based timestamp
     df.index.name = t_utc
@@ -200,15 +196,15 @@ def duplicate_time_identification(
     t_utc = f"{time_col}_utc"
     t_local = f"{time_col}_localized"
 
-    time_dups = df.loc[df.duplicated(subset=[id_col, time_col]), time_col]
+    time_dups = ts.find_duplicate_times(df[time_col], df[id_col])
     time_dups_utc = None
     time_dups_local = None
 
     if t_utc in df.columns:
-        time_dups_utc = df.loc[df.duplicated(subset=[id_col, t_utc]), t_utc]
+        time_dups_utc = ts.find_duplicate_times(df[t_utc], df[id_col])
 
     if t_local in df.columns:
-        time_dups_local = df.loc[df.duplicated(subset=[id_col, t_local]), t_local]
+        time_dups_local = ts.find_duplicate_times(df[t_local], df[id_col])
 
     return time_dups, time_dups_local, time_dups_utc
 
@@ -264,6 +260,267 @@ def describe(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
     return df.describe(**kwargs).T
 
 
+@define(frozen=True)
+class SCADAReport:
+    """The per-asset QA summary of a SCADA data set that is produced by :py:func:`scada_report`.
+
+    Args:
+        summary(:obj:`pandas.DataFrame`): One row per asset and data column with the columns:
+            - asset_id: The asset ID.
+            - column: The name of the data column.
+            - count: The number of rows for the asset.
+            - valid: The number of non-NaN values.
+            - nan_fraction: The fraction of NaN values, or 1 if there are no rows for the asset.
+            - mean, std, min, max: The moments and range of the non-NaN values.
+            - out_of_range: The number of non-NaN values outside of the provided valid range, or 0
+              if no range was provided for the column.
+            - frozen_runs: The number of runs of at least ``frozen_threshold`` consecutive,
+              identical values.
+            - frozen_samples: The total number of values in the frozen runs.
+        timestamps(:obj:`pandas.DataFrame`): One row per asset with the columns: "asset_id",
+            "count", "start", "end", "duplicates" (number of repeated timestamps after their first
+            occurrence), "gaps" (number of gap intervals), and "missing" (number of missing
+            timestamps).
+        gaps(:obj:`pandas.DataFrame`): One row per gap interval with the columns: "asset_id",
+            "start" (the first missing timestamp), and "length" (the number of consecutive missing
+            timestamps).
+    """
+
+    summary: pd.DataFrame
+    timestamps: pd.DataFrame
+    gaps: pd.DataFrame
+
+
+def _get_column_or_level(df: pd.DataFrame, name: str) -> pd.Index | pd.Series:
+    """Returns the index level :py:attr:`name` of :py:attr:`df` if it exists, otherwise the column."""
+    if name in df.index.names:
+        return df.index.get_level_values(name)
+    return df[name]
+
+
+def scada_report(
+    data: PlantData | pd.DataFrame,
+    freq: str | None = None,
+    columns: list[str] | None = None,
+    ranges: dict[str, tuple[float, float]] | None = None,
+    frozen_threshold: int = 3,
+    time_col: str = "time",
+    id_col: str = "asset_id",
+    chunk_size: int | None = None,
+) -> SCADAReport:
+    """Produces the per-asset QA summary of the SCADA data in a single pass over the data, replacing
+    separate calls to :py:func:`duplicate_time_identification`, :py:func:`gap_time_identification`,
+    :py:func:`describe`, :py:func:`openoa.utils.filters.range_flag`,
+    :py:func:`openoa.utils.filters.unresponsive_flag`, and
+    :py:func:`openoa.utils.timeseries.percent_nan`.
+
+    The timestamps and asset IDs are sorted once as integer arrays, and the data columns are then
+    visited in (asset_id, time) order in chunks of :py:attr:`chunk_size` rows, so that no per-row
+    flag data is ever created. Rows with a missing timestamp or asset ID are not included.
+
+    Args:
+        data(:obj:`PlantData` | `pandas.DataFrame`): A ``PlantData`` object, in which case
+            :py:attr:`PlantData.scada` is used, or a SCADA data frame containing the
+            :py:attr:`time_col` and :py:attr:`id_col` as either columns or index levels.
+        freq(:obj:`str` | `None`, optional): The expected frequency of the timestamps. Required if
+            :py:attr:`data` is a ``pandas.DataFrame``, otherwise defaults to the SCADA frequency
+            in the ``PlantData`` metadata. Defaults to None.
+        columns(:obj:`list[str]` | `None`, optional): The data columns to summarize. If None, then
+            all non-boolean numeric columns are used. Defaults to None.
+        ranges(:obj:`dict[str, tuple[float, float]]` | `None`, optional): The inclusive (lower,
+            upper) valid range of any of the :py:attr:`columns` to count the out of range values
+            for. Defaults to None.
+        frozen_threshold(:obj:`int`, optional): The minimum number of consecutive, identical values
+            of an asset for them to be considered a frozen sensor. Defaults to 3.
+        time_col(:obj:`str`, optional): The name of the timestamp column or index level. Defaults to
+            "time".
+        id_col(:obj:`str`, optional): The name of the asset ID column or index level. Defaults to
+            "asset_id".
+        chunk_size(:obj:`int` | `None`, optional): The number of rows to process at a time. If
+            None, then all rows are processed at once. Defaults to None.
+
+    Raises:
+        ValueError: Raised if :py:attr:`freq` is not provided for a ``pandas.DataFrame``.
+        ValueError: Raised if :py:attr:`frozen_threshold` is not an integer of at least 2.
+
+    Returns:
+        :obj:`SCADAReport`: The per-asset summaries of the data columns, timestamps, and time gaps.
+    """
+    if isinstance(data, PlantData):
+        if freq is None:
+            freq = data.metadata.scada.frequency
+        data = data.scada
+    if freq is None:
+        raise ValueError("`freq` must be provided when `data` is a pandas DataFrame.")
+    if not isinstance(frozen_threshold, int) or frozen_threshold < 2:
+        raise ValueError("`frozen_threshold` must be an integer of at least 2.")
+    ranges = {} if ranges is None else ranges
+    if columns is None:
+        columns = [
+            col
+            for col, dtype in data.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            and col not in (time_col, id_col)
+        ]
+
+    # Sort the timestamps by asset and time as integer arrays
+    time = _get_column_or_level(data, time_col)
+    ids = _get_column_or_level(data, id_col)
+    codes, ns, position, asset_ids, tz = ts._sorted_time_codes(time, ids)
+    n_assets = asset_ids.size
+    n_rows = ns.size
+
+    # Summarize the timestamps of each asset
+    count = np.bincount(codes, minlength=n_assets)
+    first_row = np.searchsorted(codes, np.arange(n_assets))
+    last_row = np.searchsorted(codes, np.arange(n_assets), side="right") - 1
+    has_rows = count > 0
+    start = np.full(n_assets, np.iinfo(np.int64).min)
+    end = np.full(n_assets, np.iinfo(np.int64).min)
+    start[has_rows] = ns[first_row[has_rows]]
+    end[has_rows] = ns[last_row[has_rows]]
+    repeated = (np.diff(ns) == 0) & (np.diff(codes) == 0)
+    gap_codes, gap_start, gap_length = ts._time_gap_intervals(
+        codes, ns, pd.tseries.frequencies.to_offset(freq).nanos
+    )
+
+    def to_datetime(values: np.ndarray) -> pd.DatetimeIndex:
+        values = pd.to_datetime(values)
+        return values if tz is None else values.tz_localize("UTC").tz_convert(tz)
+
+    timestamps = pd.DataFrame(
+        {
+            "asset_id": asset_ids,
+            "count": count,
+            "start": to_datetime(start),
+            "end": to_datetime(end),
+            "duplicates": np.bincount(codes[1:][repeated], minlength=n_assets),
+            "gaps": np.bincount(gap_codes, minlength=n_assets),
+            "missing": np.bincount(gap_codes, weights=gap_length, minlength=n_assets).astype(int),
+        }
+    )
+    gaps = pd.DataFrame(
+        {"asset_id": asset_ids[gap_codes], "start": to_datetime(gap_start), "length": gap_length}
+    )
+
+    # Initialize the running statistics for each column
+    values = {col: data[col].to_numpy(dtype=float, na_value=np.nan) for col in columns}
+    stats = {
+        col: dict(
+            valid=np.zeros(n_assets, dtype=int),
+            mean=np.zeros(n_assets),
+            m2=np.zeros(n_assets),
+            min=np.full(n_assets, np.inf),
+            max=np.full(n_assets, -np.inf),
+            out_of_range=np.zeros(n_assets, dtype=int),
+            frozen_runs=np.zeros(n_assets, dtype=int),
+            frozen_samples=np.zeros(n_assets, dtype=int),
+            # The value, asset code, and length of the run that is continued across chunks
+            run=[np.nan, -1, 0],
+        )
+        for col in columns
+    }
+
+    def end_runs(col_stats: dict, run_codes: np.ndarray, run_lengths: np.ndarray) -> None:
+        frozen = run_lengths >= frozen_threshold
+        col_stats["frozen_runs"] += np.bincount(run_codes[frozen], minlength=n_assets)
+        col_stats["frozen_samples"] += np.bincount(
+            run_codes[frozen], weights=run_lengths[frozen], minlength=n_assets
+        ).astype(int)
+
+    chunk_size = max(n_rows, 1) if chunk_size is None else chunk_size
+    for lo in range(0, n_rows, chunk_size):
+        chunk_codes = codes[lo : lo + chunk_size]
+        chunk_position = position[lo : lo + chunk_size]
+        for col in columns:
+            col_stats = stats[col]
+            x = values[col][chunk_position]
+            finite = ~np.isnan(x)
+            x_codes = chunk_codes[finite]
+            x_finite = x[finite]
+
+            # Merge the chunk's moments with the running moments
+            n_b = np.bincount(x_codes, minlength=n_assets)
+            has_values = n_b > 0
+            mean_b = np.zeros(n_assets)
+            mean_b[has_values] = (
+                np.bincount(x_codes, weights=x_finite, minlength=n_assets)[has_values]
+                / n_b[has_values]
+            )
+            m2_b = np.bincount(
+                x_codes, weights=(x_finite - mean_b[x_codes]) ** 2, minlength=n_assets
+            )
+            n_a = col_stats["valid"]
+            n = n_a + n_b
+            delta = mean_b - col_stats["mean"]
+            col_stats["mean"][has_values] += delta[has_values] * n_b[has_values] / n[has_values]
+            col_stats["m2"][has_values] += (
+                m2_b[has_values]
+                + delta[has_values] ** 2 * n_a[has_values] * n_b[has_values] / n[has_values]
+            )
+            col_stats["valid"] = n
+            np.fmin.at(col_stats["min"], x_codes, x_finite)
+            np.fmax.at(col_stats["max"], x_codes, x_finite)
+
+            if col in ranges:
+                lower, upper = ranges[col]
+                outside = (x_finite < lower) | (x_finite > upper)
+                col_stats["out_of_range"] += np.bincount(x_codes[outside], minlength=n_assets)
+
+            # Find the runs of identical values of an asset, where NaN values never repeat, and
+            # carry the final run of the chunk into the next chunk
+            run_value, run_code, run_length = col_stats["run"]
+            same = np.empty(x.size, dtype=bool)
+            same[0] = (chunk_codes[0] == run_code) & (x[0] == run_value)
+            same[1:] = (chunk_codes[1:] == chunk_codes[:-1]) & (x[1:] == x[:-1])
+            run_starts = np.flatnonzero(~same)
+            if run_starts.size == 0:
+                col_stats["run"][2] += x.size
+                continue
+            end_runs(col_stats, np.array([run_code]), np.array([run_length + run_starts[0]]))
+            end_runs(col_stats, chunk_codes[run_starts[:-1]], np.diff(run_starts))
+            col_stats["run"] = [x[-1], chunk_codes[-1], x.size - run_starts[-1]]
+
+    summary = []
+    for col in columns:
+        col_stats = stats[col]
+        _, run_code, run_length = col_stats["run"]
+        if run_code > -1:
+            end_runs(col_stats, np.array([run_code]), np.array([run_length]))
+        valid = col_stats["valid"]
+        has_values = valid > 0
+        summary.append(
+            pd.DataFrame(
+                {
+                    "asset_id": asset_ids,
+                    "column": col,
+                    "count": count,
+                    "valid": valid,
+                    "nan_fraction": np.divide(
+                        count - valid, count, out=np.ones(n_assets), where=has_rows
+                    ),
+                    "mean": np.where(has_values, col_stats["mean"], np.nan),
+                    "std": np.sqrt(
+                        np.divide(
+                            col_stats["m2"],
+                            valid - 1,
+                            out=np.full(n_assets, np.nan),
+                            where=valid > 1,
+                        )
+                    ),
+                    "min": np.where(has_values, col_stats["min"], np.nan),
+                    "max": np.where(has_values, col_stats["max"], np.nan),
+                    "out_of_range": col_stats["out_of_range"],
+                    "frozen_runs": col_stats["frozen_runs"],
+                    "frozen_samples": col_stats["frozen_samples"],
+                }
+            )
+        )
+    summary = pd.concat(summary, ignore_index=True) if summary else pd.DataFrame()
+    return SCADAReport(summary=summary, timestamps=timestamps, gaps=gaps)
+
+
 def daylight_savings_plot(
     df: pd.DataFrame,
     local_tz: str,
@@ -344,17 +601,17 @@ def daylight_savings_plot(
             # For localized time, we want to ensure we're capturing the DST switch as missing data
             ix_filter, time_stamps = _remove_tz(data_spring, time_col)
             time_stamps = pd.Series(time_stamps[ix_filter])
-            power_data = data_spring.loc[ix_filter, power_col].tolist()
+            power_data = data_spring.loc[ix_filter, power_col].to_numpy(dtype=float)
 
             # Find the missing data points on the timezone stripped data and append
             # it to the time stamps, then identify where to insert NaN in the power data
             missing = ts.find_time_gaps(time_stamps, freq)
-            missing = pd.to_datetime(missing.values)
+            missing = pd.to_datetime(missing.values).to_numpy()
             time_stamps = np.append(time_stamps, missing)
-            time_stamps.sort()
-            nan_ix = sorted([np.where(el == time_stamps)[0][0] for el in missing])
-            for ix in nan_ix:
-                power_data.insert(ix, float("nan"))
+            power_data = np.append(power_data, np.full(missing.size, np.nan))
+            order = np.argsort(time_stamps, kind="stable")
+            time_stamps = time_stamps[order]
+            power_data = power_data[order]
 
             ax.plot(
                 time_stamps,
@@ -522,6 +779,13 @@ def wtk_diurnal_prep(
     Returns:
         pd.Series: The diurnal hourly average wind speed.
     """
+    try:
+        import h5pyd
+    except ModuleNotFoundError:
+        raise NotImplementedError(
+            "The h5pyd python package was not found. Please install it with `pip install openoa[nrel-wind]`."
+        )
+
     # Startup the API and grab the database
     f = h5pyd.File(fn, "r")
     wtk_coordinates = f["coordinates"]
@@ -141,6 +141,150 @@ def convert_dt_to_utc(
     return dt_col.dt.tz_localize(tz_string, ambiguous=True).dt.tz_convert(utc)
 
 
+def _sorted_time_codes(
+    dt_col: pd.Series, id_col: pd.Series | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, datetime.tzinfo | None]:
+    """Converts the timestamps, and optionally their asset IDs, to integer arrays sorted by asset and
+    time, dropping any missing timestamps and asset IDs.
+
+    Args:
+        dt_col(:obj:`pandas.Series`): Pandas ``Series`` of ``datetime.datetime`` objects.
+        id_col(:obj:`pandas.Series` | `None`): Pandas ``Series`` of asset IDs, corresponding to
+            :py:attr:`dt_col`, or None if all timestamps belong to the same asset.
+
+    Returns:
+        tuple[:obj:`numpy.ndarray`, :obj:`numpy.ndarray`, :obj:`numpy.ndarray`, :obj:`numpy.ndarray`, :obj:`datetime.tzinfo` | `None`]:
+            The asset ID codes and nanosecond timestamps, both sorted by asset ID code then
+            timestamp, the integer positions of the sorted values in :py:attr:`dt_col`, the asset
+            IDs corresponding to the codes, and the timezone of :py:attr:`dt_col`.
+    """
+    time = pd.DatetimeIndex(dt_col)
+    time = time.as_unit("ns")
+    ns = time.asi8
+    valid = ~time.isna()
+    if id_col is None:
+        codes = np.zeros(ns.size, dtype=np.intp)
+        uniques = np.array([None])
+    else:
+        codes, uniques = pd.factorize(np.asarray(id_col), sort=True)
+        valid &= codes > -1
+
+    position = np.flatnonzero(valid)
+    order = np.lexsort((ns[position], codes[position]))
+    position = position[order]
+    return codes[position], ns[position], position, np.asarray(uniques), time.tz
+
+
+def _time_gap_intervals(
+    codes: np.ndarray, ns: np.ndarray, step: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Finds the gap intervals of each asset from the sorted outputs of :py:func:`_sorted_time_codes`.
+
+    Args:
+        codes(:obj:`numpy.ndarray`): The sorted asset ID codes.
+        ns(:obj:`numpy.ndarray`): The nanosecond timestamps, sorted by asset ID code then timestamp.
+        step(:obj:`int`): The expected number of nanoseconds between timestamps.
+
+    Returns:
+        tuple[:obj:`numpy.ndarray`, :obj:`numpy.ndarray`, :obj:`numpy.ndarray`]: The asset ID code,
+            first missing nanosecond timestamp, and number of missing timestamps of each gap.
+    """
+    # Drop the duplicated timestamps, and find the first timestamp of each asset
+    if ns.size > 0:
+        keep = np.ones(ns.size, dtype=bool)
+        keep[1:] = (np.diff(ns) != 0) | (np.diff(codes) != 0)
+        codes = codes[keep]
+        ns = ns[keep]
+    first = np.ones(ns.size, dtype=bool)
+    first[1:] = np.diff(codes) != 0
+    anchor = ns[first][np.cumsum(first) - 1]
+
+    # For each pair of consecutive timestamps, a < b, of an asset, count the expected timestamps
+    # that fall strictly between them
+    same_asset = ~first[1:]
+    anchor = anchor[1:][same_asset]
+    a = ns[:-1][same_asset] - anchor
+    b = ns[1:][same_asset] - anchor
+    lower = a // step + 1
+    upper = -(-b // step) - 1
+    length = upper - lower + 1
+    gap = length > 0
+    return codes[1:][same_asset][gap], anchor[gap] + lower[gap] * step, length[gap]
+
+
+@series_method(data_cols=["dt_col", "id_col"])
+def find_time_gap_intervals(
+    dt_col: pd.Series | str,
+    freq: str,
+    id_col: pd.Series | str | None = None,
+    data: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """
+    Finds the gaps in :py:attr:`dt_col` based on the expected frequency, :py:attr:`freq`, and returns
+    them as intervals of the first missing timestamp and the number of consecutive missing
+    timestamps. When :py:attr:`id_col` is provided, the gaps of each asset are found independently in
+    a single pass over the data, so the timestamps of one asset do not fill the gaps of another.
+
+    The expected timestamps of each asset are anchored to its first timestamp, and duplicated
+    timestamps are ignored.
+
+    Args:
+        dt_col(:obj:`pandas.Series` | `str`): Pandas ``Series`` of ``datetime.datetime`` objects or the
+            name of the column in :py:attr:`data`.
+        freq(:obj:`string`): The expected frequency of the timestamps, which should align with
+            the pandas timestamp conventions (https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#timeseries-offset-aliases).
+        id_col(:obj:`pandas.Series` | `str` | `None`, optional): Pandas ``Series`` of the asset IDs
+            corresponding to :py:attr:`dt_col`, or the name of the column in :py:attr:`data`. If None,
+            then all timestamps are considered to belong to a single asset. Defaults to None.
+        data (:obj:`pandas.DataFrame`, optional): The pandas ``DataFrame`` containing the timestamp
+            column: :py:attr:`dt_col`, and asset ID column: :py:attr:`id_col`. Defaults to None.
+
+    Returns:
+        :obj:`pandas.DataFrame`: A data frame with a "start" column of the first missing timestamp of
+            each gap, and a "length" column of the number of missing timestamps in the gap, sorted by
+            "start". When :py:attr:`id_col` is provided, the asset ID of each gap is also provided in
+            the first column, using the name of :py:attr:`id_col`, or "asset_id" if it is unnamed.
+    """
+    columns = ["start", "length"]
+    if id_col is not None:
+        columns.insert(0, "asset_id" if id_col.name is None else id_col.name)
+
+    if dt_col.size == 0:
+        return pd.DataFrame(columns=columns)
+
+    codes, ns, _, uniques, tz = _sorted_time_codes(dt_col, id_col)
+    step = pd.tseries.frequencies.to_offset(freq).nanos
+    codes, start, length = _time_gap_intervals(codes, ns, step)
+
+    start = pd.to_datetime(start)
+    if tz is not None:
+        start = start.tz_localize("UTC").tz_convert(tz)
+    gaps = pd.DataFrame({"start": start, "length": length})
+    if id_col is not None:
+        gaps.insert(0, columns[0], uniques[codes])
+        gaps = gaps.sort_values("start", kind="stable", ignore_index=True)
+    return gaps
+
+
+def _expand_time_gap_intervals(gaps: pd.DataFrame, freq: str) -> pd.DatetimeIndex:
+    """Expands the gap intervals from :py:func:`find_time_gap_intervals` to each of the missing
+    timestamps.
+
+    Args:
+        gaps(:obj:`pandas.DataFrame`): The gap intervals from :py:func:`find_time_gap_intervals`.
+        freq(:obj:`string`): The expected frequency of the timestamps.
+
+    Returns:
+        :obj:`pandas.DatetimeIndex`: The missing timestamps.
+    """
+    length = gaps["length"].to_numpy(dtype=np.int64)
+    offset = np.arange(length.sum()) - np.repeat(np.cumsum(length) - length, length)
+    start = pd.DatetimeIndex(gaps["start"]).as_unit("ns")
+    return start.repeat(length) + pd.to_timedelta(
+        offset * pd.tseries.frequencies.to_offset(freq).nanos
+    )
+
+
 @series_method(data_cols=["dt_col"])
 def find_time_gaps(dt_col: pd.Series | str, freq: str, data: pd.DataFrame = None) -> pd.Series:
     """
@@ -155,29 +299,32 @@ def find_time_gaps(dt_col: pd.Series | str, freq: str, data: pd.DataFrame = None
             column: :py:attr:`dt_col`. Defaults to None.
 
     Returns:
-        :obj:`pandas.Series`: Series of missing time stamps in ``datetime.datetime`` format
+        :obj:`pandas.Series`: Series of missing time stamps in ``datetime.datetime`` format, sorted
+            in ascending order.
     """
     if isinstance(dt_col, pd.DatetimeIndex):
         dt_col = dt_col.to_series()
 
-    # If the difference for all of the timestamps is the expected frequency, 0 (duplicate), or a NaT
-    # (first element of `diff`), then return an empty series
-    if np.all(dt_col.diff().isin([pd.Timedelta(freq), pd.Timedelta("0"), pd.NaT])):
+    gaps = find_time_gap_intervals(dt_col, freq)
+    if gaps.empty:
         return pd.Series([], name=dt_col.name, dtype="object")
-
-    # Create a date range object and return a Series of the set difference of both objects
-    range_dt = pd.Series(data=pd.date_range(dt_col.min(), end=dt_col.max(), freq=freq))
-    return pd.Series(tuple(set(range_dt).difference(dt_col)), name=dt_col.name)
+    return pd.Series(_expand_time_gap_intervals(gaps, freq), name=dt_col.name)
 
 
-@series_method(data_cols=["dt_col"])
-def find_duplicate_times(dt_col: pd.Series | str, data: pd.DataFrame = None):
+@series_method(data_cols=["dt_col", "id_col"])
+def find_duplicate_times(
+    dt_col: pd.Series | str, id_col: pd.Series | str | None = None, data: pd.DataFrame = None
+):
     """
     Find duplicate input data and report them. The first duplicated item is not reported, only subsequent duplicates.
 
     Args:
         dt_col(:obj:`pandas.Series` | `str`): Pandas series of ``datetime.datetime`` objects or the name of the
             column in :py:attr:`data`.
+        id_col(:obj:`pandas.Series` | `str` | `None`, optional): Pandas ``Series`` of the asset IDs
+            corresponding to :py:attr:`dt_col`, or the name of the column in :py:attr:`data`, so
+            that only the repeated timestamps of a single asset are considered duplicates. If None,
+            then all timestamps are considered to belong to a single asset. Defaults to None.
         data (:obj:`pandas.DataFrame`, optional): The pandas `DataFrame` containing the timestamp
             column: :py:attr:`dt_col`. Defaults to None.
 
@@ -187,7 +334,18 @@ def find_duplicate_times(dt_col: pd.Series | str, data: pd.DataFrame = None):
     if isinstance(dt_col, pd.DatetimeIndex):
         dt_col = dt_col.to_series()
 
-    return dt_col[dt_col.duplicated()]
+    if id_col is None or dt_col.size == 0:
+        return dt_col[dt_col.duplicated()]
+
+    # Sort by asset and time, and flag every repeated value after the first occurrence, which is
+    # retained as the first by the stable sort
+    time = pd.DatetimeIndex(dt_col).as_unit("ns").asi8
+    codes, _ = pd.factorize(np.asarray(id_col), use_na_sentinel=False)
+    order = np.lexsort((time, codes))
+    repeated = (np.diff(time[order]) == 0) & (np.diff(codes[order]) == 0)
+    duplicated = np.zeros(time.size, dtype=bool)
+    duplicated[order[1:][repeated]] = True
+    return dt_col[duplicated]
 
 
 def gap_fill_data_frame(data: pd.DataFrame, dt_col: str, freq: str) -> pd.DataFrame:
@@ -200,29 +358,44 @@ def gap_fill_data_frame(data: pd.DataFrame, dt_col: str, freq: str) -> pd.DataFr
         freq(:obj:`str`): The expected frequency of the timestamps.
 
     Returns:
-        :obj:`pandas.DataFrame`: output data frame with NaN data for the data gaps
+        :obj:`pandas.DataFrame`: output data frame with NaN data for the data gaps, sorted by
+            :py:attr:`dt_col`. The inserted rows are indexed from 0 to the number of missing
+            timestamps.
 
     """
     # If the dataframe is empty, just return it.
     if data.empty:
         return data
 
-    missing_dt = find_time_gaps(data[dt_col], freq)
-    if (not missing_dt.empty) and missing_dt.notnull().any():
-        gap_df = pd.DataFrame(columns=data.columns)
-        gap_df[dt_col] = missing_dt
-        if not (gap_df.empty or gap_df.isna().values.sum() == gap_df.size):
-            data = pd.concat([data, gap_df], axis=0)
-    try:
-        return data.sort_values(dt_col)
-    except ValueError:
-        # Catches when dt_col and the index name are the same, and temporarily renames the column
-        # to perform the sort, and puts it back for the returned data
-        return (
-            data.rename(columns={dt_col: f"_{dt_col}"})
-            .sort_values(f"_{dt_col}")
-            .rename(columns={f"_{dt_col}": dt_col})
-        )
+    # Sort the data by time, keeping any missing timestamps at the end
+    time = data[dt_col]
+    order = time.reset_index(drop=True).sort_values(kind="stable").index.to_numpy()
+    data = data.iloc[order]
+    time = pd.DatetimeIndex(time.iloc[order]).as_unit("ns")
+
+    gaps = find_time_gap_intervals(time.to_series(), freq)
+    if gaps.empty:
+        return data
+    missing = _expand_time_gap_intervals(gaps, freq)
+
+    # Each row moves down by the number of missing timestamps that precede it, and the missing
+    # timestamps fill the remaining positions
+    n_data = time.size
+    n_total = n_data + missing.size
+    shift = np.searchsorted(missing.asi8, time.asi8)
+    shift[time.isna()] = missing.size
+    position = np.arange(n_data) + shift
+    is_gap = np.ones(n_total, dtype=bool)
+    is_gap[position] = False
+
+    index = data.index.append(pd.RangeIndex(missing.size))
+    source = np.empty(n_total, dtype=np.intp)
+    source[position] = np.arange(n_data)
+    source[is_gap] = np.arange(n_data, n_total)
+
+    filled = data.set_axis(position, axis=0).reindex(np.arange(n_total))
+    filled.iloc[is_gap, filled.columns.get_loc(dt_col)] = missing
+    return filled.set_axis(index[source], axis=0)
 
 
 @series_method(data_cols=["col"])
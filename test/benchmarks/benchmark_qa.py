@@ -0,0 +1,50 @@
+"""Times the timezone and daylight savings time handling in :py:mod:`openoa.utils.qa` on a
+synthetic multi-year SCADA export.
+
+Usage: python test/benchmarks/benchmark_qa.py [n_rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from openoa.utils import qa
+
+
+def synthetic_scada(n_rows: int, local_tz: str = "America/Denver") -> pd.DataFrame:
+    """Creates 10-minute data for 4 turbines with timezone-aware string timestamps."""
+    n_turbines = 4
+    timestamps = pd.date_range(
+        "2010-01-01", periods=n_rows // n_turbines, freq="10min", tz=local_tz
+    )
+    timestamps = np.tile(timestamps.strftime("%Y-%m-%d %H:%M:%S%z"), n_turbines)
+    return pd.DataFrame(
+        {
+            "time": timestamps,
+            "asset_id": np.repeat([f"T{i}" for i in range(n_turbines)], n_rows // n_turbines),
+            "power": np.random.default_rng(2023).random(timestamps.size),
+        }
+    )
+
+
+def main(n_rows: int = 5_000_000) -> None:
+    df = synthetic_scada(n_rows)
+    print(f"Synthetic SCADA data: {df.shape[0]:,} rows")
+
+    start = time.perf_counter()
+    df = qa.convert_datetime_column(df, "time", "America/Denver", tz_aware=True)
+    print(f"convert_datetime_column: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    qa.determine_offset_dst(df, "America/Denver")
+    print(f"determine_offset_dst: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    qa._remove_tz(df, "time_localized")
+    print(f"_remove_tz: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
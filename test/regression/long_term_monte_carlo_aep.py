@@ -292,6 +292,29 @@ class TestLongTermMonteCarloAEP(unittest.TestCase):
         sim_results = self.analysis.results
         self.check_simulation_results_lin_monthly(sim_results)
 
+    def test_monthly_lin_compact(self):
+        # ____________________________________________________________________
+        # Test that the compact, 32-bit data only causes a small drift in the linear regression
+        # results, at monthly time resolution
+        project_compact = project_ENGIE.prepare(
+            example_data_path_str, use_cleansed=False, compact=True
+        )
+        results = []
+        for project in (self.project, project_compact):
+            reset_prng()
+            analysis = MonteCarloAEP(
+                project,
+                reanalysis_products=["merra2", "era5"],
+                time_resolution="MS",
+                reg_model="lin",
+                reg_temperature=False,
+                reg_wind_direction=False,
+            )
+            analysis.run(num_sim=10)
+            results.append(analysis.results[["aep_GWh", "avail_pct", "curt_pct"]])
+
+        nptest.assert_allclose(results[1].values, results[0].values, rtol=1e-4, atol=1e-6)
+
     # Test inputs to the regression model, at daily time resolution
     def test_daily_inputs(self):
         reset_prng()
@@ -55,6 +55,43 @@ class TestWakeLosses(unittest.TestCase):
         )
         self.check_simulation_results_wake_losses_without_UQ()
 
+    def test_wake_losses_without_UQ_compact(self):
+        # ____________________________________________________________________
+        # Test that the compact, 32-bit data only causes a small drift in the POR and long-term
+        # corrected wake losses, without UQ.
+        project_compact = project_ENGIE.prepare(
+            example_data_path_str, use_cleansed=False, compact=True
+        )
+        project_compact.analysis_type.append("WakeLosses-scada")
+        project_compact.validate()
+        project_compact.scada["WMET_HorWdDir"] = (
+            project_compact.scada["WMET_HorWdDir"] + 15.85
+        ) % 360.0
+
+        results = []
+        for project in (self.project, project_compact):
+            reset_prng()
+            analysis = wake_losses.WakeLosses(
+                plant=project,
+                wind_direction_asset_ids=["R80711", "R80721", "R80736"],
+                end_date="2015-11-25 00:00",
+                UQ=False,
+            )
+            analysis.run(
+                no_wakes_ws_thresh_LT_corr=15.0,
+                num_years_LT=20,
+                freestream_sector_width=90.0,
+                wind_bin_mad_thresh=7.0,
+            )
+            results.append(
+                [analysis.wake_losses_por, analysis.wake_losses_lt]
+                + list(analysis.turbine_wake_losses_por)
+                + list(analysis.turbine_wake_losses_lt)
+            )
+
+        # Wake losses are fractions, so allow a drift of 0.01 percentage points
+        nptest.assert_allclose(results[1], results[0], atol=1e-4)
+
     def test_wake_losses_with_UQ(self):
         reset_prng()
         # ____________________________________________________________________
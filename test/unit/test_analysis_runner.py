@@ -0,0 +1,241 @@
+import time
+import tempfile
+import unittest
+import threading
+from unittest import mock
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.app.config import settings
+from backend.app.services import analysis_runner
+from backend.app.services.result_cache import ResultCache
+
+
+class TestRunCached(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.tmpdir.name)
+        patches = (
+            mock.patch.object(analysis_runner, "get_result_cache", return_value=self.cache),
+            mock.patch.object(analysis_runner, "plant_fingerprint", return_value="plant"),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _run_concurrently(self, compute, n=8):
+        """Runs ``n`` identical requests, and lets the first computation finish only after the
+        other requests have had time to arrive.
+        """
+
+        def _request():
+            try:
+                return analysis_runner.run_cached("wake-losses", {"num_sim": 10}, compute)
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            futures = [executor.submit(_request) for _ in range(n)]
+            self.assertTrue(self.started.wait(timeout=10))
+            time.sleep(0.2)
+            self.release.set()
+            return [future.result(timeout=10) for future in futures]
+
+    def test_concurrent_requests_share_result(self):
+        def compute(progress):
+            self.calls += 1
+            self.started.set()
+            self.release.wait(timeout=10)
+            return {"wake_losses": [0.1, 0.2]}
+
+        results = self._run_concurrently(compute)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(results[0], {"wake_losses": [0.1, 0.2]})
+        self.assertEqual(analysis_runner._inflight, {})
+
+        # Later requests are served from the cache
+        analysis_runner.run_cached("wake-losses", {"num_sim": 10}, compute)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats()["memory_hits"], 1)
+
+    def test_concurrent_requests_share_exception(self):
+        def compute(progress):
+            self.calls += 1
+            self.started.set()
+            self.release.wait(timeout=10)
+            raise ValueError("Not enough data")
+
+        results = self._run_concurrently(compute)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(analysis_runner._inflight, {})
+
+        # Failures are not cached, so the next request computes again
+        with self.assertRaises(ValueError):
+            analysis_runner.run_cached("wake-losses", {"num_sim": 10}, compute)
+        self.assertEqual(self.calls, 2)
+
+
+class TestJobs(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.tmpdir.name)
+        job_settings = replace(settings, job_concurrency=1, job_queue_size=1, job_ttl_seconds=60)
+        patches = (
+            mock.patch.object(analysis_runner, "get_result_cache", return_value=self.cache),
+            mock.patch.object(analysis_runner, "plant_fingerprint", return_value="plant"),
+            mock.patch.object(analysis_runner, "settings", job_settings),
+            mock.patch.object(analysis_runner, "_executor", None),
+            mock.patch.dict(analysis_runner._jobs, clear=True),
+            mock.patch.dict(analysis_runner._job_index_by_key, clear=True),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(analysis_runner.shutdown_jobs)
+
+        self.iterations = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def compute(self, progress):
+        progress.start(10)
+        for n in range(10):
+            progress(n, {"aep_GWh": 10.0 + n})
+            self.iterations += 1
+            if n == 2:
+                self.started.set()
+                self.release.wait(timeout=10)
+        return {"aep_GWh": 12.0}
+
+    def wait(self, job_id):
+        analysis_runner._jobs[job_id]["future"].result(timeout=10)
+        return analysis_runner.get_job(job_id)
+
+    def test_progress_and_result(self):
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertIn(job["status"], ("queued", "running"))
+        self.assertTrue(self.started.wait(timeout=10))
+
+        job = analysis_runner.get_job(job["job_id"])
+        self.assertEqual(job["status"], "running")
+        self.assertEqual(job["completed_iterations"], 3)
+        self.assertEqual(job["total_iterations"], 10)
+        self.assertAlmostEqual(job["progress"], 0.3)
+        self.assertGreater(job["eta_seconds"], 0)
+
+        # The running statistics of the completed iterations are available while the job runs
+        summary = job["summary"]["aep_GWh"]
+        self.assertEqual(summary["n"], 3)
+        self.assertAlmostEqual(summary["mean"], 11.0)
+        self.assertAlmostEqual(summary["p05"], 10.1)
+        self.assertAlmostEqual(summary["p95"], 11.9)
+
+        self.release.set()
+        job = self.wait(job["job_id"])
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["completed_iterations"], 10)
+        self.assertEqual(job["result"], {"aep_GWh": 12.0})
+        self.assertIsNone(job["eta_seconds"])
+        self.assertEqual(job["summary"]["aep_GWh"]["n"], 10)
+
+        # Submitting the same analysis again returns the finished job
+        self.assertEqual(
+            analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)["job_id"],
+            job["job_id"],
+        )
+        self.assertEqual(self.iterations, 10)
+
+    def test_cancel(self):
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertTrue(self.started.wait(timeout=10))
+
+        job = analysis_runner.cancel_job(job["job_id"])
+        self.assertEqual(job["status"], "running")
+        self.assertTrue(job["cancel_requested"])
+
+        # The analysis stops at its next iteration
+        self.release.set()
+        job = self.wait(job["job_id"])
+        self.assertEqual(job["status"], "cancelled")
+        self.assertEqual(self.iterations, 3)
+        self.assertIsNone(job["result"])
+        self.assertNotIn(analysis_runner._result_key("aep", {"num_sim": 10}), self.cache)
+
+    def test_queue_limit(self):
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertTrue(self.started.wait(timeout=10))
+
+        # Identical analyses share the running job, and other analyses are rejected
+        same = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertEqual(same["job_id"], job["job_id"])
+        with self.assertRaises(analysis_runner.JobQueueFull):
+            analysis_runner.submit_job("aep", {"num_sim": 20}, self.compute)
+
+        self.release.set()
+        self.wait(job["job_id"])
+        other = analysis_runner.submit_job("aep", {"num_sim": 20}, self.compute)
+        self.assertEqual(self.wait(other["job_id"])["status"], "completed")
+
+    def test_garbage_collection(self):
+        self.release.set()
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertEqual(self.wait(job["job_id"])["status"], "completed")
+
+        with mock.patch.object(analysis_runner, "settings", replace(settings, job_ttl_seconds=0)):
+            time.sleep(0.01)
+            self.assertIsNone(analysis_runner.get_job(job["job_id"]))
+        self.assertEqual(analysis_runner._job_index_by_key, {})
+
+        # The result is still cached, so a new job completes immediately
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(self.iterations, 10)
+
+    def _run_cached(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        self.addCleanup(self.release.set)
+        return executor.submit(analysis_runner.run_cached, "aep", {"num_sim": 10}, self.compute)
+
+    def test_cancelled_job_does_not_fail_waiting_requests(self):
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        self.assertTrue(self.started.wait(timeout=10))
+        request = self._run_cached()
+        time.sleep(0.2)
+
+        # The waiting request computes the result itself instead of failing with the job
+        analysis_runner.cancel_job(job["job_id"])
+        self.release.set()
+        self.assertEqual(request.result(timeout=10), {"aep_GWh": 12.0})
+        self.assertEqual(self.wait(job["job_id"])["status"], "cancelled")
+        self.assertEqual(self.iterations, 13)
+        self.assertEqual(analysis_runner._inflight, {})
+
+    def test_job_waiting_for_request(self):
+        request = self._run_cached()
+        self.assertTrue(self.started.wait(timeout=10))
+
+        # The job follows the progress of the request's computation instead of repeating it
+        job = analysis_runner.submit_job("aep", {"num_sim": 10}, self.compute)
+        deadline = time.monotonic() + 10
+        while job["completed_iterations"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+            job = analysis_runner.get_job(job["job_id"])
+        self.assertEqual(job["status"], "running")
+        self.assertEqual(job["completed_iterations"], 3)
+        self.assertEqual(job["summary"]["aep_GWh"]["n"], 3)
+
+        # Cancelling the job stops it waiting, and the request still completes
+        analysis_runner.cancel_job(job["job_id"])
+        self.assertEqual(self.wait(job["job_id"])["status"], "cancelled")
+        self.release.set()
+        self.assertEqual(request.result(timeout=10), {"aep_GWh": 12.0})
+        self.assertEqual(self.iterations, 10)
@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+from numpy import testing as nptest
+from backend.app.services.downsampling import (
+    lttb_indices,
+    minmax_indices,
+    stride_indices,
+    downsample_indices,
+)
+
+
+def _lttb_reference(x, y, n_out):
+    """Straightforward implementation of Largest-Triangle-Three-Buckets, one bucket at a time."""
+    n = len(y)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    for i in range(n_out - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        if i == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = min(int((i + 2) * every) + 1, n)
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        a = selected[-1]
+        area = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        selected.append(start + int(area.argmax()))
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+class TestDownsampling(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.x = np.arange(20_000, dtype=float)
+        self.y = np.cumsum(rng.normal(size=self.x.size))
+
+        # A short trip to zero and a single spike, which evenly spaced points are likely to miss
+        self.y[5_003:5_006] = -1_000.0
+        self.y[12_345] = 1_000.0
+
+    def test_lttb_matches_reference(self):
+        indices = lttb_indices(self.x, self.y, 500)
+        nptest.assert_array_equal(indices, _lttb_reference(self.x, self.y, 500))
+        self.assertEqual(self.y[indices].min(), -1_000.0)
+        self.assertEqual(self.y[indices].max(), 1_000.0)
+
+    def test_lttb_missing_values(self):
+        y = self.y.copy()
+        y[::3] = np.nan
+        y[8_000:10_000] = np.nan
+
+        indices = lttb_indices(self.x, y, 500)
+        self.assertEqual(indices.size, 500)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+        # Besides the first and last points, NaN values are only kept for the buckets in the gap
+        n_gap = ((indices >= 8_000) & (indices < 10_000)).sum()
+        self.assertEqual(np.isnan(y[indices[1:-1]]).sum(), n_gap)
+
+    def test_minmax(self):
+        indices = minmax_indices(self.y, 500)
+        self.assertLessEqual(indices.size, 500)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual(self.y[indices].min(), -1_000.0)
+        self.assertEqual(self.y[indices].max(), 1_000.0)
+
+        # The extremes of each bucket are kept
+        buckets = np.array_split(self.y, 250)
+        expected = {value for bucket in buckets for value in (bucket.min(), bucket.max())}
+        self.assertEqual(set(self.y[indices]), expected)
+
+    def test_small_inputs(self):
+        for method in ("lttb", "minmax", "stride"):
+            nptest.assert_array_equal(
+                downsample_indices(self.x[:10], self.y[:10], 10, method), range(10)
+            )
+        nptest.assert_array_equal(stride_indices(10, 4), [0, 3, 6, 9])
+        with self.assertRaises(ValueError):
+            downsample_indices(self.x, self.y, 100, "median")
@@ -0,0 +1,130 @@
+import logging
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from openoa.plant import PlantData
+from openoa.utils.parquet_store import ParquetStore
+
+pytest.importorskip("pyarrow")
+
+
+class TestParquetStore(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        time = pd.date_range("2019-12-30", "2020-01-03", freq="10min")
+        df = pd.concat(
+            [
+                pd.DataFrame(
+                    {"time": time, "asset_id": asset_id, "power": np.random.random(time.size)}
+                )
+                for asset_id in ("T1", "T2")
+            ]
+        )
+        df["status"] = 1.0
+        df = df.set_index(["time", "asset_id"]).sort_index()
+
+        # Remove a block of data to check that missing periods are filled as in pandas
+        self.df = df.drop(df.index[100:400])
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = ParquetStore.write(self.df, self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_read(self):
+        assert self.store.columns == ["power", "status"]
+        assert self.store.asset_ids.tolist() == ["T1", "T2"]
+        pd.testing.assert_frame_equal(self.store.read(), self.df)
+
+        df = self.store.read("2020-01-01", "2020-01-01 12:00", ["power"], ["T2"])
+        time = self.df.index.get_level_values("time")
+        asset_id = self.df.index.get_level_values("asset_id")
+        ix = (time >= "2020-01-01") & (time <= "2020-01-01 12:00") & (asset_id == "T2")
+        expected = self.df.loc[ix, ["power"]]
+        pd.testing.assert_frame_equal(df, expected)
+
+        # Batches cover all of the data
+        batches = list(self.store.iter_batches(batch_size=100))
+        assert max(batch.shape[0] for batch in batches) <= 100
+        pd.testing.assert_frame_equal(pd.concat(batches).sort_index(), self.df)
+
+    def test_aggregate(self):
+        grouper = [pd.Grouper(level="asset_id"), pd.Grouper(level="time", freq="h")]
+        for how in ("sum", "count", "mean", "min", "max"):
+            with self.subTest(how=how):
+                expected = self.df.groupby(grouper).agg(how)
+                aggregated = self.store.aggregate("h", how=how, batch_size=100)
+                pd.testing.assert_frame_equal(
+                    aggregated, expected, check_dtype=False, check_freq=False
+                )
+
+        with pytest.raises(ValueError):
+            self.store.aggregate("h", how="first")
+
+    def test_append(self):
+        new = self.df.loc["2020-01-03"].reset_index()
+        new["time"] += pd.Timedelta("1D")
+        new = new.set_index(["time", "asset_id"])
+        version = self.store.version
+        assert self.store.end == pd.Timestamp("2020-01-03")
+        ParquetStore.write(new, self.tmpdir.name, append=True)
+        assert self.store.version != version
+        assert self.store.end == pd.Timestamp("2020-01-04")
+        pd.testing.assert_frame_equal(self.store.read(), pd.concat([self.df, new]).sort_index())
+
+
+def test_PlantData_parquet_round_trip(tmp_path, caplog):
+    time = pd.date_range("2019-12-31", periods=3 * 144, freq="10min")
+    scada = pd.concat(
+        [
+            pd.DataFrame({"time": time, "asset_id": asset_id, "WTUR_W": np.arange(time.size)})
+            for asset_id in ("T1", "T2")
+        ],
+        ignore_index=True,
+    ).astype({"WTUR_W": float})
+    era5 = pd.DataFrame({"time": time[::6], "WMETR_HorWdSpd": np.linspace(0, 10, 72)})
+    plant = PlantData(
+        scada=scada,
+        reanalysis={"era5": era5},
+        metadata={"scada": {"frequency": "10min"}, "reanalysis": {"era5": {"frequency": "h"}}},
+    )
+    with caplog.at_level(logging.INFO, logger="openoa.plant"):
+        plant.to_parquet(tmp_path)
+    assert f"era5 reanalysis data saved to: {tmp_path / 'reanalysis_era5.parquet'}" in caplog.text
+
+    # Only the requested time range is loaded
+    loaded = PlantData.from_parquet(tmp_path, start="2020-01-01", end="2020-01-01 23:50")
+    pd.testing.assert_frame_equal(
+        loaded.scada,
+        plant.scada.loc["2020-01-01"].sort_index(),
+        check_freq=False,
+        check_index_type=False,
+    )
+    pd.testing.assert_frame_equal(
+        loaded.reanalysis["era5"], plant.reanalysis["era5"], check_freq=False
+    )
+
+    # Out-of-core data are read and aggregated from disk
+    stored = PlantData.from_parquet(tmp_path, load_time_series=False)
+    assert stored.scada is None
+    assert stored.turbine_ids.tolist() == ["T1", "T2"]
+    pd.testing.assert_frame_equal(
+        stored.turbine_df("T2", "2020-01-01", "2020-01-01 01:00"),
+        plant.turbine_df("T2", "2020-01-01", "2020-01-01 01:00"),
+    )
+    pd.testing.assert_frame_equal(
+        stored.aggregate("scada", "D", ["WTUR_W", "WTUR_SupWh"], "sum"),
+        plant.aggregate("scada", "D", ["WTUR_W", "WTUR_SupWh"], "sum"),
+        check_freq=False,
+    )
+
+    # New data are appended to the store
+    new = pd.DataFrame({"time": time[-1] + pd.Timedelta("10min"), "asset_id": ["T1", "T2"]})
+    stored.append(scada=new.assign(WTUR_W=1.0))
+    assert stored.stores["scada"].end == new.time[0]
+    daily = stored.aggregate("scada", "D", ["WTUR_W", "WTUR_SupWh"], "sum")
+    assert daily.loc[("T2", new.time[0])].tolist() == [1.0, 1.0 / 6]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
+import pickle
 import random
 from copy import deepcopy
 from pathlib import Path
+from unittest import mock
 
 import attr
 import numpy as np
@@ -12,6 +15,7 @@ from attrs import field, define
 
 from openoa.plant import (  # , compose_error_message
     PlantData,
+    _Identity,
     load_to_pandas,
     rename_columns,
     convert_to_list,
@@ -243,9 +247,47 @@ def test_compose_error_message():
     pass
 
 
-def test_load_to_pandas():
-    # Save for later
-    pass
+def test_load_to_pandas(tmp_path, monkeypatch):
+    time = pd.date_range("2020-01-01", periods=6, freq="10min")
+    df = pd.DataFrame(
+        {
+            "Date_time": time.strftime("%d/%m/%Y %H:%M"),
+            "Wind_turbine_name": [1, 2] * 3,
+            "P_avg": np.arange(6),
+            "Ws_avg": np.linspace(3, 8, 6),
+            "unmapped": "x",
+        }
+    )
+    fn = tmp_path / "scada.csv"
+    df.to_csv(fn, index=False)
+    meta = SCADAMetaData(
+        time="Date_time", asset_id="Wind_turbine_name", WTUR_W="P_avg", WMET_HorWdSpd="Ws_avg"
+    )
+
+    # Without metadata, all columns are read with the inferred data types
+    pd.testing.assert_frame_equal(load_to_pandas(fn), df)
+    pd.testing.assert_frame_equal(load_to_pandas(df, meta), df)
+
+    # With metadata, only the mapped columns are read with the metadata data types, with and
+    # without pyarrow installed
+    expected = pd.DataFrame(
+        {
+            "Date_time": time,
+            "Wind_turbine_name": ["1", "2"] * 3,
+            "P_avg": np.arange(6, dtype=float),
+            "Ws_avg": np.linspace(3, 8, 6),
+        }
+    )
+    pd.testing.assert_frame_equal(load_to_pandas(fn, meta), expected, check_dtype=False)
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    pd.testing.assert_frame_equal(load_to_pandas(fn, meta), expected, check_dtype=False)
+
+    # Columns that can't be converted are loaded as is for the validation to report
+    df["P_avg"] = df.P_avg.astype(str).replace("2", "bad")
+    df.to_csv(fn, index=False)
+    loaded = load_to_pandas(fn, meta)
+    assert loaded.columns.tolist() == ["Date_time", "Wind_turbine_name", "P_avg", "Ws_avg"]
+    assert loaded.P_avg.dtype == object
 
 
 def test_load_to_pandas_dict():
@@ -692,3 +734,362 @@ def test_PlantMetaData_from_file():
 
     with pytest.raises(ValueError):
         PlantMetaData.load([])
+
+
+def test_PlantData_availability():
+    # Create three days of data for two turbines, with the first hour of one turbine missing and
+    # every fourth power value of both turbines missing
+    time = pd.date_range("2020-01-31", periods=3 * 144, freq="10min")
+    scada = pd.concat(
+        [
+            pd.DataFrame({"time": time, "asset_id": asset_id, "WTUR_W": np.arange(time.size)})
+            for asset_id in ("T1", "T2")
+        ],
+        ignore_index=True,
+    ).astype({"WTUR_W": float})
+    scada = scada.iloc[6:].copy()
+    scada.loc[scada.index % 4 == 0, "WTUR_W"] = np.nan
+    plant = PlantData(scada=scada, metadata={"scada": {"frequency": "10min"}})
+
+    # Check the daily counts against the raw data
+    daily = plant.availability()
+    expected = (
+        plant.scada.groupby(["asset_id", pd.Grouper(level="time", freq="D")])
+        .count()
+        .assign(n_rows=plant.scada.groupby(["asset_id", pd.Grouper(level="time", freq="D")]).size())
+    )
+    pd.testing.assert_frame_equal(daily, expected[daily.columns])
+    assert daily.loc[("T1", "2020-01-31"), "n_rows"] == 138
+
+    # Check the monthly, plant-level rollup
+    monthly = plant.availability(freq="MS", by_asset=False, normalize=True)
+    assert monthly.index.tolist() == [pd.Timestamp("2020-01-01"), pd.Timestamp("2020-02-01")]
+    assert monthly.loc["2020-01-01", "n_rows"] == pytest.approx(282 / 288)
+    assert monthly.loc["2020-02-01", "n_rows"] == 1.0
+    assert monthly.loc["2020-02-01", "WTUR_W"] == pytest.approx(0.75)
+
+    # Replacing the data invalidates the cached counts
+    plant.scada = plant.scada.iloc[:-144]
+    assert plant.availability()["n_rows"].sum() == plant.scada.shape[0]
+
+
+def test_PlantData_aggregate():
+    time = pd.date_range("2020-01-31", periods=3 * 144, freq="10min")
+    scada = pd.concat(
+        [
+            pd.DataFrame({"time": time, "asset_id": asset_id, "WTUR_W": np.arange(time.size)})
+            for asset_id in ("T1", "T2")
+        ],
+        ignore_index=True,
+    ).astype({"WTUR_W": float})
+    plant = PlantData(scada=scada, metadata={"scada": {"frequency": "10min"}})
+
+    # Check the per-asset aggregation against the raw data
+    daily = plant.aggregate("scada", "D", ["WTUR_W"], "sum")
+    grouper = ["asset_id", pd.Grouper(level="time", freq="D")]
+    expected = plant.scada.groupby(grouper)[["WTUR_W"]].sum()
+    pd.testing.assert_frame_equal(daily, expected)
+
+    # Repeated requests are served from the cache, and modifying the result doesn't corrupt it
+    key = ("aggregate", "scada", "D", ("WTUR_W",), "sum")
+    cached = plant._cache[key][1]
+    daily.loc[:, "WTUR_W"] = 0.0
+    pd.testing.assert_frame_equal(plant.aggregate("scada", "D", ["WTUR_W"], "sum"), expected)
+    assert plant._cache[key][1] is cached
+
+    # In-place modifications are only picked up after clearing the cache
+    plant.scada["WTUR_W"] *= 2
+    assert plant._cache[key][1] is cached
+    plant.clear_cache("scada")
+    assert key not in plant._cache
+    pd.testing.assert_frame_equal(plant.aggregate("scada", "D", ["WTUR_W"], "sum"), expected * 2)
+
+    # Adding a column invalidates the cached aggregations
+    plant.scada["WROT_BlPthAngVal"] = 0.0
+    monthly = plant.aggregate("scada", "MS", how="mean")
+    assert monthly.columns.tolist() == ["WTUR_W", "WTUR_SupWh", "WROT_BlPthAngVal"]
+    assert plant._cache[key][0] != plant._data_version("scada")
+
+    # Replacing the data with a frame of the same shape invalidates the cached aggregations
+    plant.scada = plant.scada.assign(WTUR_W=plant.scada["WTUR_W"] + 1)
+    pd.testing.assert_frame_equal(
+        plant.aggregate("scada", "D", ["WTUR_W"], "sum"),
+        plant.scada.groupby(grouper)[["WTUR_W"]].sum(),
+    )
+
+    with pytest.raises(ValueError):
+        plant.aggregate("era5", "D")
+    with pytest.raises(AttributeError):
+        plant.aggregate("meter", "D")
+
+
+def test_Identity():
+    class Data:
+        pass
+
+    data = Data()
+    identity = _Identity(data)
+    assert identity == _Identity(data)
+    assert hash(identity) == hash(_Identity(data))
+    assert identity != _Identity(Data())
+
+    # Copies never match, and neither does a new object that reuses the freed object's id
+    assert pickle.loads(pickle.dumps(identity)) != identity
+    data_id = id(data)
+    del data
+    for _ in range(100):
+        data = Data()
+        if id(data) == data_id:
+            break
+    assert identity != _Identity(data)
+
+
+def test_PlantData_reanalysis_cube():
+    time = pd.date_range("2020-01-01", periods=48, freq="h")
+    era5 = pd.DataFrame({"time": time, "WMETR_HorWdSpd": np.arange(48.0), "WMETR_EnvTmp": 280.0})
+    merra2 = pd.DataFrame(
+        {"time": time[12:] + pd.Timedelta("30min"), "WMETR_HorWdSpd": np.arange(36.0)}
+    )
+    merra2.loc[5, "WMETR_HorWdSpd"] = np.nan
+    plant = PlantData(
+        reanalysis={"era5": era5, "merra2": merra2},
+        metadata={"reanalysis": {"era5": {"frequency": "h"}, "merra2": {"frequency": "h"}}},
+    )
+
+    # The common variables of the common time range are aligned, and missing data is masked
+    cube = plant.reanalysis_cube()
+    assert cube.variables.tolist() == ["WMETR_HorWdSpd"]
+    assert cube.products.tolist() == ["era5", "merra2"]
+    assert cube.time[0] == pd.Timestamp("2020-01-01 12:30")
+    assert cube.time[-1] == pd.Timestamp("2020-01-02 23:00")
+    assert cube.values.shape == (70, 2, 1)
+    assert not cube.values.flags.writeable
+    pd.testing.assert_frame_equal(
+        cube.to_frame("merra2"),
+        plant.reanalysis["merra2"].loc[:"2020-01-02 23:00", ["WMETR_HorWdSpd"]].dropna(),
+        check_freq=False,
+        check_names=False,
+    )
+    assert cube.mask[:, 0].sum() == 35
+    assert cube.mask[:, 1].sum() == 36
+
+    # Resampled products are aligned on the resampled timestamps, and can be gathered by name
+    cube = plant.reanalysis_cube(["WMETR_HorWdSpd"], freq="D", join="outer")
+    assert cube.time.tolist() == [pd.Timestamp("2020-01-01"), pd.Timestamp("2020-01-02")]
+    sampled = cube.take(["merra2", "era5", "merra2"])
+    assert sampled.shape == (2, 3, 1)
+    np.testing.assert_array_equal(sampled[:, 0], sampled[:, 2])
+    np.testing.assert_allclose(sampled[:, 1, 0], [11.5, 35.5])
+    with pytest.raises(KeyError):
+        cube.take(["cfsr"])
+
+    # Results are cached until the data changes
+    assert plant.reanalysis_cube(["WMETR_HorWdSpd"], freq="D", join="outer") is cube
+    plant.clear_cache("era5")
+    assert plant.reanalysis_cube(["WMETR_HorWdSpd"], freq="D", join="outer") is not cube
+
+
+def test_PlantData_compact():
+    time = pd.date_range("2020-01-01", periods=144, freq="10min")
+    scada = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "time": time,
+                    "asset_id": asset_id,
+                    "WTUR_W": np.linspace(0, 2000, time.size),
+                    "WTUR_TurSt": np.where(np.arange(time.size) % 2, "run", "stop"),
+                }
+            )
+            for asset_id in ("T1", "T2")
+        ],
+        ignore_index=True,
+    )
+    era5 = pd.DataFrame({"time": time[::6], "WMETR_HorWdSpd": np.linspace(0, 10, 24)})
+    kwargs = dict(
+        scada=scada,
+        reanalysis={"era5": era5},
+        metadata={"scada": {"frequency": "10min"}, "reanalysis": {"era5": {"frequency": "h"}}},
+    )
+
+    plant = PlantData(**kwargs)
+    compact = PlantData(**deepcopy(kwargs), compact=True)
+    assert plant.scada.WTUR_W.dtype == np.float64
+    assert compact.scada.WTUR_W.dtype == compact.scada.WTUR_SupWh.dtype == np.float32
+    assert isinstance(compact.scada.WTUR_TurSt.dtype, pd.CategoricalDtype)
+    assert compact.reanalysis["era5"].WMETR_HorWdSpd.dtype == np.float32
+    assert compact.scada.memory_usage().sum() < plant.scada.memory_usage().sum()
+    pd.testing.assert_index_equal(compact.scada.index, plant.scada.index)
+
+    # The numerical drift is bounded by the 32-bit precision
+    np.testing.assert_allclose(
+        compact.aggregate("scada", "h", ["WTUR_W", "WTUR_SupWh"], "sum"),
+        plant.aggregate("scada", "h", ["WTUR_W", "WTUR_SupWh"], "sum"),
+        rtol=1e-6,
+    )
+
+    # Re-validating the data keeps the compact data types
+    compact.validate()
+    assert compact.scada.WTUR_W.dtype == np.float32
+    assert isinstance(compact.scada.WTUR_TurSt.dtype, pd.CategoricalDtype)
+
+
+def test_PlantData_append(caplog):
+    def make_scada(time):
+        return pd.concat(
+            [
+                pd.DataFrame({"time": time, "turbine": asset_id, "power": time.hour * 100.0})
+                for asset_id in ("T1", "T2")
+            ],
+            ignore_index=True,
+        )
+
+    time = pd.date_range("2020-01-01", periods=2 * 144, freq="10min")
+    era5 = pd.DataFrame({"time": time[::6], "u": 3.0, "v": 4.0})
+    metadata = {
+        "scada": {"frequency": "10min", "asset_id": "turbine", "WTUR_W": "power"},
+        "reanalysis": {"era5": {"frequency": "h", "WMETR_HorWdSpdU": "u", "WMETR_HorWdSpdV": "v"}},
+    }
+    full = PlantData(
+        scada=make_scada(time), reanalysis={"era5": era5.copy()}, metadata=deepcopy(metadata)
+    )
+    plant = PlantData(
+        scada=make_scada(time[:144]),
+        reanalysis={"era5": era5.iloc[:24].copy()},
+        metadata=deepcopy(metadata),
+    )
+    daily = plant.aggregate("scada", "D", ["WTUR_W", "WTUR_SupWh"], "sum")
+
+    # The appended data are the same as the data loaded all at once, including derived columns
+    plant.append(scada=make_scada(time[144:]), reanalysis={"era5": era5.iloc[24:].copy()})
+    pd.testing.assert_frame_equal(plant.scada.sort_index(), full.scada.sort_index())
+    pd.testing.assert_frame_equal(plant.reanalysis["era5"], full.reanalysis["era5"])
+    assert plant.reanalysis["era5"].WMETR_HorWdSpd.eq(5.0).all()
+
+    # Cached aggregations are updated
+    appended = plant.aggregate("scada", "D", ["WTUR_W", "WTUR_SupWh"], "sum")
+    assert appended.shape[0] == 2 * daily.shape[0]
+    pd.testing.assert_frame_equal(
+        appended, full.aggregate("scada", "D", ["WTUR_W", "WTUR_SupWh"], "sum")
+    )
+
+    # Overlapping or misaligned data are rejected without modifying any data
+    n_rows = plant.scada.shape[0]
+    with pytest.raises(ValueError, match="must start at or after"):
+        plant.append(scada=make_scada(time[-10:]))
+    with pytest.raises(ValueError, match="must start at or after"):
+        plant.append(
+            scada=make_scada(time[-1:] + pd.Timedelta("15min")),
+            reanalysis={"era5": era5.iloc[-1:]},
+        )
+    assert plant.scada.shape[0] == n_rows
+
+    # Missing columns and wrong data types are rejected
+    new = make_scada(pd.date_range("2020-01-03", periods=6, freq="10min"))
+    with pytest.raises(ValueError, match="missing the following columns"):
+        plant.append(scada=new.drop(columns=["power"]))
+    with pytest.raises(ValueError, match="wrong type"):
+        plant.append(scada=new.assign(power="bad"))
+    with pytest.raises(AttributeError):
+        plant.append(meter=pd.DataFrame({"time": new.time, "MMTR_SupWh": 1.0}))
+
+    # Gaps are allowed, but logged
+    plant.append(scada=make_scada(pd.date_range("2020-01-04", periods=6, freq="10min")))
+    assert "has a gap" in caplog.text
+    assert plant.scada.shape[0] == n_rows + 12
+
+
+def test_PlantData_validate():
+    time = pd.date_range("2020-01-01", periods=144, freq="10min")
+    scada = pd.concat(
+        [
+            pd.DataFrame({"time": time, "turbine": asset_id, "power": 1000.0, "ws": 8.0})
+            for asset_id in ("T1", "T2")
+        ],
+        ignore_index=True,
+    )
+    meter = pd.DataFrame({"time": time, "MMTR_SupWh": 300.0})
+    plant = PlantData(
+        scada=scada,
+        meter=meter,
+        metadata={
+            "scada": {"asset_id": "turbine", "WTUR_W": "power", "WMET_HorWdSpd": "ws"},
+            "meter": {"frequency": "10min"},
+        },
+        analysis_type="ElectricalLosses",
+    )
+    with mock.patch.object(
+        PlantData, "_validate_data", autospec=True, side_effect=PlantData._validate_data
+    ) as validate_data:
+        plant.validate(force=False)
+        assert validate_data.call_count == len(plant._validation_targets())
+        assert plant._validated_types == {"ElectricalLosses"}
+
+        # Validating unchanged data for the same analysis is skipped
+        scada = plant.scada
+        plant.validate(force=False)
+        assert validate_data.call_count == len(plant._validation_targets())
+        assert plant.scada is scada
+
+        # A new analysis type only checks its additional requirements against the recorded results
+        validate_data.reset_mock()
+        plant.analysis_type.append("TurbineLongTermGrossEnergy")
+        with pytest.raises(ValueError, match="missing the following columns"):
+            plant.validate(force=False)
+        validate_data.assert_not_called()
+        plant.analysis_type = "ElectricalLosses"
+
+        # Only the replaced data are validated again, and converted
+        plant.meter = plant.meter.astype({"MMTR_SupWh": str})
+        plant.validate(force=False)
+        validate_data.assert_called_once()
+        assert validate_data.call_args.args[1] == "meter"
+        assert plant.meter.MMTR_SupWh.dtype == np.float64
+        assert plant.scada is scada
+
+        # Modifications in place are only detected after clearing the cache
+        plant.meter["MMTR_SupWh"] = "bad"
+        plant.validate(force=False)
+        plant.clear_cache("meter")
+        with pytest.raises(ValueError, match="wrong type"):
+            plant.validate(force=False)
+
+        # Clearing the whole cache also invalidates the data types that were never converted
+        plant.meter = plant.meter.assign(MMTR_SupWh=300.0)
+        plant.validate(force=False)
+        plant.meter["MMTR_SupWh"] = "bad"
+        plant.clear_cache()
+        with pytest.raises(ValueError, match="wrong type"):
+            plant.validate(force=False)
+
+        # A full validation checks all of the data, including modifications in place
+        plant.meter = plant.meter.assign(MMTR_SupWh=300.0)
+        plant.validate(force=False)
+        validate_data.reset_mock()
+        plant.meter["MMTR_SupWh"] = "bad"
+        with pytest.raises(ValueError, match="wrong type"):
+            plant.validate()
+        assert validate_data.call_count == len(plant._validation_targets())
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_PlantData_view(copy_on_write):
+    time = pd.date_range("2020-01-01", periods=144, freq="10min")
+    scada = pd.DataFrame({"time": time, "asset_id": "T1", "WTUR_W": 1000.0})
+    plant = PlantData(scada=scada, metadata={"scada": {"frequency": "10min"}})
+
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        # The views share the plant's data until they are modified with copy-on-write, and are
+        # copies otherwise
+        view = plant.view("scada")
+        power = plant.view("scada", ["WTUR_W"])
+        for df in (view, power):
+            shares_memory = np.shares_memory(df.WTUR_W.to_numpy(), plant.scada.WTUR_W.to_numpy())
+            assert shares_memory == copy_on_write
+
+        # Modifying the views never modifies the plant's data
+        view["flag"] = True
+        view.loc[:, "WTUR_W"] = 0.0
+        power.iloc[0, 0] = np.nan
+        assert "flag" not in plant.scada
+        assert plant.scada.WTUR_W.eq(1000.0).all()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backend.app.services.plant_snapshot import PlantSnapshot
+
+from openoa.plant import PlantData
+
+
+def _plant(scale=1.0):
+    time = pd.date_range("2019-12-31", periods=3 * 144, freq="10min")
+    scada = pd.concat(
+        [
+            pd.DataFrame({"time": time, "asset_id": asset_id, "WTUR_W": np.arange(time.size)})
+            for asset_id in ("T1", "T2")
+        ],
+        ignore_index=True,
+    ).astype({"WTUR_W": float})
+    scada["WTUR_W"] *= scale
+    era5 = pd.DataFrame({"time": time[::6], "WMETR_HorWdSpd": np.linspace(0, 10, 72)})
+    return PlantData(
+        scada=scada,
+        reanalysis={"era5": era5},
+        metadata={"scada": {"frequency": "10min"}, "reanalysis": {"era5": {"frequency": "h"}}},
+    )
+
+
+def _is_mapped(values):
+    while isinstance(values, np.ndarray):
+        if isinstance(values, np.memmap):
+            return True
+        values = values.base
+    return False
+
+
+def test_publish_and_attach(tmp_path):
+    plant = _plant()
+    snapshot = PlantSnapshot(tmp_path)
+    assert snapshot.attach() is None
+
+    snapshot.publish(plant, "fingerprint", "source")
+    attached, fingerprint = snapshot.attach("source")
+    assert fingerprint == "fingerprint"
+    assert snapshot.is_current()
+    pd.testing.assert_frame_equal(attached.scada, plant.scada)
+    pd.testing.assert_frame_equal(attached.reanalysis["era5"], plant.reanalysis["era5"])
+    assert attached.metadata.scada.frequency == plant.metadata.scada.frequency
+
+    # The numeric columns and the timestamps are mapped read-only from the snapshot files
+    assert _is_mapped(attached.scada["WTUR_W"].to_numpy())
+    assert _is_mapped(attached.scada.index.levels[0].to_numpy())
+    with pytest.raises(ValueError, match="read-only"):
+        attached.scada.iloc[0, 0] = -1.0
+    with pytest.raises(ValueError, match="read-only"):
+        attached.scada.loc[attached.scada["WTUR_W"] > 10, "WTUR_W"] = -1.0
+
+    # The data are modified through views, which don't change the files
+    view = attached.view("scada")
+    view.loc[view["WTUR_W"] > 10, "WTUR_W"] = -1.0
+    assert (view["WTUR_W"] == -1.0).any()
+    other, _ = PlantSnapshot(tmp_path).attach()
+    pd.testing.assert_frame_equal(other.scada, plant.scada)
+    pd.testing.assert_frame_equal(attached.scada, plant.scada)
+
+    # A snapshot of a different source is not attached
+    assert snapshot.attach("other source") is None
+
+
+def test_publish_replaces_snapshot(tmp_path):
+    snapshot = PlantSnapshot(tmp_path)
+    snapshot.publish(_plant(), "first", "source")
+    first, _ = snapshot.attach()
+
+    # Processes attached to the previous snapshot keep their data, and see that it was replaced
+    reader = PlantSnapshot(tmp_path)
+    reader.attach()
+    with snapshot.lock():
+        snapshot.publish(_plant(scale=2.0), "second", "source")
+    assert not reader.is_current()
+    pd.testing.assert_frame_equal(first.scada, _plant().scada)
+
+    second, fingerprint = reader.attach()
+    assert fingerprint == "second"
+    assert reader.is_current()
+    pd.testing.assert_frame_equal(second.scada, _plant(scale=2.0).scada)
+    assert len([path for path in tmp_path.iterdir() if path.is_dir()]) == 1
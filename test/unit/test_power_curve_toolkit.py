@@ -1,3 +1,5 @@
+import time
+import tempfile
 import unittest
 
 import numpy as np
@@ -116,6 +118,193 @@ class TestPowerCurveFunctions(unittest.TestCase):
             self.y, y_pred, rtol=0.05, atol=20, err_msg="Power curve did not properly fit."
         )
 
+    def test_compile_power_curve(self):
+        # A piecewise linear curve with knots on the grid should be reproduced exactly
+        curve = power_curve.IEC(self.x, self.y, interpolate=True)
+        compiled = power_curve.compile_power_curve(curve, ws_min=0, ws_max=30, resolution=0.05)
+        test_windspeeds = np.linspace(-5, 35, 1001)
+        nptest.assert_allclose(
+            curve(test_windspeeds), compiled(test_windspeeds), rtol=1e-9, atol=1e-9
+        )
+
+        # Smooth curves should be closely approximated, and the input shape should be preserved
+        curve = power_curve.logistic_5_parametric(self.x, self.y)
+        compiled = power_curve.compile_power_curve(curve, ws_min=0, ws_max=30, resolution=0.01)
+        test_windspeeds = np.random.random((50, 4)) * 30
+        y_pred = compiled(pd.DataFrame(test_windspeeds))
+        self.assertEqual(y_pred.shape, test_windspeeds.shape)
+        nptest.assert_allclose(curve(test_windspeeds), y_pred, rtol=1e-3, atol=1e-3)
+
+        # Points outside of the table are passed to the original curve, or filled when requested
+        compiled = power_curve.compile_power_curve(curve, ws_min=0, ws_max=20, fill_value=0.0)
+        nptest.assert_array_equal(compiled(np.array([-1.0, 25.0, np.nan])), np.zeros(3))
+
+    def tearDown(self):
+        pass
+
+
+class TestPowerCurveRegistry(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.x = pd.Series(np.random.random(100) * 30)
+        self.y = pd.Series(logistic5param(self.x, 1300, -7, 11, 2, 0.5))
+        self._tmp = tempfile.TemporaryDirectory()
+        self.registry = power_curve.PowerCurveRegistry(self._tmp.name, max_entries=2)
+
+    def test_get_or_fit(self):
+        for method, kwargs in (("IEC", dict(interpolate=True)), ("gam", dict(n_splines=10))):
+            with self.subTest(method=method):
+                self.registry.clear()
+                curve = self.registry.get_or_fit("T1", method, self.x, self.y, **kwargs)
+                self.assertEqual(len(self.registry), 1)
+
+                # The stored curve is returned for unchanged inputs and matches the fitted curve
+                key = self.registry.key("T1", method, self.x, self.y, **kwargs)
+                self.assertIn(key, self.registry)
+                nptest.assert_allclose(curve(self.x), self.registry.get(key)(self.x))
+                self.registry.get_or_fit("T1", method, self.x, self.y, **kwargs)
+                self.assertEqual(len(self.registry), 1)
+
+        # Explicitly passing a default produces the same key as omitting it
+        self.assertEqual(
+            self.registry.key("T1", "IEC", self.x, self.y),
+            self.registry.key("T1", "IEC", self.x, self.y, bin_width=0.5),
+        )
+
+        # Changed data, hyperparameters, or turbine IDs produce a new key
+        key = self.registry.key("T1", "IEC", self.x, self.y)
+        self.assertNotEqual(key, self.registry.key("T2", "IEC", self.x, self.y))
+        self.assertNotEqual(key, self.registry.key("T1", "IEC", self.x, self.y, bin_width=1))
+        self.assertNotEqual(key, self.registry.key("T1", "IEC", self.x, self.y + 1))
+
+        with self.assertRaises(ValueError):
+            self.registry.key("T1", "IEC", self.x, self.y, n_splines=10)
+
+    def test_lru_eviction(self):
+        key1 = self.registry.key("T1", "IEC", self.x, self.y)
+        key2 = self.registry.key("T2", "IEC", self.x, self.y)
+        key3 = self.registry.key("T3", "IEC", self.x, self.y)
+        self.registry.get_or_fit("T1", "IEC", self.x, self.y)
+        time.sleep(0.01)
+        self.registry.get_or_fit("T2", "IEC", self.x, self.y)
+        time.sleep(0.01)
+
+        # Accessing the first curve makes the second curve the least recently used
+        self.registry.get(key1)
+        time.sleep(0.01)
+        self.registry.get_or_fit("T3", "IEC", self.x, self.y)
+        self.assertEqual(len(self.registry), 2)
+        self.assertIn(key1, self.registry)
+        self.assertNotIn(key2, self.registry)
+        self.assertIn(key3, self.registry)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class TestBinnedPowerCurveAccumulator(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        n = 4000
+        time = pd.date_range("2020-01-01", periods=n // 4, freq="10min").repeat(4)
+        asset_id = np.tile(["T1", "T2", "T3", "T4"], n // 4)
+        windspeed = np.random.random(n) * 25
+        power = logistic5param(windspeed, 1300, -7, 11, 2, 0.5) + np.random.normal(0, 50, n)
+        self.scada = pd.DataFrame(
+            {"WMET_HorWdSpd": windspeed, "WTUR_W": power},
+            index=pd.MultiIndex.from_arrays([time, asset_id], names=["time", "asset_id"]),
+        )
+        self.power_bins = np.linspace(-500, 2000, 501)
+
+    def test_update_matches_IEC(self):
+        accumulator = power_curve.BinnedPowerCurveAccumulator()
+        accumulator.update(self.scada.iloc[:1500])
+        accumulator.update(self.scada.iloc[1500:])
+
+        test_windspeeds = np.linspace(-1, 35, 500)
+        for turbine_id in ("T1", None):
+            data = self.scada if turbine_id is None else self.scada.xs(turbine_id, level=1)
+            for interpolate in (True, False):
+                expected = power_curve.IEC(
+                    data["WMET_HorWdSpd"], data["WTUR_W"], interpolate=interpolate
+                )
+                actual = accumulator.to_curve(turbine_id, interpolate=interpolate)
+                nptest.assert_allclose(
+                    expected(test_windspeeds), actual(test_windspeeds), rtol=1e-9, atol=1e-9
+                )
+
+    def test_merge(self):
+        full = power_curve.BinnedPowerCurveAccumulator(power_bins=self.power_bins)
+        full.update(self.scada)
+
+        first = power_curve.BinnedPowerCurveAccumulator(power_bins=self.power_bins)
+        first.update(self.scada.iloc[:1500].xs("T1", level=1, drop_level=False))
+        second = power_curve.BinnedPowerCurveAccumulator(power_bins=self.power_bins)
+        second.update(self.scada.iloc[1500:])
+        second.update(self.scada.iloc[:1500].drop("T1", level=1))
+        first.merge(second)
+
+        self.assertEqual(first.turbine_ids[0], "T1")
+        mean = first.mean().loc[full.turbine_ids]
+        nptest.assert_allclose(full.mean().values, mean.values, rtol=1e-9)
+        nptest.assert_allclose(full.std().values, first.std().loc[full.turbine_ids].values)
+        nptest.assert_allclose(full.median().values, first.median().loc[full.turbine_ids].values)
+
+        with self.assertRaises(ValueError):
+            first.merge(power_curve.BinnedPowerCurveAccumulator(bin_width=1))
+
+    def test_median(self):
+        accumulator = power_curve.BinnedPowerCurveAccumulator(power_bins=self.power_bins)
+        accumulator.update(self.scada)
+
+        # The estimated median falls within the same power histogram bin as the sample median
+        expected = (
+            self.scada.assign(
+                bin=np.searchsorted(accumulator.bins, self.scada["WMET_HorWdSpd"], "right") - 1
+            )
+            .groupby(["asset_id", "bin"])["WTUR_W"]
+            .quantile(0.5, interpolation="lower")
+            .unstack()
+        )
+        actual = accumulator.median().iloc[:, : expected.shape[1]]
+        nptest.assert_allclose(expected.values, actual.values, atol=np.diff(self.power_bins)[0])
+
+        # Only the mean is available without the power histograms
+        accumulator = power_curve.BinnedPowerCurveAccumulator()
+        with self.assertRaises(ValueError):
+            accumulator.to_curve(statistic="median")
+
+    def test_time_decay(self):
+        # Each sample's contribution is halved for every `half_life` it is older than the newest
+        accumulator = power_curve.BinnedPowerCurveAccumulator(half_life="6h")
+        accumulator.update(self.scada.iloc[:1500])
+        accumulator.update(self.scada.iloc[1500:])
+
+        time = self.scada.index.get_level_values("time")
+        weights = 2.0 ** ((time - time.max()) / pd.Timedelta("6h"))
+        expected = (
+            self.scada.assign(
+                bin=np.searchsorted(accumulator.bins, self.scada["WMET_HorWdSpd"], "right") - 1,
+                weight=weights,
+                weighted_power=self.scada["WTUR_W"] * weights,
+            )
+            .groupby(["asset_id", "bin"])[["weight", "weighted_power"]]
+            .sum()
+        )
+        expected = (expected["weighted_power"] / expected["weight"]).unstack()
+        actual = accumulator.mean().iloc[:, : expected.shape[1]]
+        nptest.assert_allclose(expected.values, actual.values, rtol=1e-9)
+
+        # Merging accumulators with different reference times matches a single accumulator
+        first = power_curve.BinnedPowerCurveAccumulator(half_life="1D")
+        first.update(self.scada.iloc[:1500])
+        second = power_curve.BinnedPowerCurveAccumulator(half_life="1D")
+        second.update(self.scada.iloc[1500:])
+        second.merge(first)
+        full = power_curve.BinnedPowerCurveAccumulator(half_life="1D")
+        full.update(self.scada)
+        nptest.assert_allclose(full.mean().values, second.mean().values, rtol=1e-9)
+
     def tearDown(self):
         pass
 
@@ -0,0 +1,117 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy import testing as nptest
+
+from openoa.utils import qa, filters, timeseries
+
+
+class SimpleQATests(unittest.TestCase):
+    def setUp(self):
+        # Two days of hourly data spanning the start of DST in the US, without the non-existent
+        # local 2AM timestamp
+        time = pd.date_range(start="3/10/2018 00:00:00", end="3/11/2018 23:00:00", freq="h")
+        self.local_time = time[time != pd.Timestamp("3/11/2018 02:00:00")]
+        self.df = pd.DataFrame(
+            {
+                "time": self.local_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "power": np.arange(self.local_time.size, dtype=float),
+            }
+        )
+
+    def test_remove_tz(self):
+        localized = self.local_time.tz_localize("America/Denver")
+        df = pd.DataFrame({"time": pd.Series(localized, dtype=object)})
+        df.loc[3, "time"] = np.nan
+        ix_filter, time_stamps = qa._remove_tz(df, "time")
+
+        expected_filter = np.ones(localized.size, dtype=bool)
+        expected_filter[3] = False
+        nptest.assert_array_equal(ix_filter, expected_filter)
+        nptest.assert_array_equal(
+            time_stamps[ix_filter], self.local_time.to_numpy()[expected_filter]
+        )
+
+    def test_determine_offset_dst(self):
+        df = pd.DataFrame(
+            index=self.local_time.tz_localize("America/Denver").tz_convert("UTC"),
+            data={"power": self.df.power.values},
+        )
+        df = qa.determine_offset_dst(df, "America/Denver")
+
+        is_dst = self.local_time >= pd.Timestamp("3/11/2018 03:00:00")
+        nptest.assert_array_equal(df.is_dst.values, is_dst)
+        expected_offset = np.where(is_dst, pd.Timedelta("-6h"), pd.Timedelta("-7h"))
+        nptest.assert_array_equal(df.utc_offset.values, expected_offset.astype("timedelta64[ns]"))
+        self.assertEqual(str(df.index.tz), "UTC")
+
+    def test_convert_datetime_column(self):
+        # Timezone-naive local timestamps
+        df = qa.convert_datetime_column(self.df.copy(), "time", "America/Denver", tz_aware=False)
+        expected_utc = self.local_time.tz_localize("America/Denver").tz_convert(None)
+        nptest.assert_array_equal(df.time_utc.values, expected_utc.to_numpy())
+        nptest.assert_array_equal(df.index.values, expected_utc.to_numpy())
+        self.assertEqual(df.is_dst.sum(), 21)
+
+        # Timezone-aware timestamps with a change in UTC offset
+        localized = self.local_time.tz_localize("America/Denver")
+        df_aware = pd.DataFrame({"time": [el.isoformat() for el in localized]})
+        df_aware = qa.convert_datetime_column(df_aware, "time", "America/Denver", tz_aware=True)
+        nptest.assert_array_equal(df_aware.time_utc.values, expected_utc.to_numpy())
+        nptest.assert_array_equal(df_aware.is_dst.values, df.is_dst.values)
+
+    def test_scada_report(self):
+        rng = np.random.default_rng(2023)
+        time = pd.date_range(start="1/1/2018 00:00:00", periods=1000, freq="10min")
+        frames = []
+        for asset_id in ("T1", "T2"):
+            keep = rng.random(time.size) > 0.05
+            df = pd.DataFrame(
+                {
+                    "time": time[keep],
+                    "asset_id": asset_id,
+                    "power": rng.normal(500, 100, keep.sum()).round(-2),
+                    "windspeed": rng.random(keep.sum()) * 20,
+                }
+            )
+            df.loc[df.sample(frac=0.1, random_state=1).index, "windspeed"] = np.nan
+            frames.append(pd.concat([df, df.iloc[:3]]))
+        df = pd.concat(frames).sample(frac=1, random_state=2).set_index(["time", "asset_id"])
+
+        report = qa.scada_report(df, "10min", ranges={"windspeed": (0, 15)})
+
+        # Processing the data in chunks produces the same results
+        chunked = qa.scada_report(df, "10min", ranges={"windspeed": (0, 15)}, chunk_size=333)
+        pd.testing.assert_frame_equal(report.summary, chunked.summary)
+
+        summary = report.summary.set_index(["asset_id", "column"])
+        timestamps = report.timestamps.set_index("asset_id")
+        for asset_id, asset_df in df.reset_index().groupby("asset_id"):
+            asset_df = asset_df.sort_values("time", kind="stable")
+            power = summary.loc[(asset_id, "power")]
+            windspeed = summary.loc[(asset_id, "windspeed")]
+
+            self.assertEqual(timestamps.loc[asset_id, "duplicates"], 3)
+            self.assertEqual(
+                timestamps.loc[asset_id, "missing"],
+                timeseries.find_time_gaps(asset_df.time, "10min").size,
+            )
+            self.assertEqual(
+                report.gaps.loc[report.gaps.asset_id == asset_id, "length"].sum(),
+                timestamps.loc[asset_id, "missing"],
+            )
+            nptest.assert_almost_equal(
+                windspeed.nan_fraction, timeseries.percent_nan(asset_df.windspeed)
+            )
+            nptest.assert_allclose(
+                windspeed[["mean", "std", "min", "max"]].astype(float).values,
+                asset_df.windspeed.agg(["mean", "std", "min", "max"]).values,
+            )
+            self.assertEqual(
+                windspeed.out_of_range,
+                (filters.range_flag(asset_df.windspeed, 0, 15) & asset_df.windspeed.notna()).sum(),
+            )
+            self.assertEqual(
+                power.frozen_samples, filters.unresponsive_flag(asset_df.power, 3).sum()
+            )
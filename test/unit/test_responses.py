@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+from backend.app.responses import ARROW_MEDIA_TYPE, arrow_response, columnar_response
+
+
+class TestResponses(unittest.TestCase):
+    def setUp(self):
+        time = pd.date_range("2020-01-01", periods=6, freq="h").to_numpy()
+        power = np.array([1.0, np.nan, 3.0, np.inf, 5.0, 6.0])
+
+        # Every other row, like the decimated SCADA data, which isn't contiguous in memory
+        self.columns = {"time": time[::2], "power_kw": power[::2], "label": ["a", "b", "c"]}
+
+    def test_columnar_response(self):
+        response = columnar_response(self.columns, turbine_id="T1", resample="1h")
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(
+            orjson.loads(response.body),
+            {
+                "turbine_id": "T1",
+                "resample": "1h",
+                "columns": {
+                    "time": ["2020-01-01T00:00:00", "2020-01-01T02:00:00", "2020-01-01T04:00:00"],
+                    "power_kw": [1.0, 3.0, 5.0],
+                    "label": ["a", "b", "c"],
+                },
+            },
+        )
+
+        columns = {"power_kw": np.array([np.nan, np.inf, -np.inf, 1.5])}
+        body = orjson.loads(columnar_response(columns).body)
+        self.assertEqual(body["columns"]["power_kw"], [None, None, None, 1.5])
+
+    def test_arrow_response(self):
+        pa = pytest.importorskip("pyarrow")
+
+        columns = {"time": self.columns["time"], "power_kw": np.array([1.0, np.nan, 3.0])}
+        response = arrow_response(columns, turbine_id="T1")
+        self.assertEqual(response.media_type, ARROW_MEDIA_TYPE)
+
+        table = pa.ipc.open_stream(response.body).read_all()
+        self.assertEqual(table.column_names, ["time", "power_kw"])
+        self.assertEqual(table.column("power_kw").to_pylist(), [1.0, None, 3.0])
+        self.assertEqual(table.schema.metadata, {b"turbine_id": b'"T1"'})
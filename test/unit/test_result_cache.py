@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+import tempfile
+import unittest
+
+import numpy as np
+from backend.app.services.result_cache import ResultCache
+
+
+def _value(n_bytes=1000):
+    # Random bytes don't compress, so each entry takes a little more than ``n_bytes``
+    return os.urandom(n_bytes)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def cache(self, **kwargs):
+        return ResultCache(self.tmpdir.name, **kwargs)
+
+    def entry_path(self, cache, key):
+        return cache._entry_path(key)
+
+    def test_memory_and_disk_hits(self):
+        cache = self.cache()
+        value = {"aep_GWh": [12.0, 13.0]}
+        self.assertIsNone(cache.get("aep"))
+        self.assertEqual(cache.get("aep", "missing"), "missing")
+        self.assertNotIn("aep", cache)
+
+        cache.put("aep", value)
+        self.assertIn("aep", cache)
+        self.assertEqual(cache.get("aep"), value)
+
+        # Each hit returns a new copy, so callers can't modify the cached result
+        self.assertIsNot(cache.get("aep"), value)
+
+        # The entries persist across instances, and are kept in memory after the first read
+        other = self.cache()
+        self.assertEqual(other.get("aep"), value)
+        self.assertEqual(other.get("aep"), value)
+
+        stats = cache.stats()
+        self.assertEqual(stats["memory_hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["memory_entries"], 1)
+        self.assertEqual(stats["disk_entries"], 1)
+        self.assertEqual(stats["disk_bytes"], stats["memory_bytes"])
+
+        stats = other.stats()
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["hits"], 2)
+
+    def test_memory_limit(self):
+        cache = self.cache(memory_max_bytes=2_500)
+        for key in ("a", "b"):
+            cache.put(key, _value())
+        cache.get("a")
+
+        # The least recently used entry is evicted from memory, but is still on disk
+        cache.put("c", _value())
+        stats = cache.stats()
+        self.assertEqual(list(cache._memory), ["a", "c"])
+        self.assertLessEqual(stats["memory_bytes"], 2_500)
+        self.assertEqual(stats["memory_evictions"], 1)
+        self.assertEqual(stats["disk_entries"], 3)
+        self.assertIsNotNone(cache.get("b"))
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+
+        # Entries larger than the memory limit are only kept on disk
+        cache.put("large", _value(5_000))
+        self.assertNotIn("large", cache._memory)
+        self.assertIn("large", cache)
+
+    def test_memory_footprint(self):
+        # Lists of floats, like most analysis results, take several times more memory as Python
+        # objects than compressed
+        rng = np.random.default_rng(1)
+        values = [np.round(rng.normal(10, 2, 100_000), 2).tolist() for _ in range(3)]
+        object_bytes = sys.getsizeof(values[0]) + sum(sys.getsizeof(v) for v in values[0])
+        cache = self.cache(memory_max_bytes=object_bytes)
+        for i, value in enumerate(values):
+            cache.put(f"simulations-{i}", value)
+
+        # The memory tier holds the compressed entries, whose total size is the reported size
+        held = [payload for _, payload in cache._memory.values()]
+        self.assertTrue(all(isinstance(payload, bytes) for payload in held))
+        stats = cache.stats()
+        self.assertEqual(stats["memory_bytes"], sum(len(payload) for payload in held))
+        self.assertLessEqual(sum(sys.getsizeof(payload) for payload in held), object_bytes)
+        self.assertEqual(stats["memory_entries"], 3)
+        self.assertEqual(cache.get("simulations-2"), values[2])
+
+    def test_disk_limit(self):
+        cache = self.cache(disk_max_bytes=2_500)
+        for i, key in enumerate(("a", "b")):
+            cache.put(key, _value())
+            os.utime(self.entry_path(cache, key), (time.time() - 100 + i,) * 2)
+
+        # Reading an entry, including from memory, marks it as recently used on disk
+        cache.get("a")
+        cache.put("c", _value())
+        stats = cache.stats()
+        self.assertEqual(stats["disk_entries"], 2)
+        self.assertLessEqual(stats["disk_bytes"], 2_500)
+        self.assertEqual(stats["disk_evictions"], 1)
+        self.assertFalse(self.entry_path(cache, "b").exists())
+        self.assertTrue(self.entry_path(cache, "a").exists())
+
+    def test_ttl(self):
+        cache = self.cache(ttl_seconds=0.2)
+        cache.put("a", _value())
+        self.assertIsNotNone(cache.get("a"))
+        time.sleep(0.3)
+
+        # Expired entries are misses, in memory and on disk
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(self.cache(ttl_seconds=0.2).get("a"))
+        self.assertFalse(self.entry_path(cache, "a").exists())
+        stats = cache.stats()
+        self.assertEqual(stats["expirations"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["memory_entries"], 0)
+
+        # Entries that weren't used within the TTL are removed from the disk
+        cache.put("b", _value())
+        os.utime(self.entry_path(cache, "b"), (time.time() - 1,) * 2)
+        cache.evict()
+        self.assertEqual(cache.stats()["disk_entries"], 0)
+
+    def test_unreadable_and_unserializable_entries(self):
+        cache = self.cache()
+        cache.put("a", _value())
+        self.entry_path(cache, "a").write_bytes(b"not a cache entry")
+        self.assertIsNone(self.cache().get("a"))
+        self.assertFalse(self.entry_path(cache, "a").exists())
+
+        cache.put("b", lambda: None)
+        self.assertNotIn("b", cache)
+
+        cache.clear()
+        self.assertEqual(cache.stats()["memory_entries"], 0)
+        self.assertEqual(cache.stats()["disk_entries"], 0)
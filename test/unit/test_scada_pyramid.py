@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy import testing as nptest
+from backend.app.services.scada_pyramid import SCADA_COLUMNS, ScadaPyramid
+
+
+class TestScadaPyramid(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        times = pd.date_range("2019-12-27 03:00", "2020-03-10 05:40", freq="10min")
+        index = pd.MultiIndex.from_product([times, ["T1", "T2"]], names=["time", "asset_id"])
+        scada = pd.DataFrame(
+            rng.normal(size=(index.size, 4)), index=index, columns=list(SCADA_COLUMNS)
+        )
+        scada.iloc[rng.integers(0, len(scada), 3000), 1] = np.nan
+
+        # Leave a gap of a few days in the data
+        self.scada = scada.drop(index=times[2000:2600], level="time")
+        self.plant = self.scada.groupby(level="time").agg(SCADA_COLUMNS)
+
+    def expected(self, df, start, end, freq, how):
+        if start is not None:
+            df = df.loc[df.index >= start]
+        if end is not None:
+            df = df.loc[df.index <= end]
+        counts = df.resample(freq).count()
+        counts = counts.loc[counts.sum(axis=1) > 0]
+        if how == "count":
+            return counts
+        values = getattr(df.resample(freq), how)()
+        return values.where(df.resample(freq).count() > 0).dropna(how="all")
+
+    def assert_matches(self, pyramid, hows=("mean", "sum", "min", "max", "count")):
+        ranges = [
+            (None, None),
+            (pd.Timestamp("2020-01-03 07:13"), pd.Timestamp("2020-02-20")),
+            (pd.Timestamp("2020-01-01"), pd.Timestamp("2020-02-29 23:50")),
+            (pd.Timestamp("2020-01-10 12:00"), None),
+        ]
+        frequencies = ["10min", "15min", "1h", "D", "7D", "W", "MS"]
+        series = [(None, self.plant), ("T2", self.scada.xs("T2", level="asset_id"))]
+        for start, end in ranges:
+            for freq in frequencies:
+                for how in hows:
+                    for turbine_id, df in series:
+                        with self.subTest(start=start, end=end, freq=freq, how=how):
+                            actual = pyramid.query(turbine_id, start, end, freq, how)
+                            expected = self.expected(df, start, end, freq, how)
+                            nptest.assert_array_equal(actual.index, expected.index)
+                            nptest.assert_allclose(actual.to_numpy(), expected.to_numpy())
+
+    def test_query_matches_resample(self):
+        pyramid = ScadaPyramid(self.scada, "10min")
+        self.assertEqual([level.freqstr for level in pyramid.levels], ["10min", "h", "D", "7D"])
+        self.assertEqual(sorted(pyramid.turbine_ids), ["T1", "T2"])
+        self.assert_matches(pyramid)
+
+    def test_append(self):
+        pyramid = ScadaPyramid(self.scada.iloc[:10000], "10min")
+        pyramid.append(self.scada.iloc[10000:])
+        self.assertEqual(pyramid.end, self.scada.index.get_level_values("time").max())
+        self.assertEqual(pyramid.n_rows, len(self.scada))
+        self.assert_matches(pyramid, hows=("mean", "count"))
+
+        with self.assertRaises(ValueError):
+            pyramid.append(self.scada.iloc[-2:])
+
+    def test_invalid_query(self):
+        pyramid = ScadaPyramid(self.scada, "10min")
+        with self.assertRaises(ValueError):
+            pyramid.query(freq="not a frequency")
+        with self.assertRaises(KeyError):
+            pyramid.query("T3")
+
+        empty = pyramid.query(start=pd.Timestamp("2021-01-01"))
+        self.assertTrue(empty.empty)
+        self.assertEqual(list(empty.columns), list(SCADA_COLUMNS))
@@ -71,6 +71,42 @@ class SimpleTimeseriesTests(unittest.TestCase):
         no_gaps = timeseries.find_time_gaps(empty_series, "10min")
         self.assertEqual(no_gaps.size, 0, "T4: Empty series should have zero gaps")
 
+    def test_find_time_gap_intervals(self):
+        # A full day worth of data has zero gap intervals
+        no_gaps = timeseries.find_time_gap_intervals(self.day_of_data, "10min")
+        self.assertEqual(
+            no_gaps.shape[0], 0, "T1: Something with no gaps was reported to have gaps"
+        )
+
+        # Two consecutive missing timestamps and one isolated one make two intervals
+        missing = self.day_of_data.drop([2, 3, 10])
+        gaps = timeseries.find_time_gap_intervals(missing, "10min")
+        expected = pd.DataFrame({"start": self.day_of_data.iloc[[2, 10]].values, "length": [2, 1]})
+        pd.testing.assert_frame_equal(gaps, expected)
+
+        # Gaps are found per asset, and one asset's timestamps don't fill another asset's gaps
+        df = pd.DataFrame(
+            {
+                "time": np.concatenate([missing.values, self.day_of_data.drop([5]).values]),
+                "asset_id": ["T1"] * missing.size + ["T2"] * (self.day_of_data.size - 1),
+            }
+        ).sample(frac=1, random_state=1)
+        gaps = timeseries.find_time_gap_intervals("time", "10min", "asset_id", data=df)
+        expected = pd.DataFrame(
+            {
+                "asset_id": ["T1", "T2", "T1"],
+                "start": self.day_of_data.iloc[[2, 5, 10]].values,
+                "length": [2, 1, 1],
+            }
+        )
+        pd.testing.assert_frame_equal(gaps, expected)
+
+        # Timezone-aware timestamps maintain their timezone
+        localized = missing.dt.tz_localize("UTC").dt.tz_convert("US/Pacific")
+        gaps = timeseries.find_time_gap_intervals(localized, "10min")
+        self.assertEqual(str(gaps.start.dt.tz), "US/Pacific")
+        self.assertEqual(gaps.start.iloc[0], localized.iloc[1] + pd.Timedelta("10min"))
+
     def test_find_duplicate_times(self):
         # Manually set one row to another and detect it
         day_of_data = self.day_of_data.copy()
@@ -83,6 +119,17 @@ class SimpleTimeseriesTests(unittest.TestCase):
         dupes = timeseries.find_duplicate_times(day_of_data)
         self.assertEqual(dupes.size, 0, "T2: Empty series should have zero duplicates")
 
+        # Timestamps repeated across assets are not duplicates, but those within an asset are
+        df = pd.DataFrame(
+            {
+                "time": pd.concat([self.day_of_data, self.day_of_data.iloc[:3]]).values,
+                "asset_id": ["T1"] * 72 + ["T2"] * 72 + ["T2", "T2", "T1"],
+            }
+        )
+        dupes = timeseries.find_duplicate_times("time", "asset_id", data=df)
+        self.assertEqual(dupes.size, 1, "T3: Detect one duplicated row within an asset")
+        self.assertEqual(dupes.index[0], df.index[-1])
+
     def test_gap_fill_data_frame(self):
         # df with a gap
         day_of_data = self.day_of_data.copy()
@@ -95,6 +142,10 @@ class SimpleTimeseriesTests(unittest.TestCase):
                 filled["time"].size,
                 "T1: Gap filling should increase size of this dataframe",
             )
+        with self.subTest("Check gap filled values"):
+            nptest.assert_array_equal(filled["time"].values, day_of_data.values)
+            self.assertTrue(filled["col1"].iloc[[2, 3]].isna().all())
+            self.assertEqual(filled["col1"].sum(), missing_two.size)
 
         # df with no gaps
         day_of_data = self.day_of_data.copy()
@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy import testing as nptest
+from backend.app.services.wind_rose_cube import WindRoseCube
+
+
+class TestWindRoseCube(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        times = pd.date_range("2019-12-27 03:00", periods=30_000, freq="10min")
+        index = pd.MultiIndex.from_product([times, ["T1", "T2"]], names=["time", "asset_id"])
+
+        # Speeds rounded to the base grid, some just off of it, and some outside of it, along with
+        # directions outside of 0-360 degrees and missing values
+        directions = rng.uniform(-20, 380, index.size)
+        speeds = np.round(rng.gamma(2, 3, index.size) * 2) / 2 * rng.choice([1, 1.01], index.size)
+        directions[100:200] = np.round(directions[100:200])
+        speeds[:50] = -1
+        speeds[50:100] = 45
+        directions[rng.integers(0, index.size, 500)] = np.nan
+        speeds[rng.integers(0, index.size, 500)] = np.nan
+
+        self.scada = pd.DataFrame(
+            {"WMET_HorWdDir": directions, "WMET_HorWdSpd": speeds}, index=index
+        )
+        self.plant = self.scada.groupby(level="time").mean()
+
+    def assert_matches(self, cube):
+        ranges = [
+            (None, None),
+            (pd.Timestamp("2020-01-05 01:10"), pd.Timestamp("2020-04-01")),
+            (pd.Timestamp("2020-02-01"), pd.Timestamp("2020-02-02 05:00")),
+        ]
+        series = [(None, self.plant), ("T1", self.scada.xs("T1", level="asset_id"))]
+        speed_bins = [[0, 3, 6, 9, 12, 15, 25], [0, 0.5, 40], [2.5, 7, 7.5]]
+        for turbine_id, df in series:
+            for start, end in ranges:
+                expected = df
+                if start is not None:
+                    expected = expected.loc[expected.index >= start]
+                if end is not None:
+                    expected = expected.loc[expected.index <= end]
+                expected = expected.dropna()
+                directions = np.mod(expected["WMET_HorWdDir"].to_numpy(), 360)
+                speeds = expected["WMET_HorWdSpd"].to_numpy()
+
+                for direction_bins in (6, 24, 72):
+                    for bins in speed_bins:
+                        direction_edges = np.linspace(0, 360, direction_bins + 1)
+                        speed_edges = np.array(bins, dtype=float)
+                        with self.subTest(start=start, direction_bins=direction_bins, bins=bins):
+                            hist, n_samples = cube.query(
+                                turbine_id, start, end, direction_edges, speed_edges
+                            )
+                            histogram, _, _ = np.histogram2d(
+                                directions, speeds, bins=[direction_edges, speed_edges]
+                            )
+                            nptest.assert_array_equal(hist, histogram)
+                            self.assertEqual(n_samples, len(expected))
+
+    def test_query_matches_histogram2d(self):
+        cube = WindRoseCube(self.scada, checkpoint_size=1_000)
+        self.assertEqual(sorted(cube.turbine_ids), ["T1", "T2"])
+        self.assert_matches(cube)
+
+    def test_append(self):
+        cube = WindRoseCube(self.scada.iloc[:20_000], checkpoint_size=1_000)
+        cube.append(self.scada.iloc[20_000:])
+        self.assertEqual(cube.n_rows, len(self.scada))
+        self.assert_matches(cube)
+
+        with self.assertRaises(ValueError):
+            cube.append(self.scada.iloc[-2:])
+
+    def test_bins_off_the_grid(self):
+        cube = WindRoseCube(self.scada)
+        speed_edges = np.array([0.0, 3.0])
+        with self.assertRaises(ValueError):
+            cube.query(None, None, None, np.linspace(0, 360, 8), speed_edges)
+        with self.assertRaises(ValueError):
+            cube.query(None, None, None, np.linspace(0, 360, 13), np.array([0.0, 3.3]))
+        with self.assertRaises(ValueError):
+            cube.query(None, None, None, np.linspace(0, 360, 13), np.array([0.0, 50.0]))
@@ -0,0 +1,78 @@
+import os
+import unittest
+from unittest import mock
+from dataclasses import replace
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException
+from backend.app.config import settings
+from backend.app.services import worker_pool
+from backend.app.services.plant_loader import get_plant
+
+
+def _plant_name():
+    return os.getpid(), get_plant()["name"]
+
+
+def _not_found():
+    raise HTTPException(status_code=404, detail="Unknown turbine_id: T9")
+
+
+def _crash():
+    os._exit(1)
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.plant = {"name": "plant"}
+        pool_settings = replace(settings, analysis_workers=1, plant_snapshot_path="")
+        patches = (
+            mock.patch.object(worker_pool, "settings", pool_settings),
+            mock.patch.object(worker_pool, "get_plant", side_effect=lambda: self.plant),
+            mock.patch.object(
+                worker_pool, "plant_fingerprint", side_effect=lambda: self.plant["name"]
+            ),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(worker_pool.shutdown_worker_pool)
+
+    def test_run_analysis(self):
+        # The analyses run in the worker processes with the plant data they loaded at startup
+        pid, name = worker_pool.run_analysis(_plant_name)
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual(name, "plant")
+        pool = worker_pool.get_worker_pool()
+        self.assertEqual(worker_pool.run_analysis(_plant_name), (pid, "plant"))
+        self.assertIs(worker_pool.get_worker_pool(), pool)
+
+        # HTTP errors raised by the analyses are raised again in the server process
+        with self.assertRaises(HTTPException) as raised:
+            worker_pool.run_analysis(_not_found)
+        self.assertEqual(raised.exception.status_code, 404)
+        self.assertEqual(raised.exception.detail, "Unknown turbine_id: T9")
+
+        # Reloading the plant data replaces the workers
+        snapshot_path = worker_pool._snapshot_path
+        self.plant = {"name": "reloaded"}
+        new_pid, name = worker_pool.run_analysis(_plant_name)
+        self.assertEqual(name, "reloaded")
+        self.assertNotEqual(new_pid, pid)
+        self.assertIsNot(worker_pool.get_worker_pool(), pool)
+        self.assertFalse(snapshot_path.exists())
+
+    def test_broken_pool(self):
+        # A worker that dies breaks the pool, which is replaced for the next analysis
+        with self.assertRaises(BrokenProcessPool):
+            worker_pool.run_analysis(_crash)
+        self.assertIsNone(worker_pool._pool)
+        self.assertEqual(worker_pool.run_analysis(_plant_name)[1], "plant")
+
+    def test_without_workers(self):
+        with (
+            mock.patch.object(worker_pool, "settings", replace(settings, analysis_workers=0)),
+            mock.patch("backend.app.services.plant_loader._plant", self.plant),
+        ):
+            self.assertEqual(worker_pool.run_analysis(_plant_name), (os.getpid(), "plant"))
+        self.assertIsNone(worker_pool._pool)